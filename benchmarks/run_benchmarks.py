@@ -0,0 +1,423 @@
+"""
+Benchmarks for the jobflow hot paths.
+
+Each benchmark builds a synthetic workload, times its construction and execution and
+reports the throughput and the number of store operations (measured with an
+InstrumentedJobStore). Benchmarks are run using in-memory stores by default, or a
+SQLite file with ``--store sqlite``. Note that the in-memory store scans the whole
+collection on every write, so store throughput benchmarks should also be checked with
+SQLite.
+
+Each benchmark is run once untimed to warm up (imports, caches, etc.) and then
+``--repeats`` times, and the run with the median run time is reported. The jobs/s
+column is only given for benchmarks that run jobs.
+
+Peak memory is measured using tracemalloc if ``--memory`` is given. Tracing slows down
+execution considerably, so times from runs with and without ``--memory`` should not be
+compared.
+
+Usage::
+
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --scale 5 --only fan_out chain
+    python benchmarks/run_benchmarks.py --repeats 9 --only graph
+    python benchmarks/run_benchmarks.py --store sqlite --json results.json
+
+Results from different commits should be compared on the same machine.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from maggma.stores import MemoryStore
+
+from jobflow import Flow, Maker, job, run_locally
+from jobflow.core.reference import find_and_resolve_references
+from jobflow.stores import InstrumentedJobStore, SQLiteStore
+
+
+@job
+def add(a, b):
+    """Add two numbers."""
+    return a + b
+
+
+@job
+def gather(values):
+    """Sum a list of values."""
+    return sum(values)
+
+
+@job(data=True)
+def make_array(size):
+    """Make a large output that is saved in the "data" store."""
+    return list(range(size))
+
+
+@job
+def array_sum(values):
+    """Sum a large input."""
+    return sum(values)
+
+
+@dataclass
+class InnerMaker(Maker):
+    """A maker with settings and no nested makers."""
+
+    name: str = "inner"
+    settings: dict = field(default_factory=lambda: {"a": 1, "b": {"c": 2}})
+
+    @job
+    def make(self, a):
+        """Make a job."""
+        return a + self.settings["a"]
+
+
+@dataclass
+class OuterMaker(Maker):
+    """A maker containing another maker."""
+
+    name: str = "outer"
+    settings: dict = field(default_factory=lambda: {"a": 1, "b": {"c": 2}})
+    maker: Maker = field(default_factory=InnerMaker)
+
+    def make(self, a):
+        """Make a flow."""
+        return Flow([self.maker.make(a)])
+
+
+MEASURE_MEMORY = False
+
+
+@contextmanager
+def measure():
+    """Measure the time (in seconds) and peak memory (in MB) of a block of code."""
+    measurement = {}
+    if MEASURE_MEMORY:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        yield measurement
+    finally:
+        measurement["time"] = time.perf_counter() - start
+        measurement["memory"] = float("nan")
+        if MEASURE_MEMORY:
+            measurement["memory"] = tracemalloc.get_traced_memory()[1] / 1e6
+            tracemalloc.stop()
+
+
+@dataclass
+class Result:
+    """The result of a benchmark."""
+
+    name: str
+    jobs: int
+    construct_time: float
+    run_time: float
+    peak_memory_mb: float
+    store_queries: int = 0
+    store_writes: int = 0
+    blob_fetches: int = 0
+    extra: dict = field(default_factory=dict)
+
+    @property
+    def jobs_per_sec(self) -> float | None:
+        """Number of jobs run per second, or None if no jobs were run."""
+        if not self.jobs:
+            return None
+        return self.jobs / self.run_time if self.run_time else float("nan")
+
+
+def run_benchmark(benchmark, repeats: int, *args) -> Result:
+    """Run a benchmark once to warm up, then return the median of several runs."""
+    benchmark(*args)
+    results = sorted(
+        (benchmark(*args) for _ in range(repeats)), key=lambda r: r.run_time
+    )
+    result = results[(len(results) - 1) // 2]
+    result.extra["run_times"] = [r.run_time for r in results]
+    return result
+
+
+def make_store(kind: str, tmp_dir: Path) -> InstrumentedJobStore:
+    """Create an instrumented job store with a "data" additional store."""
+    if kind == "sqlite":
+        docs_store = SQLiteStore(tmp_dir / "jobflow.db", f"docs_{time.time_ns()}")
+        data_store = SQLiteStore(tmp_dir / "jobflow.db", f"data_{time.time_ns()}")
+        data_store.key = "blob_uuid"
+    else:
+        docs_store, data_store = MemoryStore(), MemoryStore()
+    return InstrumentedJobStore(docs_store, additional_stores={"data": data_store})
+
+
+def run_flow_benchmark(name, build, store_kind, tmp_dir, **run_kwargs) -> Result:
+    """Time the construction and local execution of a flow."""
+    store = make_store(store_kind, tmp_dir)
+
+    with measure() as measured:
+        start = time.perf_counter()
+        flow = build()
+        construct_time = time.perf_counter() - start
+        responses = run_locally(flow, store=store, log=False, **run_kwargs)
+    run_time = measured["time"] - construct_time
+
+    stats = store.stats
+    return Result(
+        name=name,
+        jobs=sum(len(r) for r in responses.values()),
+        construct_time=construct_time,
+        run_time=run_time,
+        peak_memory_mb=measured["memory"],
+        store_queries=stats.queries,
+        store_writes=stats.operations["update"].calls,
+        blob_fetches=stats.blob_fetches,
+    )
+
+
+def fan_out(scale, store_kind, tmp_dir):
+    """Run one job feeding many independent jobs that are gathered at the end."""
+    n = 50 * scale
+
+    def build():
+        source = add(1, 2)
+        children = [add(source.output, i) for i in range(n)]
+        total = gather([c.output for c in children])
+        return Flow([source, *children, total])
+
+    return run_flow_benchmark("fan_out", build, store_kind, tmp_dir)
+
+
+def chain(scale, store_kind, tmp_dir):
+    """Run a deep linear chain where every job depends on the previous one."""
+    n = 50 * scale
+
+    def build():
+        jobs = [add(0, 1)]
+        for _ in range(n - 1):
+            jobs.append(add(jobs[-1].output, 1))
+        return Flow(jobs)
+
+    return run_flow_benchmark("chain", build, store_kind, tmp_dir)
+
+
+def nested(scale, store_kind, tmp_dir):
+    """Run flows nested several levels deep."""
+    width, depth = 4, 3 + scale // 5
+
+    def build_level(level):
+        if level == 0:
+            return add(1, 1)
+        return Flow([build_level(level - 1) for _ in range(width)])
+
+    return run_flow_benchmark("nested", lambda: build_level(depth), store_kind, tmp_dir)
+
+
+def large_outputs(scale, store_kind, tmp_dir):
+    """Run jobs with large outputs stored in an additional store and read back."""
+    n, size = 5 * scale, 20_000
+
+    def build():
+        jobs = []
+        for _ in range(n):
+            array_job = make_array(size)
+            jobs.extend([array_job, array_sum(array_job.output)])
+        return Flow(jobs)
+
+    return run_flow_benchmark("large_outputs", build, store_kind, tmp_dir)
+
+
+def graph(scale, store_kind, tmp_dir):
+    """Build the graph of a wide flow."""
+    n = 200 * scale
+    source = add(1, 2)
+    flow = Flow([source] + [add(source.output, i) for i in range(n)])
+
+    with measure() as measured:
+        flow_graph = flow.graph
+    run_time = measured["time"]
+
+    return Result(
+        name="graph",
+        jobs=0,
+        construct_time=0.0,
+        run_time=run_time,
+        peak_memory_mb=measured["memory"],
+        extra={"nodes": n + 1, "edges": len(flow_graph.edges)},
+    )
+
+
+def resolve_references(scale, store_kind, tmp_dir):
+    """Resolve many references nested inside a large argument."""
+    n = 100 * scale
+    store = make_store(store_kind, tmp_dir)
+    store.connect()
+    sources = [add(1, i) for i in range(n)]
+    store.update(
+        [
+            {"uuid": j.uuid, "index": 1, "output": {"a": [i]}}
+            for i, j in enumerate(sources)
+        ]
+    )
+    arg = {"inputs": [{"value": j.output["a"][0]} for j in sources]}
+    store.reset_stats()
+
+    with measure() as measured:
+        find_and_resolve_references(arg, store)
+    run_time = measured["time"]
+
+    return Result(
+        name="resolve_references",
+        jobs=0,
+        construct_time=0.0,
+        run_time=run_time,
+        peak_memory_mb=measured["memory"],
+        store_queries=store.stats.queries,
+        blob_fetches=store.stats.blob_fetches,
+        extra={"references": n},
+    )
+
+
+def store_update(scale, store_kind, tmp_dir):
+    """Write many job documents, with part of the output saved to a data store."""
+    n = 200 * scale
+    store = make_store(store_kind, tmp_dir)
+    store.connect()
+    docs = [
+        {"uuid": str(i), "index": 1, "output": {"data": list(range(100)), "x": i}}
+        for i in range(n)
+    ]
+
+    with measure() as measured:
+        for i in range(0, n, 100):
+            store.update(docs[i : i + 100], save={"data": "data"})
+    run_time = measured["time"]
+
+    return Result(
+        name="store_update",
+        jobs=0,
+        construct_time=0.0,
+        run_time=run_time,
+        peak_memory_mb=measured["memory"],
+        store_writes=store.stats.operations["update"].calls,
+        extra={"documents": n, "bytes_written": store.stats.bytes_written},
+    )
+
+
+def maker_update_kwargs(scale, store_kind, tmp_dir):
+    """Update the settings of deeply nested makers."""
+    depth, repeats = 10, 20 * scale
+
+    def build():
+        maker = InnerMaker()
+        for _ in range(depth):
+            maker = OuterMaker(maker=maker)
+        return maker
+
+    start = time.perf_counter()
+    maker = build()
+    construct_time = time.perf_counter() - start
+
+    with measure() as measured:
+        for i in range(repeats):
+            maker = maker.update_kwargs({"settings": {"a": i}}, class_filter=InnerMaker)
+            maker = maker.update_kwargs(
+                {"_set": {"settings->b->c": i}}, name_filter="outer", dict_mod=True
+            )
+    run_time = measured["time"]
+
+    return Result(
+        name="maker_update_kwargs",
+        jobs=0,
+        construct_time=construct_time,
+        run_time=run_time,
+        peak_memory_mb=measured["memory"],
+        extra={"updates_per_sec": 2 * repeats / run_time},
+    )
+
+
+BENCHMARKS = {
+    "fan_out": fan_out,
+    "chain": chain,
+    "nested": nested,
+    "large_outputs": large_outputs,
+    "graph": graph,
+    "resolve_references": resolve_references,
+    "store_update": store_update,
+    "maker_update_kwargs": maker_update_kwargs,
+}
+
+
+def print_results(results: list[Result]):
+    """Print the results as a table."""
+    header = (
+        f"{'benchmark':<22}{'jobs':>7}{'build (s)':>11}{'run (s)':>10}"
+        f"{'jobs/s':>10}{'mem (MB)':>10}{'queries':>9}{'writes':>8}{'blobs':>7}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        jobs_per_sec = "-" if r.jobs_per_sec is None else f"{r.jobs_per_sec:.1f}"
+        print(
+            f"{r.name:<22}{r.jobs:>7}{r.construct_time:>11.3f}{r.run_time:>10.3f}"
+            f"{jobs_per_sec:>10}{r.peak_memory_mb:>10.1f}{r.store_queries:>9}"
+            f"{r.store_writes:>8}{r.blob_fetches:>7}"
+        )
+
+
+def main(argv=None):
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--scale", type=int, default=1, help="Multiplier for the workload sizes."
+    )
+    parser.add_argument(
+        "--only", nargs="+", choices=list(BENCHMARKS), help="Benchmarks to run."
+    )
+    parser.add_argument(
+        "--store", choices=["memory", "sqlite"], default="memory", help="Store type."
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=3,
+        help="Number of timed runs of each benchmark, after a warm-up run.",
+    )
+    parser.add_argument(
+        "--memory", action="store_true", help="Measure peak memory with tracemalloc."
+    )
+    parser.add_argument("--json", type=Path, help="File to write the results to.")
+    args = parser.parse_args(argv)
+
+    global MEASURE_MEMORY
+    MEASURE_MEMORY = args.memory
+
+    logging.getLogger("jobflow").setLevel(logging.WARNING)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name in args.only or BENCHMARKS:
+            benchmark = BENCHMARKS[name]
+            result = run_benchmark(
+                benchmark, args.repeats, args.scale, args.store, Path(tmp_dir)
+            )
+            results.append(result)
+
+    print_results(results)
+
+    if args.json:
+        data = [{**asdict(r), "jobs_per_sec": r.jobs_per_sec} for r in results]
+        args.json.write_text(json.dumps(data, indent=2))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
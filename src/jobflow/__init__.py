@@ -1,5 +1,7 @@
 """Jobflow is a package for writing dynamic and connected workflows."""
 
+import threading
+
 from jobflow._version import __version__
 from jobflow.core.flow import Flow, JobOrder
 from jobflow.core.job import Job, JobConfig, Response, job
@@ -11,4 +13,22 @@ from jobflow.managers.local import run_locally
 from jobflow.settings import JobflowSettings
 from jobflow.utils.log import initialize_logger
 
-SETTINGS = JobflowSettings()
+_SETTINGS_LOCK = threading.Lock()
+
+
+def __getattr__(name):
+    """
+    Create the jobflow settings on first access.
+
+    Loading the settings reads the config file and may connect to the job store, so
+    ``jobflow.SETTINGS`` is only created when it is first used rather than on import.
+    """
+    if name == "SETTINGS":
+        global SETTINGS
+
+        with _SETTINGS_LOCK:
+            if "SETTINGS" not in globals():
+                SETTINGS = JobflowSettings()
+        return SETTINGS
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,3 +1,3 @@
 """Core jobflow interface."""
 
-from jobflow.core import flow, job, maker, reference, state, store
+from jobflow.core import flow, hooks, job, maker, reference, state, store
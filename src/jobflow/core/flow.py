@@ -17,6 +17,7 @@ if typing.TYPE_CHECKING:
     from networkx import DiGraph
 
     import jobflow
+    from jobflow.utils.dict_mods import CompiledMod
 
 __all__ = ["JobOrder", "Flow", "get_flow"]
 
@@ -182,8 +183,10 @@ class Flow(MSONable):
             The output of the flow. These should come from the output of one
             or more of the jobs.
         """
+        from jobflow.settings import _get_setting
+
         if output is not None:
-            if contains_flow_or_job(output):
+            if _get_setting("CHECK_FLOW_OR_JOB") and contains_flow_or_job(output):
                 warnings.warn(
                     f"Flow '{self.name}' contains a Flow or Job as an output. "
                     f"Usually the Flow output should be the output of a Job or "
@@ -335,7 +338,7 @@ class Flow(MSONable):
 
     def update_kwargs(
         self,
-        update: dict[str, Any],
+        update: dict[str, Any] | CompiledMod,
         name_filter: str | None = None,
         function_filter: Callable | None = None,
         dict_mod: bool = False,
@@ -348,7 +351,8 @@ class Flow(MSONable):
         Parameters
         ----------
         update
-            The updates to apply.
+            The updates to apply. A dict mod compiled using :obj:`.compile_mod` is
+            always applied as a dict mod.
         name_filter
             A filter for the job name. Only jobs with a matching name will be updated.
             Includes partial matches, e.g. "ad" will match a job with the name "adder".
@@ -381,9 +385,14 @@ class Flow(MSONable):
         >>> flow.update_kwargs({"number": 10}, name_filter="add")
         >>> flow.update_kwargs({"number": 10}, function_filter=add)
         """
+        from jobflow.utils.dict_mods import compile_mod
+
+        # parse the update once rather than for every job
+        mod = compile_mod(update) if dict_mod else update
+
         for job in self.jobs:
             job.update_kwargs(
-                update,
+                mod,
                 name_filter=name_filter,
                 function_filter=function_filter,
                 dict_mod=dict_mod,
@@ -391,7 +400,7 @@ class Flow(MSONable):
 
     def update_maker_kwargs(
         self,
-        update: dict[str, Any],
+        update: dict[str, Any] | CompiledMod,
         name_filter: str | None = None,
         class_filter: type[jobflow.Maker] | None = None,
         nested: bool = True,
@@ -405,7 +414,8 @@ class Flow(MSONable):
         Parameters
         ----------
         update
-            The updates to apply.
+            The updates to apply. A dict mod compiled using :obj:`.compile_mod` is
+            always applied as a dict mod.
         name_filter
             A filter for the Maker name. Only Makers with a matching name will be
             updated. Includes partial matches, e.g. "ad" will match a Maker with the
@@ -480,9 +490,14 @@ class Flow(MSONable):
         ...     {"number": 10}, class_filter=AddMaker, nested=False
         ... )
         """
+        from jobflow.utils.dict_mods import compile_mod
+
+        # parse the update once rather than for every job
+        mod = compile_mod(update) if dict_mod else update
+
         for job in self.jobs:
             job.update_maker_kwargs(
-                update,
+                mod,
                 name_filter=name_filter,
                 class_filter=class_filter,
                 nested=nested,
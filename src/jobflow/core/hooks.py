@@ -0,0 +1,143 @@
+"""
+Hooks called around the job lifecycle.
+
+Hooks are functions registered using :obj:`register_hook` that get called with keyword
+arguments at fixed points while jobs are run. They can be used to attach profilers,
+tracing spans or metrics exporters. If no hooks are registered for an event, calling it
+costs a single dictionary lookup.
+
+The following events are available, all durations are given in seconds:
+
+- ``on_run_start``: A manager has started running a flow or job. Called with
+  ``manager`` (``"local"`` or ``"fireworks"``), ``flow`` and ``store``.
+- ``on_run_end``: A manager has finished running. Called with ``manager``, ``flow``,
+  ``store`` and ``duration``.
+- ``on_job_start``: A job has started. Called with ``job`` and ``store``.
+- ``on_resolve_done``: The references in the inputs of a job have been resolved. Called
+  with ``job``, ``store`` and ``duration``.
+- ``on_store_write``: Documents have been written to a :obj:`.JobStore`. Called with
+  ``store``, ``docs`` and ``duration``.
+- ``on_job_end``: A job has finished. Called with ``job``, ``store``, ``response``,
+  ``stats`` (see :obj:`.Job.run`) and ``error``. If the job failed, ``response``
+  and ``stats`` are None and ``error`` is the exception raised.
+
+Exceptions raised by hooks are logged and do not stop the job.
+"""
+
+from __future__ import annotations
+
+import logging
+import typing
+
+if typing.TYPE_CHECKING:
+    from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "HOOK_EVENTS",
+    "register_hook",
+    "unregister_hook",
+    "clear_hooks",
+    "call_hooks",
+]
+
+HOOK_EVENTS = (
+    "on_run_start",
+    "on_run_end",
+    "on_job_start",
+    "on_resolve_done",
+    "on_store_write",
+    "on_job_end",
+)
+
+_HOOKS: dict[str, list[Callable]] = {event: [] for event in HOOK_EVENTS}
+
+
+def register_hook(event: str, hook: Callable | None = None):
+    """
+    Register a hook to be called for an event.
+
+    Can also be used as a decorator, e.g.:
+
+    .. code-block:: python
+
+        @register_hook("on_job_end")
+        def log_function_time(job, stats, **kwargs):
+            if stats is not None:
+                print(job.name, stats["function_time"])
+
+    Hooks should accept ``**kwargs`` so that they keep working if additional arguments
+    are added in the future.
+
+    Parameters
+    ----------
+    event
+        The name of the event. See :obj:`HOOK_EVENTS` for the available events.
+    hook
+        The function to call. If None, a decorator is returned.
+
+    Returns
+    -------
+    Callable
+        The hook, or a decorator if ``hook`` is None.
+    """
+    if event not in _HOOKS:
+        raise ValueError(f"Unrecognised hook event: {event}")
+
+    def decorator(func: Callable) -> Callable:
+        _HOOKS[event].append(func)
+        return func
+
+    return decorator if hook is None else decorator(hook)
+
+
+def unregister_hook(event: str, hook: Callable):
+    """
+    Remove a registered hook.
+
+    Parameters
+    ----------
+    event
+        The name of the event.
+    hook
+        The function to remove.
+    """
+    if event not in _HOOKS:
+        raise ValueError(f"Unrecognised hook event: {event}")
+    _HOOKS[event].remove(hook)
+
+
+def clear_hooks(event: str | None = None):
+    """
+    Remove all hooks registered for an event.
+
+    Parameters
+    ----------
+    event
+        The name of the event. If None, the hooks for all events are removed.
+    """
+    for name in HOOK_EVENTS if event is None else [event]:
+        _HOOKS[name].clear()
+
+
+def call_hooks(event: str, **kwargs):
+    """
+    Call the hooks registered for an event.
+
+    Parameters
+    ----------
+    event
+        The name of the event.
+    **kwargs
+        The arguments to pass to each hook.
+    """
+    hooks = _HOOKS[event]
+    if not hooks:
+        return
+
+    for hook in list(hooks):
+        try:
+            hook(**kwargs)
+        except Exception:
+            logger.exception(f"Hook {hook!r} for {event} failed")
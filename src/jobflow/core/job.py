@@ -13,16 +13,17 @@ from jobflow.core.reference import OnMissing, OutputReference
 from jobflow.utils.uuid import suuid
 
 if typing.TYPE_CHECKING:
-    from typing import Any, Callable, Hashable
+    from typing import Any, Callable, Hashable, Iterator, Sequence
 
     from networkx import DiGraph
     from pydantic import BaseModel
 
     import jobflow
+    from jobflow.utils.dict_mods import CompiledMod
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["job", "Job", "Response", "JobConfig", "store_inputs"]
+__all__ = ["job", "Job", "Response", "JobConfig", "store_inputs", "run_batch"]
 
 
 @dataclass
@@ -51,6 +52,13 @@ class JobConfig(MSONable):
         Using this kwarg will automatically take precedence over the behavior of
         ``pass_manager_config`` such that a different configuration than
         ``manger_config`` can be passed to downstream jobs.
+    lazy_blobs
+        Whether data saved in additional stores should be passed to the job as
+        :obj:`.LazyBlob` proxies when resolving references. The data is then only
+        loaded if the job accesses it.
+    record_bytes
+        Whether to record the number of bytes written to each additional store in the
+        job stats (``store_bytes``). This requires encoding the data an extra time.
 
     Returns
     -------
@@ -64,6 +72,8 @@ class JobConfig(MSONable):
     expose_store: bool = False
     pass_manager_config: bool = True
     response_manager_config: dict = field(default_factory=dict)
+    lazy_blobs: bool = False
+    record_bytes: bool = False
 
 
 def job(method: Callable | None = None, **job_kwargs):
@@ -160,14 +170,29 @@ def job(method: Callable | None = None, **job_kwargs):
         the required store names present. See the :obj:`.JobStore` docstring for more
         details.
 
+    Many jobs can be created from the same function in one call using ``map``. Each
+    positional and keyword argument should be a sequence, with one entry per job.
+    The jobs are returned in a :obj:`.Flow` whose output is the list of job outputs.
+
+    >>> @job
+    ... def add(a, b):
+    ...     return a + b
+    >>> add_flow = add.map([1, 2, 3], b=[4, 5, 6])
+    >>> len(add_flow.jobs)
+    3
+    >>> add_flow.output
+    [OutputReference(...), OutputReference(...), OutputReference(...)]
+
+    The mapped jobs share a single copy of the function and job config. If the function
+    is a :obj:`.Maker` method, e.g., ``maker.make.map([1, 2, 3])``, each job gets its
+    own copy of the maker.
+
     See Also
     --------
     Job, .Flow, .Response
     """
 
     def decorator(func):
-        from functools import wraps
-
         # unwrap staticmethod or classmethod decorators
         desc = next(
             (desc for desc in (staticmethod, classmethod) if isinstance(func, desc)),
@@ -177,31 +202,7 @@ def job(method: Callable | None = None, **job_kwargs):
         if desc:
             func = func.__func__
 
-        @wraps(func)
-        def get_job(*args, **kwargs) -> Job:
-
-            f = func
-            if len(args) > 0:
-                # see if the first argument has a function with the same name as
-                # this function
-                met = getattr(args[0], func.__name__, None)
-                if met:
-                    # if so, check to see if that function ha been wrapped and
-                    # whether the unwrapped function is the same as this function
-                    wrap = getattr(met, "__func__", None)
-                    if getattr(wrap, "original", None) is func:
-                        # Ah ha. The function is a bound method.
-                        f = met
-                        args = args[1:]
-
-            return Job(
-                function=f,
-                function_args=args,
-                function_kwargs=kwargs,
-                **job_kwargs,
-            )
-
-        get_job.original = func
+        get_job = _JobFunction(func, job_kwargs)
 
         if desc:
             # rewrap staticmethod or classmethod decorators
@@ -218,6 +219,217 @@ def job(method: Callable | None = None, **job_kwargs):
     return decorator(method)
 
 
+def _get_bound_function(func: Callable, args: tuple) -> tuple[Callable, tuple]:
+    """Bind a decorated function to its instance if it has been called as a method."""
+    if len(args) > 0:
+        # see if the first argument has a function with the same name as
+        # this function
+        met = getattr(args[0], func.__name__, None)
+        if met:
+            # if so, check to see if that function ha been wrapped and
+            # whether the unwrapped function is the same as this function
+            wrap = getattr(met, "__func__", None)
+            if getattr(wrap, "original", None) is func:
+                # Ah ha. The function is a bound method.
+                return met, args[1:]
+    return func, args
+
+
+class _JobFunction:
+    """
+    A function decorated with :obj:`job`.
+
+    Calling the object creates a :obj:`Job`, and ``map`` creates many jobs at once.
+    Like a function, the object binds to instances when accessed as a method, so that
+    both ``maker.make(...)`` and ``maker.make.map(...)`` create jobs for the maker.
+
+    Parameters
+    ----------
+    func
+        The undecorated function.
+    job_kwargs
+        Keyword arguments passed to the :obj:`Job` init method.
+    """
+
+    def __init__(self, func: Callable, job_kwargs: dict[str, Any]):
+        from functools import update_wrapper
+
+        update_wrapper(self, func)
+        self.original = func
+        self.job_kwargs = job_kwargs
+
+    def __call__(self, *args, **kwargs) -> Job:
+        """Create a job that will call the function."""
+        f, args = _get_bound_function(self.original, args)
+
+        return Job(
+            function=f,
+            function_args=args,
+            function_kwargs=kwargs,
+            **self.job_kwargs,
+        )
+
+    def map(self, *args, **kwargs) -> jobflow.Flow:
+        """Create a job for each entry in the argument sequences. See :obj:`job`."""
+        f, args = _get_bound_function(self.original, args)
+        return _map_jobs(f, args, kwargs, **self.job_kwargs)
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        """Bind the function to an instance."""
+        if instance is None:
+            return self
+        return _BoundJobFunction(self, instance)
+
+    def __copy__(self) -> _JobFunction:
+        # like functions, decorated functions are not copied
+        return self
+
+    def __deepcopy__(self, memo: dict) -> _JobFunction:
+        return self
+
+
+class _BoundJobFunction:
+    """A :obj:`_JobFunction` bound to an instance, equivalent to a bound method."""
+
+    def __init__(self, func: _JobFunction, instance: Any):
+        self.__func__ = func
+        self.__self__ = instance
+        self.__module__ = func.__module__
+        self.__name__ = func.original.__name__
+        self.__qualname__ = func.original.__qualname__
+        self.__doc__ = func.__doc__
+
+    def __call__(self, *args, **kwargs) -> Job:
+        """Create a job that will call the method."""
+        return self.__func__(self.__self__, *args, **kwargs)
+
+    def map(self, *args, **kwargs) -> jobflow.Flow:
+        """Create a job for each entry in the argument sequences. See :obj:`job`."""
+        return self.__func__.map(self.__self__, *args, **kwargs)
+
+    def __copy__(self) -> _BoundJobFunction:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> _BoundJobFunction:
+        # like bound methods, only the instance is copied
+        from copy import deepcopy
+
+        return _BoundJobFunction(self.__func__, deepcopy(self.__self__, memo))
+
+    def __getattr__(self, name: str) -> Any:
+        # forward other attributes (e.g., original) to the function; __dict__ is used
+        # directly as __func__ is not set while the object is being copied
+        func = self.__dict__.get("__func__")
+        if func is None:
+            raise AttributeError(name)
+        return getattr(func, name)
+
+    def __eq__(self, other: object) -> bool:
+        """Check whether two bound functions have the same function and instance."""
+        if not isinstance(other, _BoundJobFunction):
+            return NotImplemented
+        return self.__func__ is other.__func__ and self.__self__ is other.__self__
+
+    def __hash__(self) -> int:
+        """Get the hash of the bound function."""
+        return hash((self.__func__, id(self.__self__)))
+
+    def __repr__(self) -> str:
+        """Get a string representation of the bound function."""
+        return f"<bound job function {self.__qualname__} of {self.__self__!r}>"
+
+
+def _map_jobs(
+    function: Callable,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    **job_kwargs,
+) -> jobflow.Flow:
+    """
+    Create a job for each entry in column-oriented function arguments.
+
+    A single template job is created and copied for every set of arguments. This
+    means the function, name and config are only processed once and are shared by all
+    jobs. Bound Makers are copied for each job, as the job name is stored on the maker.
+
+    Parameters
+    ----------
+    function
+        The function (or bound method) to run.
+    args
+        The positional arguments, given as one sequence per argument.
+    kwargs
+        The keyword arguments, given as one sequence per argument.
+    **job_kwargs
+        Other keyword arguments that will get passed to the :obj:`Job` init method.
+
+    Returns
+    -------
+    Flow
+        A flow containing the jobs, with the list of job outputs as the flow output.
+    """
+    from copy import deepcopy
+
+    from jobflow.core.flow import Flow
+    from jobflow.settings import _get_setting
+    from jobflow.utils.find import contains_flow_or_job
+
+    columns = tuple(args) + tuple(kwargs.values())
+    if len(columns) == 0:
+        raise ValueError("At least one argument sequence must be given to map.")
+
+    try:
+        lengths = {len(column) for column in columns}
+    except TypeError as err:
+        raise ValueError("All arguments given to map must be sequences.") from err
+
+    if len(lengths) != 1:
+        raise ValueError("All arguments given to map must have the same length.")
+
+    template = Job(function=function, **job_kwargs)
+
+    # check to see if job or flow is included in the job args; this only needs to be
+    # done once for all the mapped jobs
+    if _get_setting("CHECK_FLOW_OR_JOB") and contains_flow_or_job(columns):
+        warnings.warn(
+            f"Job '{template.name}' contains an Flow or Job as an input. "
+            f"Usually inputs should be the output of a Job or an Flow (e.g. "
+            f"job.output). If this message is unexpected then double check the "
+            f"inputs to your Job."
+        )
+
+    njobs = lengths.pop()
+    arg_rows = zip(*args) if args else [()] * njobs
+    kwarg_rows = zip(*kwargs.values()) if kwargs else [()] * njobs
+    kwarg_names = tuple(kwargs.keys())
+
+    jobs = []
+    for job_args, kwarg_values in zip(arg_rows, kwarg_rows):
+        uuid = suuid()
+        new_job = object.__new__(template.__class__)
+        new_job.__dict__.update(template.__dict__)
+        new_job.__dict__.update(
+            function_args=job_args,
+            function_kwargs=dict(zip(kwarg_names, kwarg_values)),
+            uuid=uuid,
+            metadata=dict(template.metadata),
+            hosts=[],
+            metadata_updates=[],
+            config_updates=[],
+            output=OutputReference(uuid, output_schema=template.output_schema),
+        )
+        if template.maker is not None:
+            # renaming a job renames its maker, so the makers cannot be shared
+            new_job.function = deepcopy(template.function)
+        jobs.append(new_job)
+
+    flow = Flow(jobs, name=template.name)
+    # the output only contains references to the jobs in the flow, so the checks in
+    # the Flow.output setter can be skipped
+    flow._output = [j.output for j in jobs]
+    return flow
+
+
 class Job(MSONable):
     """
     A :obj:`Job` is a delayed function call that can be used in an :obj:`.Flow`.
@@ -304,6 +516,9 @@ class Job(MSONable):
     job, Response, .Flow
     """
 
+    _config: JobConfig | None
+    output: OutputReference
+
     def __init__(
         self,
         function: Callable,
@@ -322,13 +537,13 @@ class Job(MSONable):
     ):
         from copy import deepcopy
 
+        from jobflow.settings import _get_setting
         from jobflow.utils.find import contains_flow_or_job
 
         function_args = () if function_args is None else function_args
         function_kwargs = {} if function_kwargs is None else function_kwargs
         uuid = suuid() if uuid is None else uuid
         metadata = {} if metadata is None else metadata
-        config = JobConfig() if config is None else config
 
         # make a deep copy of the function (means makers do not share the same instance)
         self.function = deepcopy(function)
@@ -359,7 +574,7 @@ class Job(MSONable):
         # check to see if job or flow is included in the job args
         # this is a possible situation but likely a mistake
         all_args = tuple(self.function_args) + tuple(self.function_kwargs.values())
-        if contains_flow_or_job(all_args):
+        if _get_setting("CHECK_FLOW_OR_JOB") and contains_flow_or_job(all_args):
             warnings.warn(
                 f"Job '{self.name}' contains an Flow or Job as an input. "
                 f"Usually inputs should be the output of a Job or an Flow (e.g. "
@@ -367,6 +582,35 @@ class Job(MSONable):
                 f"inputs to your Job."
             )
 
+    @property
+    def config(self) -> JobConfig:
+        """
+        Get the config settings for the job.
+
+        If no config was given, a default :obj:`JobConfig` is only created when it is
+        first accessed.
+
+        Returns
+        -------
+        JobConfig
+            The job config.
+        """
+        if self._config is None:
+            self._config = JobConfig()
+        return self._config
+
+    @config.setter
+    def config(self, config: JobConfig | None):
+        """
+        Set the config settings for the job.
+
+        Parameters
+        ----------
+        config
+            The job config. If ``None``, the default config will be used.
+        """
+        self._config = config
+
     @property
     def input_references(self) -> tuple[jobflow.OutputReference, ...]:
         """
@@ -487,7 +731,9 @@ class Job(MSONable):
         self.uuid = uuid
         self.output = self.output.set_uuid(uuid)
 
-    def run(self, store: jobflow.JobStore) -> Response:
+    def run(
+        self, store: jobflow.JobStore, cache: dict[str, Any] | None = None
+    ) -> Response:
         """
         Run the job.
 
@@ -495,10 +741,21 @@ class Job(MSONable):
         need to be resolved before the job can run. See the docstring for
         :obj:`.OutputReference.resolve()` for more details.
 
+        The ``stats`` field of the output document records the time in seconds spent
+        resolving references (``resolve_time``), running the function
+        (``function_time``), serializing the output (``serialize_time``) and writing to
+        the additional stores (``store_time``), along with the CPU time of the job
+        (``cpu_time``) and the peak resident set size of the process in bytes
+        (``peak_rss``). The number of bytes written to each additional store
+        (``store_bytes``) is also recorded if ``JobConfig.record_bytes`` is set.
+
         Parameters
         ----------
         store
             A :obj:`.JobStore` to use for resolving references and storing job outputs.
+        cache
+            A dictionary cache to use for resolving references. This can be shared
+            between jobs to avoid querying the store for the same outputs.
 
         Returns
         -------
@@ -515,22 +772,87 @@ class Job(MSONable):
         --------
         Response, .OutputReference
         """
+        from jobflow import CURRENT_JOB
+        from jobflow.core.hooks import call_hooks
+
+        index_str = f", {self.index}" if self.index != 1 else ""
+        logger.info(f"Starting job - {self.name} ({self.uuid}{index_str})")
+
+        try:
+            response, data = self._execute(store, cache=cache)
+            store.update(
+                data,
+                key=["uuid", "index"],
+                save=self._save,
+                stats_key="stats",
+                record_bytes=self.config.record_bytes,
+                sanitized=True,
+            )
+        except Exception as err:
+            call_hooks(
+                "on_job_end",
+                job=self,
+                store=store,
+                response=None,
+                stats=None,
+                error=err,
+            )
+            raise
+
+        CURRENT_JOB.reset()
+        logger.info(f"Finished job - {self.name} ({self.uuid}{index_str})")
+        call_hooks(
+            "on_job_end",
+            job=self,
+            store=store,
+            response=response,
+            stats=data["stats"],
+            error=None,
+        )
+        return response
+
+    def _execute(
+        self, store: jobflow.JobStore, cache: dict[str, Any] | None = None
+    ) -> tuple[Response, dict[str, Any]]:
+        """
+        Execute the job function without storing the outputs.
+
+        Parameters
+        ----------
+        store
+            A :obj:`.JobStore` to use for resolving references.
+        cache
+            A dictionary cache to use for resolving references.
+
+        Returns
+        -------
+        tuple[Response, dict]
+            The response of the job and the output document to store. The document is
+            already converted using the store serializer.
+        """
         import builtins
+        import inspect
+        import time
         import types
         from datetime import datetime
 
         from jobflow import CURRENT_JOB
         from jobflow.core.flow import get_flow
+        from jobflow.core.hooks import call_hooks
 
-        index_str = f", {self.index}" if self.index != 1 else ""
-        logger.info(f"Starting job - {self.name} ({self.uuid}{index_str})")
         CURRENT_JOB.job = self
 
         if self.config.expose_store:
             CURRENT_JOB.store = store
 
+        call_hooks("on_job_start", job=self, store=store)
+
+        start_cpu_time = time.process_time()
+        start_time = time.perf_counter()
         if self.config.resolve_references:
-            self.resolve_args(store=store)
+            self.resolve_args(store=store, cache=cache)
+        resolve_time = time.perf_counter() - start_time
+        call_hooks("on_resolve_done", job=self, store=store, duration=resolve_time)
 
         # if Job was created using the job decorator, then access the original function
         function = getattr(self.function, "original", self.function)
@@ -541,9 +863,17 @@ class Job(MSONable):
         if bound is not None and bound is not builtins:
             function = types.MethodType(function, bound)
 
+        start_time = time.perf_counter()
         response = function(*self.function_args, **self.function_kwargs)
+        function_time = time.perf_counter() - start_time
         response = Response.from_job_returns(response, self.output_schema)
 
+        if inspect.isgenerator(response.output):
+            # the function runs as the generator is consumed
+            start_time = time.perf_counter()
+            response.output = self._write_chunks(response.output, store)
+            function_time += time.perf_counter() - start_time
+
         if response.replace is not None:
             response.replace = prepare_replace(response.replace, self)
 
@@ -584,36 +914,58 @@ class Job(MSONable):
             if response.replace is not None:
                 pass_manager_config(response.replace, passed_config)
 
+        start_time = time.perf_counter()
         try:
-            output = jsanitize(
-                response.output, strict=True, enum_values=True, allow_bson=True
-            )
+            output = store.serializer.sanitize(response.output)
         except AttributeError as err:
             raise RuntimeError(
                 "Job output contained an object that is not MSONable and therefore "
                 "could not be serialized."
             ) from err
+        serialize_time = time.perf_counter() - start_time
 
-        save = {k: "output" if v is True else v for k, v in self._kwargs.items()}
         data = {
             "uuid": self.uuid,
             "index": self.index,
             "output": output,
             "completed_at": datetime.now().isoformat(),
-            "metadata": self.metadata,
-            "hosts": self.hosts,
+            "metadata": store.serializer.sanitize(self.metadata, enum_values=False),
+            "hosts": list(self.hosts),
             "name": self.name,
+            "stats": {
+                "resolve_time": resolve_time,
+                "function_time": function_time,
+                "serialize_time": serialize_time,
+                "cpu_time": time.process_time() - start_cpu_time,
+                "peak_rss": _get_peak_rss(),
+            },
         }
-        store.update(data, key=["uuid", "index"], save=save)
+        return response, data
 
-        CURRENT_JOB.reset()
-        logger.info(f"Finished job - {self.name} ({self.uuid}{index_str})")
-        return response
+    def _write_chunks(self, chunks: Iterator, store: jobflow.JobStore) -> Any:
+        """
+        Write the chunks yielded by a generator output to an additional store.
+
+        The chunks are written to the additional store that the job output is saved
+        in (e.g., ``data`` for jobs created with ``@job(data=True)``). If the output is
+        not saved in an additional store, the chunks are collected into a list.
+        """
+        store_name = next((k for k, v in self._save.items() if v == "output"), None)
+        if store_name is None:
+            return list(chunks)
+
+        return store.write_chunks(chunks, store_name, self.uuid, self.index)
+
+    @property
+    def _save(self) -> dict[str, Any]:
+        """Get the additional stores in which to save the job outputs."""
+        return {k: "output" if v is True else v for k, v in self._kwargs.items()}
 
     def resolve_args(
         self,
         store: jobflow.JobStore,
         inplace: bool = True,
+        cache: dict[str, Any] | None = None,
     ) -> Job:
         """
         Resolve any :obj:`.OutputReference` objects in the input arguments.
@@ -626,6 +978,9 @@ class Job(MSONable):
             A maggma store to use for resolving references.
         inplace
             Update the arguments of the current job or return a new job object.
+        cache
+            A dictionary cache to use for resolving references. If not set, a new
+            cache will be used.
 
         Returns
         -------
@@ -636,18 +991,25 @@ class Job(MSONable):
 
         from jobflow.core.reference import find_and_resolve_references
 
-        cache: dict[str, Any] = {}
+        if cache is None:
+            cache = {}
+        elif self.config.lazy_blobs:
+            # don't share outputs containing lazy blobs with other jobs
+            cache = {uuid: dict(outputs) for uuid, outputs in cache.items()}
+
         resolved_args = find_and_resolve_references(
             self.function_args,
             store,
             cache=cache,
             on_missing=self.config.on_missing_references,
+            lazy_blobs=self.config.lazy_blobs,
         )
         resolved_kwargs = find_and_resolve_references(
             self.function_kwargs,
             store,
             cache=cache,
             on_missing=self.config.on_missing_references,
+            lazy_blobs=self.config.lazy_blobs,
         )
         resolved_args = tuple(resolved_args)
 
@@ -663,7 +1025,7 @@ class Job(MSONable):
 
     def update_kwargs(
         self,
-        update: dict[str, Any],
+        update: dict[str, Any] | CompiledMod,
         name_filter: str | None = None,
         function_filter: Callable | None = None,
         dict_mod: bool = False,
@@ -674,7 +1036,8 @@ class Job(MSONable):
         Parameters
         ----------
         update
-            The updates to apply.
+            The updates to apply. A dict mod compiled using :obj:`.compile_mod` is
+            always applied as a dict mod.
         name_filter
             A filter for the job name. Only jobs with a matching name will be updated.
             Includes partial matches, e.g. "ad" will match a job with the name "adder".
@@ -699,7 +1062,7 @@ class Job(MSONable):
 
         >>> add_job.update_kwargs({"number": 10})
         """
-        from jobflow.utils.dict_mods import apply_mod
+        from jobflow.utils.dict_mods import CompiledMod, apply_mod
 
         if function_filter is not None and function_filter != self.function:
             return
@@ -712,14 +1075,14 @@ class Job(MSONable):
             return
 
         # if we get to here then we pass all the filters
-        if dict_mod:
+        if dict_mod or isinstance(update, CompiledMod):
             apply_mod(update, self.function_kwargs)
         else:
             self.function_kwargs.update(update)
 
     def update_maker_kwargs(
         self,
-        update: dict[str, Any],
+        update: dict[str, Any] | CompiledMod,
         name_filter: str | None = None,
         class_filter: type[jobflow.Maker] | None = None,
         nested: bool = True,
@@ -731,7 +1094,8 @@ class Job(MSONable):
         Parameters
         ----------
         update
-            The updates to apply.
+            The updates to apply. A dict mod compiled using :obj:`.compile_mod` is
+            always applied as a dict mod.
         name_filter
             A filter for the Maker name. Only Makers with a matching name will be
             updated. Includes partial matches, e.g. "ad" will match a Maker with the
@@ -1341,3 +1705,146 @@ def pass_manager_config(
     # update manager config
     for ajob in all_jobs:
         ajob.config.manager_config = deepcopy(manager_config)
+
+
+def _get_peak_rss() -> int | None:
+    """
+    Get the peak resident set size of the current process.
+
+    Returns
+    -------
+    int or None
+        The peak resident set size in bytes, or None if it cannot be determined.
+    """
+    import sys
+
+    try:
+        import resource
+    except ImportError:
+        # resource is not available on Windows
+        return None
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+def run_batch(
+    jobs: Sequence[Job],
+    store: jobflow.JobStore,
+    cache: dict[str, Any] | None = None,
+) -> list[Response | Exception]:
+    """
+    Run several jobs as a single execution unit.
+
+    The jobs are executed one after another, sharing a single reference cache, and
+    the outputs of all jobs are written to the store in bulk, under their original
+    UUIDs. The jobs should not depend on each other, as the outputs of the jobs are
+    only available once the whole batch has finished.
+
+    Parameters
+    ----------
+    jobs
+        The jobs to run.
+    store
+        A :obj:`.JobStore` to use for resolving references and storing job outputs.
+    cache
+        A dictionary cache to use for resolving references. If not set, a new cache
+        will be shared between the jobs in the batch.
+
+    Returns
+    -------
+    list[Response | Exception]
+        The responses of the jobs, in the same order as the jobs. If a job raised an
+        exception, the exception is returned in place of the response, so that the
+        outputs of the remaining jobs in the batch are still stored. If a job stops the
+        flow (``Response.stop_jobflow``), the remaining jobs are not run and are left
+        out of the results.
+
+    Raises
+    ------
+    Exception
+        If writing the outputs to the store fails. The ``on_job_end`` hooks of the jobs
+        that ran are called with the error before it is raised.
+    """
+    from jobflow import CURRENT_JOB
+    from jobflow.core.hooks import call_hooks
+
+    if cache is None:
+        cache = {}
+
+    if len(jobs) > 0:
+        logger.info(f"Starting batch of {len(jobs)} jobs - {jobs[0].name}")
+
+    results: list[Response | Exception] = []
+    finished: list[tuple[Job, Response, dict[str, Any]]] = []
+    grouped_docs: list[tuple[dict[str, Any], bool, list[dict[str, Any]]]] = []
+    for batch_job in jobs:
+        try:
+            response, data = batch_job._execute(store, cache=cache)
+        except Exception as err:
+            results.append(err)
+            call_hooks(
+                "on_job_end",
+                job=batch_job,
+                store=store,
+                response=None,
+                stats=None,
+                error=err,
+            )
+            continue
+        finally:
+            CURRENT_JOB.reset()
+
+        results.append(response)
+        finished.append((batch_job, response, data))
+
+        # group documents that are saved in the same way
+        save = batch_job._save
+        record_bytes = batch_job.config.record_bytes
+        for group_save, group_record_bytes, docs in grouped_docs:
+            if group_save == save and group_record_bytes == record_bytes:
+                docs.append(data)
+                break
+        else:
+            grouped_docs.append((save, record_bytes, [data]))
+
+        if response.stop_jobflow:
+            # don't run the rest of the batch
+            break
+
+    try:
+        for save, record_bytes, docs in grouped_docs:
+            store.update(
+                docs,
+                key=["uuid", "index"],
+                save=save,
+                stats_key="stats",
+                record_bytes=record_bytes,
+                sanitized=True,
+            )
+    except Exception as err:
+        # the outputs of the jobs that ran may not have been stored
+        for batch_job, _, _ in finished:
+            call_hooks(
+                "on_job_end",
+                job=batch_job,
+                store=store,
+                response=None,
+                stats=None,
+                error=err,
+            )
+        raise
+
+    for batch_job, response, data in finished:
+        call_hooks(
+            "on_job_end",
+            job=batch_job,
+            store=store,
+            response=response,
+            stats=data["stats"],
+            error=None,
+        )
+
+    if len(jobs) > 0:
+        logger.info(f"Finished batch of {len(jobs)} jobs - {jobs[0].name}")
+    return results
@@ -11,6 +11,7 @@ if typing.TYPE_CHECKING:
     from typing import Any, Callable
 
     import jobflow
+    from jobflow.utils.dict_mods import CompiledMod
 
 __all__ = ["Maker"]
 
@@ -131,7 +132,7 @@ class Maker(MSONable):
 
     def update_kwargs(
         self,
-        update: dict[str, Any],
+        update: dict[str, Any] | CompiledMod,
         name_filter: str | None = None,
         class_filter: type[Maker] | None = None,
         nested: bool = True,
@@ -147,7 +148,8 @@ class Maker(MSONable):
         Parameters
         ----------
         update
-            The updates to apply.
+            The updates to apply. A dict mod compiled using :obj:`.compile_mod` is
+            always applied as a dict mod.
         name_filter
             A filter for the Maker name. Only Makers with a matching name will be
             updated. Includes partial matches, e.g. "ad" will match a Maker with the
@@ -211,15 +213,18 @@ class Maker(MSONable):
         ...     {"number": 10}, class_filter=AddMaker, nested=False
         ... )
         """
-        from jobflow.utils.dict_mods import apply_mod
+        from jobflow.utils.dict_mods import CompiledMod, compile_mod
+
+        # the same update may be applied to many makers
+        mod = compile_mod(update) if dict_mod else update
 
         def _update_kwargs_func(maker: Maker):
             # Update the kwargs of the maker
             d = maker.as_dict()
-            if dict_mod:
-                apply_mod(update, d)
+            if isinstance(mod, CompiledMod):
+                mod.apply(d)
             else:
-                d.update(update)
+                d.update(mod)
             return maker.from_dict(d)
 
         return recursive_call(
@@ -5,8 +5,9 @@ from __future__ import annotations
 import contextlib
 import typing
 from typing import Any, Sequence
+from weakref import WeakKeyDictionary
 
-from monty.json import MontyDecoder, MontyEncoder, MSONable, jsanitize
+from monty.json import MontyEncoder, MSONable, jsanitize
 from pydantic import BaseModel
 from pydantic.utils import lenient_issubclass
 
@@ -89,7 +90,7 @@ class OutputReference(MSONable):
     OutputReference(1234, ['key'], [0], .value)
     """
 
-    __slots__ = ("uuid", "attributes", "output_schema")
+    __slots__ = ("uuid", "attributes", "output_schema", "_hash")
 
     def __init__(
         self,
@@ -113,6 +114,7 @@ class OutputReference(MSONable):
         store: jobflow.JobStore | None,
         cache: dict[str, Any] | None = None,
         on_missing: OnMissing = OnMissing.ERROR,
+        lazy_blobs: bool = False,
     ) -> Any:
         """
         Resolve the reference.
@@ -134,6 +136,9 @@ class OutputReference(MSONable):
         on_missing
             What to do if the output reference is missing in the database and cache.
             See :obj:`OnMissing` for the available options.
+        lazy_blobs
+            Whether data in additional stores should be returned as
+            :obj:`.LazyBlob` proxies that are only loaded when accessed.
 
         Raises
         ------
@@ -147,6 +152,8 @@ class OutputReference(MSONable):
             The resolved reference if it can be found. If the reference cannot be found,
             the returned value will depend on the value of ``on_missing``.
         """
+        from jobflow.core.store import ChunkedOutput
+
         if cache is None:
             cache = {}
 
@@ -160,7 +167,11 @@ class OutputReference(MSONable):
         if index is not None and index not in cache[self.uuid]:
             with contextlib.suppress(ValueError):
                 cache[self.uuid][index] = store.get_output(
-                    self.uuid, which="last", load=True, on_missing=on_missing
+                    self.uuid,
+                    which="last",
+                    load=True,
+                    on_missing=on_missing,
+                    lazy_blobs=lazy_blobs,
                 )
 
         if on_missing == OnMissing.ERROR and index not in cache[self.uuid]:
@@ -176,7 +187,11 @@ class OutputReference(MSONable):
         data = cache[self.uuid][index]
 
         # decode objects before attribute access
-        data = MontyDecoder().process_decoded(data)
+        data = store.serializer.decode(data)
+
+        if isinstance(data, ChunkedOutput):
+            # chunked outputs are loaded lazily so need access to the store
+            data.job_store = store
 
         # re-cache data in case other references need it
         cache[self.uuid][index] = data
@@ -243,11 +258,20 @@ class OutputReference(MSONable):
     def __setattr__(self, attr, val):
         """Set attribute."""
         # Setting unknown attributes is not allowed
-        if attr in self.__slots__:
-            object.__setattr__(self, attr, val)
-        else:
+        if attr not in self.__slots__:
             raise TypeError("OutputReference objects are immutable")
 
+        if attr == "attributes":
+            # store attributes as tuples so they can be hashed and compared directly;
+            # deserialized references will have the attributes as lists
+            val = tuple(a if isinstance(a, tuple) else tuple(a) for a in val)
+
+        object.__setattr__(self, attr, val)
+
+        if attr in ("uuid", "attributes"):
+            # invalidate the cached hash
+            object.__setattr__(self, "_hash", None)
+
     def __iter__(self):
         """Make sure OutputReference is not iterable."""
         raise TypeError("OutputReference objects are not iterable")
@@ -268,21 +292,19 @@ class OutputReference(MSONable):
 
     def __hash__(self) -> int:
         """Return a hash of the reference."""
-        return hash(str(self))
+        if self._hash is None:
+            try:
+                _hash = hash((self.uuid, self.attributes))
+            except TypeError:
+                # attributes contain an unhashable index
+                _hash = hash(str(self))
+            object.__setattr__(self, "_hash", _hash)
+        return self._hash
 
     def __eq__(self, other: Any) -> bool:
         """Test for equality against another reference."""
         if isinstance(other, OutputReference):
-            return (
-                self.uuid == other.uuid
-                and len(self.attributes) == len(other.attributes)
-                and all(
-                    [
-                        a[0] == b[0] and a[1] == b[1]
-                        for a, b in zip(self.attributes, other.attributes)
-                    ]
-                )
-            )
+            return self.uuid == other.uuid and self.attributes == other.attributes
         return False
 
     @property
@@ -312,6 +334,7 @@ def resolve_references(
     store: jobflow.JobStore,
     cache: dict[str, Any] | None = None,
     on_missing: OnMissing = OnMissing.ERROR,
+    lazy_blobs: bool = False,
 ) -> dict[OutputReference, Any]:
     """
     Resolve multiple output references.
@@ -329,6 +352,9 @@ def resolve_references(
     on_missing
         What to do if the output reference is missing in the database and cache.
         See :obj:`OnMissing` for the available options.
+    lazy_blobs
+        Whether data in additional stores should be returned as :obj:`.LazyBlob`
+        proxies that are only loaded when accessed.
 
     Returns
     -------
@@ -351,12 +377,12 @@ def resolve_references(
 
         if index is not None and index not in cache[uuid]:
             cache[uuid][index] = store.get_output(
-                uuid, load=True, on_missing=on_missing
+                uuid, load=True, on_missing=on_missing, lazy_blobs=lazy_blobs
             )
 
         for ref in ref_group:
             resolved_references[ref] = ref.resolve(
-                store, cache=cache, on_missing=on_missing
+                store, cache=cache, on_missing=on_missing, lazy_blobs=lazy_blobs
             )
 
     return resolved_references
@@ -405,6 +431,7 @@ def find_and_resolve_references(
     store: jobflow.JobStore,
     cache: dict[str, Any] | None = None,
     on_missing: OnMissing = OnMissing.ERROR,
+    lazy_blobs: bool = False,
 ) -> Any:
     """
     Return the input but with all output references replaced with their resolved values.
@@ -423,6 +450,9 @@ def find_and_resolve_references(
     on_missing
         What to do if the output reference is missing in the database and cache.
         See :obj:`OnMissing` for the available options.
+    lazy_blobs
+        Whether data in additional stores should be returned as :obj:`.LazyBlob`
+        proxies that are only loaded when accessed.
 
     Returns
     -------
@@ -431,37 +461,66 @@ def find_and_resolve_references(
         values. If a reference cannot be found, its replacement value will depend on the
         value of ``on_missing``.
     """
-    from pydash import get, set_
-
-    from jobflow.utils.find import find_key_value
-
     if isinstance(arg, dict) and arg.get("@class") == "OutputReference":
         # if arg is a deserialized reference, serialize it
         arg = OutputReference.from_dict(arg)
 
     if isinstance(arg, OutputReference):
         # if the argument is a reference then stop there
-        return arg.resolve(store, cache=cache, on_missing=on_missing)
+        return arg.resolve(
+            store, cache=cache, on_missing=on_missing, lazy_blobs=lazy_blobs
+        )
 
     elif isinstance(arg, (float, int, str, bool)):
         # argument is a primitive, we won't find a reference here
         return arg
 
     # serialize the argument to a dictionary
-    encoded_arg = jsanitize(arg, strict=True, enum_values=True, allow_bson=True)
+    encoded_arg = store.serializer.sanitize(arg)
+
+    if not _resolve_encoded_references(
+        encoded_arg, store, cache=cache, on_missing=on_missing, lazy_blobs=lazy_blobs
+    ):
+        return arg
+
+    # deserialize dict array
+    return store.serializer.decode(encoded_arg)
+
+
+def _resolve_encoded_references(
+    encoded_arg: dict | list,
+    store: jobflow.JobStore,
+    cache: dict[str, Any] | None = None,
+    on_missing: OnMissing = OnMissing.ERROR,
+    lazy_blobs: bool = False,
+) -> bool:
+    """
+    Replace the serialized output references in a document with their resolved values.
+
+    The document is updated in place. References at the top level of the document
+    cannot be replaced and are ignored.
+
+    Returns
+    -------
+    bool
+        Whether the document contained any references.
+    """
+    from pydash import get, set_
+
+    from jobflow.utils.find import find_key_value
 
     # recursively find any reference classes
     locations = find_key_value(encoded_arg, "@class", "OutputReference")
 
     if len(locations) == 0:
-        return arg
+        return False
 
     # resolve the references
     references = [
         OutputReference.from_dict(get(encoded_arg, list(loc))) for loc in locations
     ]
     resolved_references = resolve_references(
-        references, store, cache=cache, on_missing=on_missing
+        references, store, cache=cache, on_missing=on_missing, lazy_blobs=lazy_blobs
     )
 
     # replace the references in the arg dict
@@ -473,13 +532,12 @@ def find_and_resolve_references(
         resolved_reference = resolved_references[reference]
         set_(encoded_arg, list(location), resolved_reference)
 
-    # deserialize dict array
-    return MontyDecoder().process_decoded(encoded_arg)
+    return True
 
 
 def validate_schema_access(
     schema: type[BaseModel], item: str
-) -> tuple[bool, BaseModel | None]:
+) -> tuple[bool, type[BaseModel] | None]:
     """
     Validate that an attribute or index access is supported by a model.
 
@@ -499,17 +557,37 @@ def validate_schema_access(
 
     Returns
     -------
-    tuple[bool, BaseModel]
+    tuple[bool, type[BaseModel] | None]
         the bool is ``True`` if the schema access was valid.
         The BaseModel class associated with the item, if any.
     """
-    schema_dict = schema.schema()
-    if item not in schema_dict["properties"]:
+    properties = _get_schema_properties(schema)
+    if item not in properties:
         raise AttributeError(f"{schema.__name__} does not have attribute '{item}'.")
 
-    subschema = None
-    item_type = schema.__fields__[item].outer_type_
-    if lenient_issubclass(item_type, BaseModel):
-        subschema = item_type
+    return True, properties[item]
+
 
-    return True, subschema
+_SCHEMA_PROPERTIES: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def _get_schema_properties(
+    schema: type[BaseModel],
+) -> dict[str, type[BaseModel] | None]:
+    """
+    Get the properties of a model, mapped to their model class if they are nested.
+
+    Generating the JSON schema of a model is expensive, so the properties are cached
+    for each model class. Nested models are cached separately when they are accessed.
+    """
+    if schema not in _SCHEMA_PROPERTIES:
+        properties: dict[str, type[BaseModel] | None] = {}
+        for name in schema.schema()["properties"]:
+            subschema = None
+            field = schema.__fields__.get(name)
+            if field is not None and lenient_issubclass(field.outer_type_, BaseModel):
+                subschema = field.outer_type_
+            properties[name] = subschema
+        _SCHEMA_PROPERTIES[schema] = properties
+
+    return _SCHEMA_PROPERTIES[schema]
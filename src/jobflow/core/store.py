@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 import typing
 
 from maggma.core import Store
@@ -13,18 +14,35 @@ from jobflow.utils.find import get_root_locations
 if typing.TYPE_CHECKING:
     from enum import Enum
     from pathlib import Path
-    from typing import Any, Dict, Iterator, List, Optional, Type, Union
+    from typing import (
+        Any,
+        Dict,
+        Iterable,
+        Iterator,
+        List,
+        Optional,
+        Sequence,
+        Type,
+        Union,
+    )
 
     from maggma.core import Sort
 
+    from jobflow.utils.serialization import Serializer
+
     obj_type = Union[str, Enum, Type[MSONable], List[Union[Enum, str, Type[MSONable]]]]
     save_type = Optional[Dict[str, obj_type]]
     load_type = Union[bool, Dict[str, Union[bool, obj_type]]]
 
-__all__ = ["JobStore"]
+logger = logging.getLogger(__name__)
+
+__all__ = ["JobStore", "ChunkedOutput", "LazyBlob"]
 
 T = typing.TypeVar("T", bound="JobStore")
 
+_REMOVE_CHUNK_SIZE = 1000
+_GROUP_BATCH_SIZE = 1000
+
 
 class JobStore(Store):
     """Store intended to allow pushing and pulling documents into multiple stores.
@@ -46,6 +64,15 @@ class JobStore(Store):
         which case all saved items are loaded, a dictionary key (string or enum),
         an :obj:`.MSONable` class, or a list of keys/classes. Alternatively,
         ``load=True`` will automatically load all items from every additional store.
+    ensure_indexes
+        Whether to create (or verify) the indexes used by jobflow before the first
+        write. A compound ``(uuid, index)`` index is created on the docs store and a
+        ``blob_uuid`` and compound ``(job_uuid, job_index)`` index are created on each
+        additional store. Connecting to the store never touches the indexes, so
+        read-only use does not need any extra database calls.
+    serializer
+        The :obj:`.Serializer` used to convert outputs to documents and back. Defaults
+        to a :obj:`.FastSerializer`.
     """
 
     def __init__(
@@ -54,8 +81,17 @@ class JobStore(Store):
         additional_stores: dict[str, Store] | None = None,
         save: save_type = None,
         load: load_type = False,
+        ensure_indexes: bool = True,
+        serializer: Serializer | None = None,
     ):
+        from jobflow.utils.serialization import FastSerializer
+
         self.docs_store = docs_store
+        self.ensure_indexes = ensure_indexes
+        if serializer is None:
+            serializer = FastSerializer()
+        self.serializer: Serializer = serializer
+        self._indexes_ensured = False
         if additional_stores is None:
             self.additional_stores = {}
         else:
@@ -111,6 +147,20 @@ class JobStore(Store):
         for additional_store in self.additional_stores.values():
             additional_store.connect(force_reset=force_reset)
 
+        if force_reset:
+            # the collections may have been recreated
+            self._indexes_ensured = False
+
+    def _ensure_indexes(self):
+        """Create the indexes used by jobflow, if not done since the last reset."""
+        # only check the indexes once, as the store may be reconnected for every job
+        if self.ensure_indexes and not self._indexes_ensured:
+            _ensure_compound_index(self.docs_store, ["uuid", "index"])
+            for additional_store in self.additional_stores.values():
+                _ensure_compound_index(additional_store, ["blob_uuid"])
+                _ensure_compound_index(additional_store, ["job_uuid", "job_index"])
+            self._indexes_ensured = True
+
     def close(self):
         """Close any connections."""
         self.docs_store.close()
@@ -167,10 +217,6 @@ class JobStore(Store):
         Dict
             The documents.
         """
-        from pydash import get
-
-        from jobflow.utils.find import find_key, update_in_dictionary
-
         if load is None:
             load = self.load
 
@@ -187,35 +233,7 @@ class JobStore(Store):
 
         for doc in docs:
             if load_keys:
-                # Process is
-                # 1. Find the locations of all blob identifiers.
-                # 2. Filter the locations based on the load criteria.
-                # 3. Resolve all data blobs using the data store.
-                # 4. Insert the data blobs into the document.
-                locations = find_key(doc, "blob_uuid")
-                all_blobs = [get(doc, list(loc)) for loc in locations]
-                grouped_blobs = _filter_blobs(all_blobs, locations, load_keys)
-                to_insert = {}
-
-                for store_name, (blobs, locs) in grouped_blobs.items():
-                    store = self.additional_stores.get(store_name, None)
-
-                    if store is None:
-                        raise ValueError(
-                            f"Unrecognised additional store name: {store_name}"
-                        )
-
-                    object_info = {b["blob_uuid"]: loc for b, loc in zip(blobs, locs)}
-                    objects = store.query(
-                        criteria={"blob_uuid": {"$in": list(object_info.keys())}},
-                        properties=["blob_uuid", "data"],
-                    )
-                    object_map = {o["blob_uuid"]: o["data"] for o in objects}
-                    inserts = {tuple(v): object_map[k] for k, v in object_info.items()}
-                    to_insert.update(inserts)
-
-                update_in_dictionary(doc, to_insert)
-
+                self._load_blobs([doc], load_keys)
             yield doc
 
     def query_one(
@@ -257,10 +275,16 @@ class JobStore(Store):
         docs: list[dict] | dict,
         key: list | str | None = None,
         save: bool | save_type = None,
+        stats_key: str | None = None,
+        record_bytes: bool = False,
+        sanitized: bool = False,
     ):
         """
         Update or insert documents into the Store.
 
+        Data is written to the additional stores before the documents are written to
+        the docs store.
+
         Parameters
         ----------
         docs
@@ -272,19 +296,37 @@ class JobStore(Store):
         save
             Which items to save in additional stores. See ``JobStore`` constructor for
             more details.
+        stats_key
+            If set, the time in seconds spent preparing the documents and writing to the
+            additional stores (``store_time``) is recorded in a dictionary under this
+            key of each document. If multiple documents are given, the time is split
+            evenly between them.
+        record_bytes
+            Whether to also record the number of bytes written to each additional store
+            (``store_bytes``) under ``stats_key``. Measuring the size requires encoding
+            each blob an extra time, so this is disabled by default.
+        sanitized
+            Whether the documents have already been converted using the store
+            serializer (for example, by :obj:`.Job.run`). If True, the documents are
+            written without being serialized again and are modified in place.
         """
+        import time
         from collections import defaultdict
-        from copy import deepcopy
 
-        from monty.json import jsanitize
         from pydash import get
 
-        from jobflow.utils.find import find_key, update_in_dictionary
+        from jobflow.core.hooks import call_hooks
+        from jobflow.utils.find import find_keys, update_in_dictionary
 
         if save is None or save is True:
             save = self.save
 
         save_keys = _prepare_save(save)
+        keys = {
+            (store_name, i): save_key
+            for store_name, store_save in save_keys.items()
+            for i, save_key in enumerate(store_save)
+        }
 
         if not isinstance(docs, list):
             docs = [docs]
@@ -292,22 +334,41 @@ class JobStore(Store):
         if key is None:
             key = ["uuid", "index"]
 
+        self._ensure_indexes()
+
+        start_time = time.perf_counter()
         blob_data = defaultdict(list)
         dict_docs = []
+        store_bytes: list[dict[str, int]] = []
         for doc in docs:
-            doc = jsanitize(doc, strict=True, allow_bson=True)
+            if not sanitized:
+                doc = self.serializer.sanitize(doc, enum_values=False)
             dict_docs.append(doc)
+            store_bytes.append(defaultdict(int))
 
             if save_keys:
-                locations = []
+                # find the keys for all additional stores in a single pass
+                found = find_keys(doc, keys, include_end=True)
+                saved: list[list] = []
                 for store_name, store_save in save_keys.items():
-                    for save_key in store_save:
-                        locations.extend(find_key(doc, save_key, include_end=True))
-
-                    locations = get_root_locations(locations)
+                    locations = []
+                    for i in range(len(store_save)):
+                        locations.extend(found[store_name, i])
+
+                    # skip anything already replaced by a blob in a previous store
+                    saved_ids = {id(loc) for loc in saved}
+                    locations = [
+                        loc
+                        for loc in get_root_locations(saved + locations)
+                        if id(loc) not in saved_ids
+                    ]
+                    saved.extend(locations)
                     objects = [get(doc, list(loc)) for loc in locations]
+                    # chunked outputs only reference data already in the store
                     object_map = {
-                        tuple(k): o for k, o in zip(locations, objects) if o is not None
+                        tuple(k): o
+                        for k, o in zip(locations, objects)
+                        if o is not None and not _is_chunked_output(o)
                     }
                     object_info = {
                         k: _get_blob_info(o, store_name) for k, o in object_map.items()
@@ -316,18 +377,18 @@ class JobStore(Store):
 
                     # Now format blob data for saving in the data_store
                     for loc, data in object_map.items():
-                        blob = deepcopy(object_info[loc])
-                        blob.pop("store")
-                        blob.update(
-                            {
-                                "data": data,
-                                "job_uuid": doc["uuid"],
-                                "job_index": doc["index"],
-                            }
-                        )
+                        blob = {
+                            "@class": object_info[loc]["@class"],
+                            "@module": object_info[loc]["@module"],
+                            "blob_uuid": object_info[loc]["blob_uuid"],
+                            "data": data,
+                            "job_uuid": doc["uuid"],
+                            "job_index": doc["index"],
+                        }
                         blob_data[store_name].append(blob)
 
-        self.docs_store.update(dict_docs, key=key)
+                        if stats_key and record_bytes:
+                            store_bytes[-1][store_name] += _get_size(data)
 
         for store_name, blobs in blob_data.items():
             # Here we use a try/except with a self.additional_stores[store_name]
@@ -341,7 +402,21 @@ class JobStore(Store):
             if store is None:
                 raise ValueError(f"Unrecognised additional store name: {store_name}")
 
-            store.update(blobs, key="blob_uuid")
+            self._write_docs(store, blobs, key="blob_uuid")
+
+        if stats_key and dict_docs:
+            store_time = (time.perf_counter() - start_time) / len(dict_docs)
+            for doc, doc_bytes in zip(dict_docs, store_bytes):
+                stats = doc.get(stats_key) or {}
+                stats["store_time"] = store_time
+                if record_bytes:
+                    stats["store_bytes"] = dict(doc_bytes)
+                doc[stats_key] = stats
+
+        self._write_docs(self.docs_store, dict_docs, key=key)
+
+        duration = time.perf_counter() - start_time
+        call_hooks("on_store_write", store=self, docs=dict_docs, duration=duration)
 
     def ensure_index(self, key: str, unique: bool = False) -> bool:
         """
@@ -374,6 +449,13 @@ class JobStore(Store):
         """
         Group documents by keys.
 
+        Grouping is performed by the docs store (e.g., using an aggregation pipeline
+        for MongoDB), and the documents and any data in the additional stores are only
+        loaded as the groups are consumed, in batches of groups containing up to 1000
+        documents. The order of the groups is determined by the docs store. If
+        ``sort``, ``skip`` or ``limit`` are given, the documents are instead queried
+        and grouped in memory.
+
         Parameters
         ----------
         keys
@@ -402,47 +484,278 @@ class JobStore(Store):
 
         from pydash import get, has, set_
 
-        keys = keys if isinstance(keys, (list, tuple)) else [keys]
+        keys = list(keys) if isinstance(keys, (list, tuple)) else [keys]
 
+        # work on a copy so the caller's properties are not modified
         if isinstance(properties, dict):
             # make sure all keys are in properties...
-            properties.update(dict(zip(keys, [1] * len(keys))))
+            properties = {**properties, **dict.fromkeys(keys, 1)}
         elif properties is not None:
-            properties.extend(keys)
+            properties = [*properties, *keys]
 
-        docs = self.query(
-            properties=properties,
-            criteria=criteria,
-            sort=sort,
-            skip=skip,
-            limit=limit,
-            load=load,
-        )
-        data = [doc for doc in docs if all(has(doc, k) for k in keys)]
+        # the identifiers are needed to match documents to groups but are only
+        # returned if requested
+        injected = []
+        if properties is not None:
+            injected = [k for k in ("uuid", "index") if k not in properties]
+        if isinstance(properties, dict):
+            properties = {**properties, **dict.fromkeys(injected, 1)}
+        elif properties is not None:
+            properties = [*properties, *injected]
+
+        def strip_injected(group_docs):
+            for doc in group_docs:
+                for k in injected:
+                    doc.pop(k, None)
+            return group_docs
 
         def grouping_keys(doc):
             return tuple(get(doc, k) for k in keys)
 
-        for vals, group in groupby(sorted(data, key=grouping_keys), key=grouping_keys):
+        def make_group(vals, group_docs):
             doc: dict[str, Any] = {}
             for k, v in zip(keys, vals):
                 set_(doc, k, v)
-            yield doc, list(group)
+            return doc, group_docs
+
+        if sort or skip or limit:
+            docs = self.query(
+                properties=properties,
+                criteria=criteria,
+                sort=sort,
+                skip=skip,
+                limit=limit,
+                load=load,
+            )
+            data = [doc for doc in docs if all(has(doc, k) for k in keys)]
+            data = sorted(data, key=grouping_keys)
+            for vals, group in groupby(data, key=grouping_keys):
+                yield make_group(vals, strip_injected(list(group)))
+            return
+
+        if load is None:
+            load = self.load
+        load_keys = _prepare_load(load)
 
-    def remove_docs(self, criteria: dict):
+        def finalize(group_docs):
+            if load_keys:
+                self._load_blobs(group_docs, load_keys)
+            strip_injected(group_docs)
+
+        try:
+            # only the identifiers are grouped by the docs store; the documents are
+            # retrieved as each group is consumed
+            id_groups = _first_and_rest(
+                self.docs_store.groupby(
+                    keys, criteria=criteria, properties=["uuid", "index"]
+                )
+            )
+        except NotImplementedError:
+            id_groups = None
+
+        if id_groups is None:
+            # stream documents sorted by the grouping keys instead
+            docs = self.docs_store.query(
+                criteria=criteria, properties=properties, sort={k: 1 for k in keys}
+            )
+            docs = (doc for doc in docs if all(has(doc, k) for k in keys))
+            for vals, group in groupby(docs, key=grouping_keys):
+                group_docs = list(group)
+                finalize(group_docs)
+                yield make_group(vals, group_docs)
+            return
+
+        def load_batch(batch):
+            # retrieve the documents (and blobs) for several groups at once
+            uuids = list({uuid for _, ids in batch for uuid, _ in ids})
+            docs_by_id = {}
+            for chunk in _chunks(uuids, _GROUP_BATCH_SIZE):
+                docs = self.docs_store.query(
+                    criteria={"uuid": {"$in": chunk}}, properties=properties
+                )
+                docs_by_id.update({(d["uuid"], d["index"]): d for d in docs})
+
+            groups = [
+                (vals, [docs_by_id[i] for i in ids if i in docs_by_id])
+                for vals, ids in batch
+            ]
+            finalize([doc for _, group_docs in groups for doc in group_docs])
+            for vals, group_docs in groups:
+                yield make_group(vals, group_docs)
+
+        batch: list[tuple[tuple, list]] = []
+        batch_size = 0
+        for group_doc, id_docs in id_groups:
+            # documents missing a key are grouped with null values by MongoDB
+            ids = [
+                (d["uuid"], d["index"]) for d in id_docs if all(has(d, k) for k in keys)
+            ]
+            if not ids:
+                continue
+
+            batch.append((grouping_keys(group_doc), ids))
+            batch_size += len(ids)
+            if batch_size >= _GROUP_BATCH_SIZE:
+                yield from load_batch(batch)
+                batch, batch_size = [], 0
+
+        if batch:
+            yield from load_batch(batch)
+
+    def _load_blobs(self, docs: list[dict], load_keys: bool | dict):
+        """
+        Load data from the additional stores into documents, in place.
+
+        One query is made to each additional store for all the documents.
+
+        Parameters
+        ----------
+        docs
+            The documents containing blob references.
+        load_keys
+            Which items to load, as returned by ``_prepare_load``.
+        """
+        from jobflow.utils.find import update_in_dictionary
+
+        # Process is
+        # 1. Find the locations of all blob identifiers.
+        # 2. Filter the locations based on the load criteria.
+        # 3. Resolve all data blobs using the data store.
+        # 4. Insert the data blobs into the document.
+        object_infos: dict[str, dict[str, list]] = {}
+        for i, doc in enumerate(docs):
+            locations, all_blobs = _find_blobs(doc)
+            grouped_blobs = _filter_blobs(all_blobs, locations, load_keys)
+
+            for store_name, (blobs, locs) in grouped_blobs.items():
+                if store_name not in self.additional_stores:
+                    raise ValueError(
+                        f"Unrecognised additional store name: {store_name}"
+                    )
+
+                object_info = object_infos.setdefault(store_name, {})
+                for blob, loc in zip(blobs, locs):
+                    object_info.setdefault(blob["blob_uuid"], []).append((i, loc))
+
+        to_insert: list[dict] = [{} for _ in docs]
+        for store_name, object_info in object_infos.items():
+            objects = self._query_blobs(store_name, list(object_info.keys()))
+            for o in objects:
+                for i, loc in object_info[o["blob_uuid"]]:
+                    to_insert[i][tuple(loc)] = o["data"]
+
+        for doc, inserts in zip(docs, to_insert):
+            update_in_dictionary(doc, inserts)
+
+    def _query_blobs(self, store_name: str, blob_uuids: list[str]) -> Iterator[dict]:
+        """Query an additional store for the data of a list of blobs."""
+        return self.additional_stores[store_name].query(
+            criteria={"blob_uuid": {"$in": blob_uuids}},
+            properties=["blob_uuid", "data"],
+        )
+
+    def _write_docs(self, store: Store, docs: list[dict], key: list | str):
+        """Write documents to the docs store or one of the additional stores."""
+        store.update(docs, key=key)
+
+    def remove_docs(self, criteria: dict, cascade_hosts: bool = False):
         """
         Remove docs matching the criteria.
 
+        Any data in the additional stores belonging to the removed documents is also
+        removed. Deletes are batched into a small number of ``$in`` queries per store.
+
         Parameters
         ----------
         criteria
             Criteria for documents to remove.
+        cascade_hosts
+            Whether to also remove the documents of all other jobs in the same root
+            flow (i.e., sharing the last entry in ``hosts``) as the matching documents.
         """
-        docs = self.query(criteria, properties=["uuid", "index"])
+        properties = ["uuid", "index", "hosts"] if cascade_hosts else ["uuid", "index"]
+        docs = list(self.docs_store.query(criteria, properties=properties))
+
+        roots = []
+        if cascade_hosts:
+            roots = list({doc["hosts"][-1] for doc in docs if doc.get("hosts")})
+            for chunk in _chunks(roots, _REMOVE_CHUNK_SIZE):
+                docs.extend(
+                    self.docs_store.query(
+                        {"hosts": {"$in": chunk}}, properties=["uuid", "index"]
+                    )
+                )
+
+        uuids_by_index: dict[int, set[str]] = {}
         for doc in docs:
-            for store in self.additional_stores.values():
-                store.remove_docs({"job_uuid": doc["uuid"], "job_index": doc["index"]})
+            uuids_by_index.setdefault(doc["index"], set()).add(doc["uuid"])
+
+        for store in self.additional_stores.values():
+            for index, uuids in uuids_by_index.items():
+                for chunk in _chunks(list(uuids), _REMOVE_CHUNK_SIZE):
+                    store.remove_docs({"job_uuid": {"$in": chunk}, "job_index": index})
+
         self.docs_store.remove_docs(criteria)
+        for chunk in _chunks(roots, _REMOVE_CHUNK_SIZE):
+            self.docs_store.remove_docs({"hosts": {"$in": chunk}})
+
+    def write_chunks(
+        self, chunks: Iterable, store_name: str, job_uuid: str, job_index: int
+    ) -> ChunkedOutput:
+        """
+        Write the chunks of an output to an additional store one at a time.
+
+        Each chunk is serialized and written to the additional store as soon as it is
+        produced, so only one chunk is held in memory at a time. This is used to store
+        the outputs of jobs that return generators. Chunks left over from a previous
+        write for the same job uuid and index are removed.
+
+        Parameters
+        ----------
+        chunks
+            An iterable of chunks, for example, a generator.
+        store_name
+            The name of the additional store to write the chunks to.
+        job_uuid
+            The uuid of the job the chunks belong to.
+        job_index
+            The index of the job the chunks belong to.
+
+        Returns
+        -------
+        ChunkedOutput
+            A reference to the chunks that can be iterated over to load them.
+        """
+        try:
+            store = self.additional_stores[store_name]
+        except KeyError:
+            store = None
+
+        if store is None:
+            raise ValueError(f"Unrecognised additional store name: {store_name}")
+
+        self._ensure_indexes()
+
+        nchunks = 0
+        for chunk in chunks:
+            doc = {
+                "blob_uuid": _get_chunk_uuid(job_uuid, job_index, nchunks),
+                "job_uuid": job_uuid,
+                "job_index": job_index,
+                "chunk": nchunks,
+                "data": self.serializer.sanitize(chunk),
+            }
+            self._write_docs(store, [doc], key="blob_uuid")
+            nchunks += 1
+
+        # remove any extra chunks written by a previous run of the job
+        store.remove_docs(
+            {"job_uuid": job_uuid, "job_index": job_index, "chunk": {"$gte": nchunks}}
+        )
+
+        output = ChunkedOutput(store_name, job_uuid, job_index, nchunks)
+        output.job_store = self
+        return output
 
     def get_output(
         self,
@@ -451,6 +764,7 @@ class JobStore(Store):
         load: load_type = False,
         cache: dict[str, Any] | None = None,
         on_missing: OnMissing = OnMissing.ERROR,
+        lazy_blobs: bool = False,
     ):
         """
         Get the output of a job UUID.
@@ -480,16 +794,16 @@ class JobStore(Store):
         on_missing
             What to do if the output contains a reference and the reference cannot
             be resolved.
+        lazy_blobs
+            Whether to return the items selected by ``load`` as :obj:`LazyBlob` proxies
+            that are only loaded from the additional stores when accessed.
 
         Returns
         -------
         Any
             The output(s) for the job UUID.
         """
-        from jobflow.core.reference import (
-            find_and_get_references,
-            find_and_resolve_references,
-        )
+        from jobflow.core.reference import find_and_get_references
 
         # TODO: Currently, OnMissing is not respected if a reference cycle is detected
         #       this could be fixed but will require more complicated logic just to
@@ -507,7 +821,7 @@ class JobStore(Store):
                 criteria=criteria,
                 properties=["output"],
                 sort={"index": sort},
-                load=load,
+                load=False if lazy_blobs else load,
             )
 
             if result is None:
@@ -518,8 +832,8 @@ class JobStore(Store):
             if any([ref.uuid == uuid for ref in refs]):
                 raise RuntimeError("Reference cycle detected - aborting.")
 
-            return find_and_resolve_references(
-                result["output"], self, cache=cache, on_missing=on_missing
+            return self._resolve_output(
+                result["output"], load, cache, on_missing, lazy_blobs
             )
         else:
             results = list(
@@ -527,7 +841,7 @@ class JobStore(Store):
                     criteria={"uuid": uuid},
                     properties=["output"],
                     sort={"index": 1},
-                    load=load,
+                    load=False if lazy_blobs else load,
                 )
             )
 
@@ -540,10 +854,58 @@ class JobStore(Store):
             if any([ref.uuid == uuid for ref in refs]):
                 raise RuntimeError("Reference cycle detected - aborting.")
 
+            return self._resolve_output(results, load, cache, on_missing, lazy_blobs)
+
+    def _resolve_output(
+        self,
+        output: Any,
+        load: load_type,
+        cache: dict[str, Any] | None,
+        on_missing: OnMissing,
+        lazy_blobs: bool,
+    ) -> Any:
+        """Resolve the references in an output, optionally inserting lazy proxies."""
+        from jobflow.core.reference import (
+            _resolve_encoded_references,
+            find_and_resolve_references,
+        )
+
+        if not lazy_blobs:
             return find_and_resolve_references(
-                results, self, cache=cache, on_missing=on_missing
+                output, self, cache=cache, on_missing=on_missing
             )
 
+        # the proxies must be inserted before the output is decoded, otherwise blob
+        # references saved by class would be decoded as instances of that class
+        doc = {"output": self._insert_lazy_blobs(output, load)}
+        if _resolve_encoded_references(doc, self, cache=cache, on_missing=on_missing):
+            return self.serializer.decode(doc)["output"]
+        return doc["output"]
+
+    def _insert_lazy_blobs(self, output: Any, load: load_type) -> Any:
+        """Replace the blob references selected by ``load`` with lazy proxies."""
+        from jobflow.utils.find import update_in_dictionary
+
+        load_keys = _prepare_load(load)
+        if load_keys is False:
+            return output
+
+        # wrap the output so that a blob reference at the top level can be replaced
+        doc = {"output": output}
+        locations, all_blobs = _find_blobs(doc)
+        grouped_blobs = _filter_blobs(all_blobs, locations, load_keys)
+
+        proxies = {}
+        for store_name, (blobs, locs) in grouped_blobs.items():
+            if store_name not in self.additional_stores:
+                raise ValueError(f"Unrecognised additional store name: {store_name}")
+
+            for blob, loc in zip(blobs, locs):
+                proxies[tuple(loc)] = LazyBlob(self, store_name, blob["blob_uuid"])
+
+        update_in_dictionary(doc, proxies)
+        return doc["output"]
+
     @classmethod
     def from_file(cls: type[T], db_file: str | Path, **kwargs) -> T:
         """
@@ -651,6 +1013,8 @@ class JobStore(Store):
         """
         import maggma.stores  # required to enable subclass searching
 
+        import jobflow.stores  # noqa: F401
+
         if "docs_store" not in spec:
             raise ValueError("Unrecognised database file format.")
 
@@ -671,6 +1035,228 @@ class JobStore(Store):
         return cls(docs_store, additional_stores, **kwargs)
 
 
+class ChunkedOutput(MSONable):
+    """
+    The output of a job that was written to an additional store in chunks.
+
+    Jobs whose function returns a generator have each item yielded by the generator
+    (a chunk) written to an additional store as it is produced, see
+    :obj:`JobStore.write_chunks`. The output of the job is a :obj:`ChunkedOutput`,
+    which loads the chunks one at a time when iterated over. For example:
+
+    .. code-block:: python
+
+        @job(data=True)
+        def extract(n):
+            for i in range(n):
+                yield [{"record": j} for j in range(i * 1000, (i + 1) * 1000)]
+
+        @job
+        def count(chunks):
+            return sum(len(chunk) for chunk in chunks)
+
+    When a :obj:`ChunkedOutput` is passed to a job through an output reference, the
+    job store is attached automatically. Otherwise, the store can be given using
+    :obj:`ChunkedOutput.iter_chunks`. Single chunks can be loaded by index, e.g.,
+    ``chunks[0]``, which also works on output references.
+
+    Parameters
+    ----------
+    store_name
+        The name of the additional store containing the chunks.
+    job_uuid
+        The uuid of the job that produced the chunks.
+    job_index
+        The index of the job that produced the chunks.
+    nchunks
+        The number of chunks.
+    """
+
+    def __init__(self, store_name: str, job_uuid: str, job_index: int, nchunks: int):
+        self.store_name = store_name
+        self.job_uuid = job_uuid
+        self.job_index = job_index
+        self.nchunks = nchunks
+        self.job_store: JobStore | None = None
+
+    def __len__(self) -> int:
+        """Get the number of chunks."""
+        return self.nchunks
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the chunks, loading them from the store one at a time."""
+        return self.iter_chunks()
+
+    def __getitem__(self, item: int | slice) -> Any:
+        """Load a chunk, or a list of chunks if given a slice."""
+        if isinstance(item, slice):
+            return list(self._load_chunks(range(self.nchunks)[item]))
+
+        if not -self.nchunks <= item < self.nchunks:
+            raise IndexError("ChunkedOutput index out of range")
+        return next(self._load_chunks([item % self.nchunks]))
+
+    def __repr__(self):
+        """Get a string representation of the chunked output."""
+        return (
+            f"ChunkedOutput({self.job_uuid}, {self.job_index}, nchunks={self.nchunks}, "
+            f"store_name={self.store_name!r})"
+        )
+
+    def iter_chunks(self, store: JobStore | None = None) -> Iterator[Any]:
+        """
+        Iterate over the chunks, loading them from the store one at a time.
+
+        Parameters
+        ----------
+        store
+            The job store containing the chunks. If None, the store that was attached
+            when the output was resolved will be used.
+
+        Returns
+        -------
+        Iterator
+            An iterator over the chunks, in the order they were produced.
+        """
+        return self._load_chunks(range(self.nchunks), store)
+
+    def _load_chunks(
+        self, indices: Sequence[int], store: JobStore | None = None
+    ) -> Iterator[Any]:
+        """Load chunks from the store using a single query."""
+        store = store or self.job_store
+        if store is None:
+            raise RuntimeError(
+                "No JobStore is available to load the chunks from. Pass the store to "
+                "ChunkedOutput.iter_chunks."
+            )
+
+        if len(indices) == 0:
+            return
+
+        chunk_uuids = [
+            _get_chunk_uuid(self.job_uuid, self.job_index, i) for i in indices
+        ]
+        blobs = iter(store._query_blobs(self.store_name, chunk_uuids))
+
+        # chunks that the store returns early are kept until the preceding chunks have
+        # been yielded
+        pending: dict[str, dict] = {}
+        for i, chunk_uuid in zip(indices, chunk_uuids):
+            while chunk_uuid not in pending:
+                blob = next(blobs, None)
+                if blob is None:
+                    raise ValueError(
+                        f"Chunk {i} of job {self.job_uuid} ({self.job_index}) is "
+                        "missing."
+                    )
+                pending[blob["blob_uuid"]] = blob
+            yield store.serializer.decode(pending.pop(chunk_uuid)["data"])
+
+
+class LazyBlob:
+    """
+    A proxy for data in an additional store that is only loaded when first accessed.
+
+    Lazy blobs are used in place of the data saved in additional stores when a job is
+    run with ``JobConfig(lazy_blobs=True)``. Attribute access, indexing, iteration,
+    ``len``, ``in`` and equality are forwarded to the data, which is loaded the first
+    time any of these are used. The data itself is available as
+    :obj:`LazyBlob.value`, which should be used where the actual object is required,
+    e.g., for type checks or when passing the data to other libraries.
+
+    Parameters
+    ----------
+    store
+        The job store containing the data.
+    store_name
+        The name of the additional store containing the data.
+    blob_uuid
+        The uuid of the blob.
+    """
+
+    __slots__ = ("_store", "_store_name", "_blob_uuid", "_value", "_loaded")
+
+    def __init__(self, store: JobStore, store_name: str, blob_uuid: str):
+        self._store = store
+        self._store_name = store_name
+        self._blob_uuid = blob_uuid
+        self._value: Any = None
+        self._loaded = False
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the data has been loaded from the store."""
+        return self._loaded
+
+    @property
+    def value(self) -> Any:
+        """The data, loaded from the additional store on first access."""
+        if not self._loaded:
+            blobs = self._store._query_blobs(self._store_name, [self._blob_uuid])
+            blob = next(iter(blobs), None)
+            if blob is None:
+                raise ValueError(
+                    f"Blob {self._blob_uuid} not found in store {self._store_name}."
+                )
+
+            value = self._store.serializer.decode(blob["data"])
+            if isinstance(value, ChunkedOutput):
+                value.job_store = self._store
+            self._value = value
+            self._loaded = True
+        return self._value
+
+    def as_dict(self) -> Any:
+        """Serialize the data, loading it if necessary."""
+        return self._store.serializer.sanitize(self.value)
+
+    def __getattr__(self, name: str) -> Any:
+        """Get an attribute of the data."""
+        if name in LazyBlob.__slots__:
+            # the proxy is not initialised, e.g., during copying
+            raise AttributeError(name)
+        return getattr(self.value, name)
+
+    def __getitem__(self, item: Any) -> Any:
+        """Index the data."""
+        return self.value[item]
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the data."""
+        return iter(self.value)
+
+    def __len__(self) -> int:
+        """Get the length of the data."""
+        return len(self.value)
+
+    def __contains__(self, item: Any) -> bool:
+        """Check whether the data contains an item."""
+        return item in self.value
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the data to another object."""
+        if isinstance(other, LazyBlob):
+            other = other.value
+        return self.value == other
+
+    def __bool__(self) -> bool:
+        """Get the truth value of the data."""
+        return bool(self.value)
+
+    def __repr__(self) -> str:
+        """Get a string representation of the proxy."""
+        if self._loaded:
+            return f"LazyBlob({self._value!r})"
+        return f"LazyBlob({self._store_name!r}, {self._blob_uuid!r})"
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def _get_chunk_uuid(job_uuid: str, job_index: int, chunk: int) -> str:
+    return f"{job_uuid}-{job_index}-chunk-{chunk}"
+
+
 def _construct_store(spec_dict, valid_stores):
     """Parse the dict containing {"type": <StoreType>} recursively."""
     store_type = spec_dict.pop("type")
@@ -680,6 +1266,75 @@ def _construct_store(spec_dict, valid_stores):
     return valid_stores[store_type](**spec_dict)
 
 
+def _chunks(items: list, size: int) -> Iterator[list]:
+    """Split a list into chunks of at most ``size`` items."""
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def _first_and_rest(iterator: Iterator) -> Iterator:
+    """Evaluate the first item of an iterator so that errors are raised eagerly."""
+    from itertools import chain
+
+    iterator = iter(iterator)
+    try:
+        first = next(iterator)
+    except StopIteration:
+        return iter(())
+    return chain([first], iterator)
+
+
+def _ensure_compound_index(store: Store, keys: list[str]) -> bool:
+    """
+    Create (or verify) an index on one or more keys of a store.
+
+    If the store is backed by a Mongo-like collection a compound index is created,
+    otherwise the store's own ``ensure_index`` is used for each key.
+
+    Parameters
+    ----------
+    store
+        A connected maggma store.
+    keys
+        The keys to index, in order.
+
+    Returns
+    -------
+    bool
+        Whether the index exists or was created.
+    """
+    try:
+        collection = store._collection
+    except Exception:
+        collection = None
+
+    try:
+        if not hasattr(collection, "create_index"):
+            return all([store.ensure_index(key) for key in keys])
+
+        # creating indexes needs more permissions than reading them, so check first
+        for info in collection.index_information().values():
+            if [k for k, _ in info["key"]][: len(keys)] == keys:
+                return True
+        collection.create_index([(key, 1) for key in keys], background=True)
+        return True
+    except Exception as e:
+        logger.warning(f"Could not create index on {keys} in {store.name}: {e}")
+        return False
+
+
+def _get_size(data: Any) -> int:
+    """Estimate the number of bytes needed to store an object."""
+    import json
+
+    from bson import encode
+
+    try:
+        return len(encode({"data": data}))
+    except Exception:
+        return len(json.dumps(data, default=str))
+
+
 def _prepare_load(
     load: load_type,
 ) -> bool | dict[str, bool | list[str | tuple[str, str]]]:
@@ -730,6 +1385,26 @@ def _prepare_save(
     return new_save
 
 
+def _is_chunked_output(obj: Any) -> bool:
+    """Whether an object is a serialized :obj:`ChunkedOutput`."""
+    return (
+        isinstance(obj, dict)
+        and obj.get("@class") == "ChunkedOutput"
+        and obj.get("@module") == ChunkedOutput.__module__
+    )
+
+
+def _find_blobs(doc: dict) -> tuple[list[list[Any]], list[dict]]:
+    """Find the locations of the blob references in a document and the references."""
+    from jobflow.utils.find import iter_matches
+
+    locations, blobs = [], []
+    for _, loc, blob in iter_matches(doc, {None: lambda d: "blob_uuid" in d}, False):
+        locations.append(loc)
+        blobs.append(blob)
+    return locations, blobs
+
+
 def _filter_blobs(
     blob_infos: list[dict],
     locations: list[list[Any]],
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 import typing
 
 from fireworks import FiretaskBase, Firework, FWAction, Workflow, explicit_serialize
@@ -11,12 +12,27 @@ if typing.TYPE_CHECKING:
 
     import jobflow
 
-__all__ = ["flow_to_workflow", "job_to_firework", "JobFiretask"]
+__all__ = [
+    "flow_to_workflow",
+    "job_to_firework",
+    "JobFiretask",
+    "STORE_METADATA_KEY",
+    "get_cached_store",
+    "clear_store_cache",
+]
+
+#: Key of the workflow metadata used to store the job store, when the store is shared
+#: by all fireworks in the workflow.
+STORE_METADATA_KEY = "jobflow_store"
+
+_STORE_CACHE: dict[tuple[int, str], jobflow.JobStore] = {}
+_STORE_CACHE_LOCK = threading.Lock()
 
 
 def flow_to_workflow(
     flow: jobflow.Flow | jobflow.Job | list[jobflow.Job],
     store: jobflow.JobStore | None = None,
+    store_in_metadata: bool = False,
     **kwargs,
 ) -> Workflow:
     """
@@ -26,6 +42,9 @@ def flow_to_workflow(
     :obj:`Job.config.manager_config` dictionary. Accordingly, a :obj:`.JobConfig` object
     can be used to configure FireWork options such as metadata and the fireworker.
 
+    The links between fireworks are generated directly from the flow graph, so the
+    fireworks in the returned workflow do not have their ``parents`` attribute set.
+
     Parameters
     ----------
     flow
@@ -35,6 +54,11 @@ def flow_to_workflow(
         will be used. Note, this could be different on the computer that submits the
         workflow and the computer which runs the workflow. The value of ``JOB_STORE`` on
         the computer that runs the workflow will be used.
+    store_in_metadata
+        Whether to save the store once in the workflow metadata (under the
+        :obj:`STORE_METADATA_KEY` key) rather than in every firework. This reduces the
+        size of large workflows, at the cost of one extra query to the LaunchPad when
+        each firework is run. Has no effect if ``store`` is None.
     **kwargs
         Keyword arguments passed to Workflow init method.
 
@@ -43,20 +67,49 @@ def flow_to_workflow(
     Workflow
         The job or flow as a workflow.
     """
-    from fireworks.core.firework import Firework, Workflow
-
     from jobflow.core.flow import get_flow
 
-    parent_mapping: dict[str, Firework] = {}
-    fireworks = []
-
     flow = get_flow(flow)
+    return _flows_to_workflow(
+        [flow], store, store_in_metadata, name=flow.name, **kwargs
+    )
 
-    for job, parents in flow.iterflow():
-        fw = job_to_firework(job, store, parents=parents, parent_mapping=parent_mapping)
-        fireworks.append(fw)
 
-    return Workflow(fireworks, name=flow.name, **kwargs)
+def _flows_to_workflow(
+    flows: list[jobflow.Flow],
+    store: jobflow.JobStore | None,
+    store_in_metadata: bool = False,
+    **kwargs,
+) -> Workflow:
+    """
+    Convert several flows into a single FireWorks workflow.
+
+    The flows share one mapping from job uuids to fireworks, so the graph of each flow
+    is only traversed once and the links between all fireworks are built together.
+    See :obj:`flow_to_workflow` for details on the parameters.
+    """
+    from fireworks.core.firework import Workflow
+
+    store_in_metadata = store_in_metadata and store is not None
+
+    fw_ids: dict[str, int] = {}
+    links: dict[int, list[int]] = {}
+    fireworks = []
+    for flow in flows:
+        for job, parents in flow.iterflow():
+            fw = job_to_firework(job, store, store_in_metadata=store_in_metadata)
+            fireworks.append(fw)
+            fw_ids[job.uuid] = fw.fw_id
+            links[fw.fw_id] = []
+            for parent in parents:
+                links[fw_ids[parent]].append(fw.fw_id)
+
+    if store_in_metadata:
+        metadata = dict(kwargs.pop("metadata", None) or {})
+        metadata[STORE_METADATA_KEY] = store.as_dict()  # type: ignore[union-attr]
+        kwargs["metadata"] = metadata
+
+    return Workflow(fireworks, links_dict=links, **kwargs)
 
 
 def job_to_firework(
@@ -64,6 +117,7 @@ def job_to_firework(
     store: jobflow.JobStore | None = None,
     parents: Sequence[str] | None = None,
     parent_mapping: dict[str, Firework] | None = None,
+    store_in_metadata: bool = False,
     **kwargs,
 ) -> Firework:
     """
@@ -86,6 +140,10 @@ def job_to_firework(
         The parent uuids of the job.
     parent_mapping
         A dictionary mapping job uuids to Firework objects, as ``{uuid: Firework}``.
+    store_in_metadata
+        Whether the store will be saved in the metadata of the workflow containing
+        the firework, rather than in the firework itself. See
+        :obj:`flow_to_workflow`.
     **kwargs
         Keyword arguments passed to the Firework constructor.
 
@@ -101,7 +159,10 @@ def job_to_firework(
     if (parents is None) is not (parent_mapping is None):
         raise ValueError("Both or neither of parents and parent_mapping must be set.")
 
-    task = JobFiretask(job=job, store=store)
+    if store_in_metadata:
+        task = JobFiretask(job=job, store=None, store_in_metadata=True)
+    else:
+        task = JobFiretask(job=job, store=store)
 
     job_parents = None
     if parents is not None and parent_mapping is not None:
@@ -123,6 +184,49 @@ def job_to_firework(
     return fw
 
 
+def get_cached_store(store: jobflow.JobStore) -> jobflow.JobStore:
+    """
+    Get a connected job store, reusing a previous connection if possible.
+
+    Stores are cached for the lifetime of the process and keyed by their serialized
+    specification. Each firework deserializes its own copy of the store, so without
+    the cache every job in a worker (e.g., when using ``rlaunch rapidfire``) would open
+    new database clients. Stores are not shared with forked processes.
+
+    Parameters
+    ----------
+    store
+        A job store.
+
+    Returns
+    -------
+    JobStore
+        A connected job store with the same specification as ``store``. This will be
+        ``store`` itself if no matching store has been connected yet.
+    """
+    import json
+    import os
+
+    key = (os.getpid(), json.dumps(store.as_dict(), sort_keys=True, default=str))
+    with _STORE_CACHE_LOCK:
+        cached_store = _STORE_CACHE.get(key)
+        if cached_store is None:
+            store.connect()
+            _STORE_CACHE[key] = cached_store = store
+    return cached_store
+
+
+def clear_store_cache():
+    """Close and remove all job stores cached by :obj:`get_cached_store`."""
+    import os
+
+    with _STORE_CACHE_LOCK:
+        for (pid, _), store in _STORE_CACHE.items():
+            if pid == os.getpid():
+                store.close()
+        _STORE_CACHE.clear()
+
+
 @explicit_serialize
 class JobFiretask(FiretaskBase):
     """
@@ -136,44 +240,70 @@ class JobFiretask(FiretaskBase):
         A job store. Alternatively, if set to None, :obj:`JobflowSettings.JOB_STORE`
         will be used. Note, this could be different on the computer that submits the
         workflow and the computer which runs the workflow. The value of ``JOB_STORE`` on
-        the computer that runs the workflow will be used.
+        the computer that runs the workflow will be used. Connections to the store are
+        reused between fireworks run by the same process, see
+        :obj:`get_cached_store`.
+    store_in_metadata : bool
+        Whether to load the store from the metadata of the workflow containing this
+        firework instead of ``store``. See :obj:`flow_to_workflow`.
     """
 
     required_params = ["job", "store"]
+    optional_params = ["store_in_metadata"]
 
     def run_task(self, fw_spec):
         """Run the job and handle any dynamic firework submissions."""
+        import time
+
         from jobflow import SETTINGS, initialize_logger
+        from jobflow.core.hooks import call_hooks
         from jobflow.core.job import Job
 
         job: Job = self.get("job")
         store = self.get("store")
 
-        if store is None:
+        store_in_metadata = self.get("store_in_metadata", False)
+        if store_in_metadata:
+            store = get_cached_store(self._get_workflow_store())
+        elif store is None:
             store = SETTINGS.JOB_STORE
-        store.connect()
+            store.connect()
+        else:
+            store = get_cached_store(store)
 
         if hasattr(self, "fw_id"):
             job.metadata.update({"fw_id": self.fw_id})
 
         initialize_logger()
+        call_hooks("on_run_start", manager="fireworks", flow=job, store=store)
+        start_time = time.perf_counter()
         response = job.run(store=store)
 
+        # create workflows from the new jobs; be sure to use the original store. If the
+        # store is in the workflow metadata, the new fireworks will find it there once
+        # they are appended to the workflow. The replacement and detour are combined
+        # into a single workflow so that FireWorks appends them in one operation, the
+        # leaves of both are connected to the children of this firework either way
+        wf_store = store if store_in_metadata else self.get("store")
+
         detours = None
         additions = None
-        if response.replace is not None:
-            # create a workflow from the new additions; be sure to use original store
-            detours = [flow_to_workflow(response.replace, self.get("store"))]
+        detour_flows = [
+            flow for flow in (response.replace, response.detour) if flow is not None
+        ]
+        if detour_flows:
+            detours = [
+                _flows_to_workflow(
+                    detour_flows, wf_store, store_in_metadata, name=job.name
+                )
+            ]
 
         if response.addition is not None:
-            additions = [flow_to_workflow(response.addition, self.get("store"))]
-
-        if response.detour is not None:
-            detour_wf = flow_to_workflow(response.detour, self.get("store"))
-            if detours is not None:
-                detours.append(detour_wf)
-            else:
-                detours = [detour_wf]
+            additions = [
+                _flows_to_workflow(
+                    [response.addition], wf_store, store_in_metadata, name=job.name
+                )
+            ]
 
         fwa = FWAction(
             stored_data=response.stored_data,
@@ -182,4 +312,29 @@ class JobFiretask(FiretaskBase):
             defuse_workflow=response.stop_jobflow,
             defuse_children=response.stop_children,
         )
+
+        duration = time.perf_counter() - start_time
+        call_hooks(
+            "on_run_end", manager="fireworks", flow=job, store=store, duration=duration
+        )
         return fwa
+
+    def _get_workflow_store(self) -> jobflow.JobStore:
+        """Load the job store from the metadata of the workflow."""
+        from jobflow.core.store import JobStore
+
+        launchpad = getattr(self, "launchpad", None)
+        if launchpad is None or not hasattr(self, "fw_id"):
+            raise RuntimeError(
+                "The store is saved in the workflow metadata but the LaunchPad is not "
+                "available. Make sure _add_launchpad_and_fw_id is set in the spec."
+            )
+
+        wf = launchpad.workflows.find_one(
+            {"nodes": self.fw_id}, {f"metadata.{STORE_METADATA_KEY}": 1}
+        )
+        if wf is None or STORE_METADATA_KEY not in wf.get("metadata", {}):
+            raise RuntimeError(
+                f"No job store found in workflow of firework {self.fw_id}"
+            )
+        return JobStore.from_dict(wf["metadata"][STORE_METADATA_KEY])
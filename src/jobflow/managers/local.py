@@ -6,7 +6,8 @@ import logging
 import typing
 
 if typing.TYPE_CHECKING:
-    pass
+    from concurrent.futures import Future
+    from typing import Any, Sequence
 
     import jobflow
 
@@ -21,6 +22,8 @@ def run_locally(
     store: jobflow.JobStore | None = None,
     create_folders: bool = False,
     ensure_success: bool = False,
+    batch_size: int = 1,
+    prefetch: int = 0,
 ) -> dict[str, dict[int, jobflow.Response]]:
     """
     Run a :obj:`Job` or :obj:`Flow` locally.
@@ -39,12 +42,33 @@ def run_locally(
         Whether to run each job in a new folder.
     ensure_success
         Raise an error if the flow was not executed successfully.
+    batch_size
+        The maximum number of jobs to run as a single execution unit. Consecutive jobs
+        that share the same function and config and that do not depend on each other
+        are grouped into batches, run one after another, and have their outputs written
+        to the store in bulk (see :obj:`.run_batch`). Any replace, detour or addition
+        flows are only run once the whole batch has finished. The default of 1 disables
+        batching. Batching is not performed if ``create_folders`` is set. The gain is
+        modest as most of the time is spent running and resolving each job, for
+        example, 1000 trivial jobs with a :obj:`.SQLiteStore` took 1.7 s with
+        ``batch_size=1`` and 1.1-1.3 s with ``batch_size=50``.
+    prefetch
+        The number of upcoming jobs whose inputs are fetched in a background thread
+        while the current job runs. Only the outputs of jobs that have already finished
+        can be prefetched, for example, if job C depends on jobs A and B, the output of
+        A is loaded while B is running. The fetched outputs are passed to the job as
+        its reference cache, so that resolving references overlaps with the
+        computation. The store must support being accessed from multiple threads;
+        prefetching is disabled with a warning for stores that do not, such as maggma
+        ``MemoryStore``. The default of 0 disables prefetching.
 
     Returns
     -------
     Dict[str, Dict[int, Response]]
         The responses of the jobs, as a dict of ``{uuid: {index: response}}``.
     """
+    import time
+    import warnings
     from collections import defaultdict
     from datetime import datetime
     from pathlib import Path
@@ -54,6 +78,8 @@ def run_locally(
 
     from jobflow import SETTINGS, initialize_logger
     from jobflow.core.flow import get_flow
+    from jobflow.core.hooks import call_hooks
+    from jobflow.core.job import run_batch
     from jobflow.core.reference import OnMissing
 
     if store is None:
@@ -70,32 +96,48 @@ def run_locally(
     errored: set[str] = set()
     responses: dict[str, dict[int, jobflow.Response]] = defaultdict(dict)
     stop_jobflow = False
+    use_batches = batch_size > 1 and not create_folders
 
     root_dir = Path.cwd()
+    prefetcher = None
+    if prefetch > 0:
+        if _is_thread_safe(store):
+            prefetcher = _Prefetcher(store, responses)
+        else:
+            warnings.warn(
+                f"Prefetching is disabled as {store.name} cannot be shared between "
+                "threads.",
+                stacklevel=2,
+            )
 
-    def _run_job(job: jobflow.Job, parents):
-        nonlocal stop_jobflow
-
-        if stop_jobflow:
-            return False
-
+    def _skip_job(job: jobflow.Job, parents) -> bool:
         if len(set(parents).intersection(stopped_parents)) > 0:
             # stop children has been called for one of the jobs' parents
             logger.info(
                 f"{job.name} is a child of a job with stop_children=True, skipping..."
             )
             stopped_parents.add(job.uuid)
-            return
+            return True
 
         if (
             len(set(parents).intersection(errored)) > 0
             and job.config.on_missing_references == OnMissing.ERROR
         ):
             errored.add(job.uuid)
+            return True
+
+        return False
+
+    def _run_job(job: jobflow.Job, parents):
+        if stop_jobflow:
+            return False
+
+        if _skip_job(job, parents):
             return
 
+        cache = None if prefetcher is None else prefetcher.get_cache([job])
         try:
-            response = job.run(store=store)
+            response = job.run(store=store, cache=cache)
         except Exception:
             import traceback
 
@@ -103,6 +145,34 @@ def run_locally(
             errored.add(job.uuid)
             return
 
+        return _process_response(job, response)
+
+    def _run_batch(batch: list[jobflow.Job]):
+        import traceback
+
+        response = None
+        cache = None if prefetcher is None else prefetcher.get_cache(batch)
+        for job, result in zip(batch, run_batch(batch, store, cache=cache)):
+            if isinstance(result, Exception):
+                error = "".join(
+                    traceback.format_exception(
+                        type(result), result, result.__traceback__
+                    )
+                )
+                logger.info(f"{job.name} failed with exception:\n{error}")
+                errored.add(job.uuid)
+                response = None
+                continue
+
+            response = _process_response(job, result)
+            if response is False:
+                return False
+
+        return response
+
+    def _process_response(job: jobflow.Job, response: jobflow.Response):
+        nonlocal stop_jobflow
+
         responses[job.uuid][job.index] = response
 
         if response.stored_data is not None:
@@ -138,22 +208,179 @@ def run_locally(
         else:
             return root_dir
 
+    def _can_batch(batch: list[jobflow.Job], job: jobflow.Job, parents) -> bool:
+        return (
+            len(batch) < batch_size
+            and job.function == batch[0].function
+            and job.config == batch[0].config
+            and not any(b.uuid in parents for b in batch)
+        )
+
     def _run(root_flow):
         job: jobflow.Job
-        for job, parents in root_flow.iterflow():
-            job_dir = _get_job_dir()
-            with cd(job_dir):
-                response = _run_job(job, parents)
+        response = None
+        batch: list[jobflow.Job] = []
+        items = list(root_flow.iterflow())
+        for i, (job, parents) in enumerate(items):
+            if prefetcher is not None:
+                prefetcher.schedule([j for j, _ in items[i + 1 : i + 1 + prefetch]])
+
+            if not use_batches:
+                job_dir = _get_job_dir()
+                with cd(job_dir):
+                    response = _run_job(job, parents)
+                if response is False:
+                    return False
+                continue
+
+            if len(batch) > 0 and not _can_batch(batch, job, parents):
+                response = _run_batch(batch)
+                batch = []
+                if response is False:
+                    return False
+
+            if stop_jobflow:
+                return False
+
+            if _skip_job(job, parents):
+                response = None
+            else:
+                batch.append(job)
+
+        if len(batch) > 0:
+            response = _run_batch(batch)
             if response is False:
                 return False
 
         return response is not None
 
     logger.info("Started executing jobs locally")
-    finished_successfully = _run(flow)
+    call_hooks("on_run_start", manager="local", flow=flow, store=store)
+    start_time = time.perf_counter()
+    try:
+        finished_successfully = _run(flow)
+    finally:
+        if prefetcher is not None:
+            prefetcher.shutdown()
+    duration = time.perf_counter() - start_time
+    call_hooks("on_run_end", manager="local", flow=flow, store=store, duration=duration)
     logger.info("Finished executing jobs locally")
 
     if ensure_success and not finished_successfully:
         raise RuntimeError("Flow did not finish running successfully")
 
     return dict(responses)
+
+
+class _Prefetcher:
+    """
+    Fetch the outputs referenced by upcoming jobs in a background thread.
+
+    Outputs are fetched for each job separately and are discarded once the job has
+    been run, so the memory used is bounded by the number of jobs scheduled ahead.
+
+    Parameters
+    ----------
+    store
+        The job store to load outputs from.
+    finished
+        A mapping whose keys are the uuids of the jobs that have finished running.
+    """
+
+    def __init__(self, store: jobflow.JobStore, finished: dict[str, Any]):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.store = store
+        self.finished = finished
+        self.executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="jobflow-prefetch"
+        )
+        self.futures: dict[str, Future] = {}
+
+    def schedule(self, jobs: Sequence[jobflow.Job]):
+        """Start fetching the finished inputs of jobs that are not already scheduled."""
+        for job in jobs:
+            if job.uuid in self.futures or not job.config.resolve_references:
+                continue
+
+            uuids = [uuid for uuid in job.input_uuids if uuid in self.finished]
+            if len(uuids) > 0:
+                self.futures[job.uuid] = self.executor.submit(
+                    self._fetch, job.uuid, set(uuids), job.config.on_missing_references
+                )
+
+    def get_cache(self, jobs: Sequence[jobflow.Job]) -> dict[str, dict[int, Any]]:
+        """
+        Get a reference cache containing the outputs prefetched for jobs.
+
+        Waits for any prefetches of the jobs that are still running.
+        """
+        cache: dict[str, dict[int, Any]] = {}
+        for job in jobs:
+            future = self.futures.pop(job.uuid, None)
+            if future is not None:
+                # copy the index dictionaries as decoded outputs are cached in-place
+                cache.update({k: dict(v) for k, v in future.result().items()})
+        return cache
+
+    def shutdown(self):
+        """Stop the background thread, discarding any pending prefetches."""
+        for future in self.futures.values():
+            future.cancel()
+        self.executor.shutdown(wait=True)
+        self.futures.clear()
+
+    def _fetch(
+        self, job_uuid: str, uuids: set[str], on_missing
+    ) -> dict[str, dict[int, Any]]:
+        """Load the outputs needed by a job in the background thread."""
+        from jobflow.stores.instrumented import InstrumentedJobStore
+
+        # record the queries against the job being prefetched for, rather than the
+        # job currently running in the main thread
+        if isinstance(self.store, InstrumentedJobStore):
+            with self.store.attribute_to(job_uuid):
+                return self._fetch_outputs(uuids, on_missing)
+        return self._fetch_outputs(uuids, on_missing)
+
+    def _fetch_outputs(self, uuids: set[str], on_missing) -> dict[str, dict[int, Any]]:
+        """Load the latest output of each job, skipping any that cannot be loaded."""
+        outputs: dict[str, dict[int, Any]] = {}
+        for uuid in uuids:
+            try:
+                result = self.store.query_one(
+                    {"uuid": uuid}, ["index"], sort={"index": -1}
+                )
+                if result is not None:
+                    outputs[uuid] = {
+                        result["index"]: self.store.get_output(
+                            uuid,
+                            which=result["index"],
+                            load=True,
+                            on_missing=on_missing,
+                        )
+                    }
+            except Exception:
+                # the job will report the error when it resolves its own references
+                logger.debug(f"Could not prefetch output of {uuid}", exc_info=True)
+        return outputs
+
+
+def _is_thread_safe(store: jobflow.JobStore) -> bool:
+    """
+    Check whether a job store can be queried from a background thread.
+
+    Stores backed by mongomock (maggma ``MemoryStore`` and its subclasses) cannot be
+    used from multiple threads. Additional stores that are created on demand (e.g., the
+    default job store) are assumed to be memory stores.
+    """
+    from collections import defaultdict
+
+    from maggma.stores import MemoryStore
+
+    additional_stores = store.additional_stores
+    if isinstance(additional_stores, defaultdict) and additional_stores.default_factory:
+        return False
+
+    stores = [store.docs_store, *additional_stores.values()]
+    return not any(isinstance(s, MemoryStore) for s in stores)
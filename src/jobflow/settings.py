@@ -1,12 +1,13 @@
 """Settings for jobflow."""
 
 from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
-from maggma.stores import MemoryStore
 from pydantic import BaseSettings, Field, root_validator
 
-from jobflow import JobStore
+from jobflow.core.store import JobStore
 
 DEFAULT_CONFIG_FILE_PATH = Path("~/.jobflow.yaml").expanduser().as_posix()
 
@@ -19,11 +20,23 @@ def _default_additional_store():
     This is a private function used for the additional_stores in
     the default JOB_STORE.
     """
+    from maggma.stores import MemoryStore
+
     mem_store = MemoryStore()
     mem_store.connect()
     return mem_store
 
 
+def _default_job_store():
+    """Create the default JobStore, using MemoryStores for all documents."""
+    from maggma.stores import MemoryStore
+
+    return JobStore(
+        MemoryStore(),
+        additional_stores=defaultdict(lambda: _default_additional_store()),
+    )
+
+
 class JobflowSettings(BaseSettings):
     """
     Settings for jobflow.
@@ -94,6 +107,14 @@ class JobflowSettings(BaseSettings):
               port: 27017
               key: blob_uuid
 
+    SQLiteStore example, for a persistent store without a database server:
+
+    .. code-block:: yaml
+
+        docs_store:
+          type: SQLiteStore
+          database: /path/to/jobflow.db
+          collection_name: outputs
 
     Lastly, the store can be specified as a file name that points to a file containing
     the credentials in any format supported by :obj:`.JobStore.from_file`.
@@ -105,10 +126,7 @@ class JobflowSettings(BaseSettings):
 
     # general settings
     JOB_STORE: JobStore = Field(
-        default_factory=lambda: JobStore(
-            MemoryStore(),
-            additional_stores=defaultdict(lambda: _default_additional_store()),
-        ),
+        default_factory=lambda: _default_job_store(),
         description="Default JobStore to use when running locally or using FireWorks. "
         "See the :obj:`JobflowSettings` docstring for more details on the "
         "accepted formats.",
@@ -117,6 +135,12 @@ class JobflowSettings(BaseSettings):
         "%Y-%m-%d-%H-%M-%S-%f",
         description="Date stamp format used to create directories",
     )
+    CHECK_FLOW_OR_JOB: bool = Field(
+        True,
+        description="Whether to warn if a Flow or Job is used as the input of a Job or "
+        "the output of a Flow, rather than its output. Disabling the check speeds up "
+        "creating large flows.",
+    )
 
     class Config:
         """Pydantic config settings."""
@@ -151,3 +175,44 @@ class JobflowSettings(BaseSettings):
 
         new_values.update(values)
         return new_values
+
+
+def _get_setting(name: str) -> Any:
+    """
+    Get a single setting without creating ``jobflow.SETTINGS``.
+
+    If the settings have already been created, the value is taken from them so that
+    changes made at runtime are respected. Otherwise, only the environment variables
+    and config file are read, so the job store is not created just to read a flag.
+    """
+    import jobflow
+
+    settings = vars(jobflow).get("SETTINGS")
+    if settings is not None:
+        return getattr(settings, name)
+    return _read_setting(name)
+
+
+@lru_cache(maxsize=None)
+def _read_setting(name: str) -> Any:
+    """Read a setting from the environment or config file, without other settings."""
+    import os
+
+    from monty.serialization import loadfn
+
+    env = {k.lower(): v for k, v in os.environ.items()}
+    prefix = JobflowSettings.Config.env_prefix
+    config_file = env.get(f"{prefix}config_file", DEFAULT_CONFIG_FILE_PATH)
+
+    field = JobflowSettings.__fields__[name]
+    if f"{prefix}{name.lower()}" in env:
+        value = env[f"{prefix}{name.lower()}"]
+    elif Path(config_file).exists():
+        value = (loadfn(config_file) or {}).get(name, field.get_default())
+    else:
+        return field.get_default()
+
+    value, errors = field.validate(value, {}, loc=name)
+    if errors:
+        raise ValueError(f"Invalid value for jobflow setting {name}: {errors}")
+    return value
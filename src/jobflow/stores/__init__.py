@@ -0,0 +1,4 @@
+"""Additional maggma stores tuned for jobflow."""
+
+from jobflow.stores.instrumented import InstrumentedJobStore
+from jobflow.stores.sqlite import SQLiteStore
@@ -0,0 +1,343 @@
+"""A JobStore that records query and byte statistics."""
+
+from __future__ import annotations
+
+import typing
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from jobflow.core.store import JobStore, _get_size
+
+if typing.TYPE_CHECKING:
+    from typing import Any, Iterator
+
+    from maggma.core import Store
+
+    from jobflow.core.store import load_type, save_type
+    from jobflow.utils.serialization import Serializer
+
+__all__ = ["InstrumentedJobStore", "StoreStats", "OperationStats", "LATENCY_BUCKETS"]
+
+#: Upper bounds (in seconds) of the buckets of the latency histograms.
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, float("inf"))
+
+
+@dataclass
+class OperationStats:
+    """
+    Statistics for a single type of store operation.
+
+    Parameters
+    ----------
+    calls
+        The number of calls.
+    docs
+        The number of documents returned (or written for ``update``).
+    time
+        The total time spent in the operation, in seconds.
+    histogram
+        The number of calls with a latency in each of the :obj:`LATENCY_BUCKETS`.
+    """
+
+    calls: int = 0
+    docs: int = 0
+    time: float = 0.0
+    histogram: list[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+
+    def record(self, duration: float, docs: int):
+        """Record a call of the operation."""
+        from bisect import bisect_left
+
+        self.calls += 1
+        self.docs += docs
+        self.time += duration
+        self.histogram[bisect_left(LATENCY_BUCKETS, duration)] += 1
+
+
+@dataclass
+class StoreStats:
+    """
+    Statistics for the operations performed on a :obj:`InstrumentedJobStore`.
+
+    Parameters
+    ----------
+    operations
+        The statistics for each type of operation (e.g., ``query`` or ``get_output``).
+        Only the operations called directly are recorded, for example the
+        ``query_one`` used inside ``get_output`` is not counted.
+    bytes_read
+        The estimated size of all documents returned, including any data loaded from
+        the additional stores.
+    bytes_written
+        The estimated size of all documents written to the docs and additional stores.
+    blob_fetches
+        The number of queries made to the additional stores.
+    blobs_read
+        The number of blobs loaded from the additional stores.
+    """
+
+    operations: dict[str, OperationStats] = field(default_factory=dict)
+    bytes_read: int = 0
+    bytes_written: int = 0
+    blob_fetches: int = 0
+    blobs_read: int = 0
+
+    @property
+    def queries(self) -> int:
+        """The number of read operations."""
+        return sum(
+            op.calls for name, op in self.operations.items() if name in _READ_OPERATIONS
+        )
+
+    @property
+    def docs_read(self) -> int:
+        """The number of documents returned by read operations."""
+        return sum(
+            op.docs for name, op in self.operations.items() if name in _READ_OPERATIONS
+        )
+
+    def record_operation(self, name: str, duration: float, docs: int):
+        """Record a call of an operation."""
+        if name not in self.operations:
+            self.operations[name] = OperationStats()
+        self.operations[name].record(duration, docs)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get the statistics as a dictionary."""
+        from dataclasses import asdict
+
+        stats = asdict(self)
+        stats.update(queries=self.queries, docs_read=self.docs_read)
+        return stats
+
+
+_READ_OPERATIONS = ("query", "query_one", "get_output", "count", "groupby")
+
+
+class InstrumentedJobStore(JobStore):
+    """
+    A :obj:`.JobStore` that records statistics on how the store is used.
+
+    The number of calls, documents and a latency histogram is recorded for each
+    operation, along with the number of blobs fetched from the additional stores and
+    the bytes read and written. Statistics are kept for the store as a whole
+    (:obj:`InstrumentedJobStore.stats`) and for each job that accessed the store
+    (:obj:`InstrumentedJobStore.job_stats`, keyed by job uuid). Operations are
+    attributed to the job in ``CURRENT_JOB``, unless set otherwise for the current
+    thread using :obj:`InstrumentedJobStore.attribute_to`. Use
+    :obj:`InstrumentedJobStore.reset_stats` to start recording a new run.
+
+    Sizes are estimated by encoding documents as BSON, so instrumentation adds some
+    overhead to every operation.
+
+    Parameters
+    ----------
+    docs_store
+        Store for basic documents.
+    additional_stores
+        Additional stores to use for storing large data/specific objects.
+    save
+        Which items to save in additional stores when uploading documents.
+    load
+        Which items to load from additional stores when querying documents.
+    ensure_indexes
+        Whether to create (or verify) the indexes used by jobflow before the first
+        write.
+    serializer
+        The :obj:`.Serializer` used to convert outputs to documents and back.
+
+    See Also
+    --------
+    .JobStore
+    """
+
+    def __init__(
+        self,
+        docs_store: Store,
+        additional_stores: dict[str, Store] | None = None,
+        save: save_type = None,
+        load: load_type = False,
+        ensure_indexes: bool = True,
+        serializer: Serializer | None = None,
+    ):
+        super().__init__(
+            docs_store,
+            additional_stores=additional_stores,
+            save=save,
+            load=load,
+            ensure_indexes=ensure_indexes,
+            serializer=serializer,
+        )
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Reset all recorded statistics."""
+        import threading
+
+        self.stats = StoreStats()
+        self.job_stats: dict[str, StoreStats] = {}
+        self._local = threading.local()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get the recorded statistics as a dictionary.
+
+        Returns
+        -------
+        dict
+            A dictionary with the keys ``"total"``, containing the statistics for the
+            whole store, and ``"jobs"``, containing the statistics for each job.
+        """
+        return {
+            "total": self.stats.as_dict(),
+            "jobs": {uuid: s.as_dict() for uuid, s in self.job_stats.items()},
+        }
+
+    def query(self, *args, **kwargs) -> Iterator[dict]:
+        """Query the JobStore for documents. See :obj:`.JobStore.query`."""
+        docs = super().query(*args, **kwargs)
+        return docs if self._depth > 0 else self._record_iter("query", docs)
+
+    def groupby(self, *args, **kwargs) -> Iterator[tuple[dict, list[dict]]]:
+        """Group documents by keys. See :obj:`.JobStore.groupby`."""
+        groups = super().groupby(*args, **kwargs)
+        return groups if self._depth > 0 else self._record_iter("groupby", groups)
+
+    def query_one(self, *args, **kwargs):
+        """Query the JobStore for a single document. See :obj:`.JobStore.query_one`."""
+        return self._record_call("query_one", super().query_one, *args, **kwargs)
+
+    def get_output(self, *args, **kwargs):
+        """Get the output of a job. See :obj:`.JobStore.get_output`."""
+        return self._record_call("get_output", super().get_output, *args, **kwargs)
+
+    def count(self, *args, **kwargs) -> int:
+        """Count the documents matching a query. See :obj:`.JobStore.count`."""
+        return self._record_call("count", super().count, *args, **kwargs)
+
+    def update(self, docs, *args, **kwargs):
+        """Update or insert documents. See :obj:`.JobStore.update`."""
+        ndocs = len(docs) if isinstance(docs, list) else 1
+        self._record_call("update", super().update, docs, *args, ndocs=ndocs, **kwargs)
+
+    def remove_docs(self, *args, **kwargs):
+        """Remove documents matching a query. See :obj:`.JobStore.remove_docs`."""
+        self._record_call("remove_docs", super().remove_docs, *args, ndocs=0, **kwargs)
+
+    def _query_blobs(self, store_name: str, blob_uuids: list[str]) -> Iterator[dict]:
+        blobs = list(super()._query_blobs(store_name, blob_uuids))
+        for stats in self._current_stats():
+            stats.blob_fetches += 1
+            stats.blobs_read += len(blobs)
+        return iter(blobs)
+
+    def _write_docs(self, store: Store, docs: list[dict], key: list | str):
+        super()._write_docs(store, docs, key)
+        nbytes = sum(_get_size(doc) for doc in docs)
+        for stats in self._current_stats():
+            stats.bytes_written += nbytes
+
+    @property
+    def _depth(self) -> int:
+        """The number of instrumented operations currently running in this thread."""
+        return getattr(self._local, "depth", 0)
+
+    @contextmanager
+    def attribute_to(self, uuid: str | None) -> Iterator[None]:
+        """
+        Attribute the operations performed in this thread to a job.
+
+        By default, operations are attributed to the job in ``CURRENT_JOB``. This is
+        used for operations performed on behalf of a job from another thread, such as
+        prefetching its inputs.
+
+        Parameters
+        ----------
+        uuid
+            The uuid of the job, or None to only record the operations in the totals.
+        """
+        self._local.job_uuid = uuid
+        try:
+            yield
+        finally:
+            del self._local.job_uuid
+
+    def _current_stats(self) -> list[StoreStats]:
+        """Get the statistics objects that the current operation should update."""
+        from jobflow import CURRENT_JOB
+
+        if hasattr(self._local, "job_uuid"):
+            uuid = self._local.job_uuid
+        else:
+            uuid = None if CURRENT_JOB.job is None else CURRENT_JOB.job.uuid
+
+        if uuid is None:
+            return [self.stats]
+
+        if uuid not in self.job_stats:
+            self.job_stats[uuid] = StoreStats()
+        return [self.stats, self.job_stats[uuid]]
+
+    def _record(self, name: str, duration: float, docs: int, nbytes: int):
+        for stats in self._current_stats():
+            stats.record_operation(name, duration, docs)
+            stats.bytes_read += nbytes
+
+    def _record_call(
+        self, name: str, method, *args, ndocs: int | None = None, **kwargs
+    ):
+        """Call a store method, recording statistics if not called by another one."""
+        import time
+
+        depth = self._depth
+        self._local.depth = depth + 1
+        start_time = time.perf_counter()
+        try:
+            result = method(*args, **kwargs)
+        finally:
+            duration = time.perf_counter() - start_time
+            self._local.depth = depth
+
+        if depth == 0:
+            nbytes = 0
+            if ndocs is None:
+                if name == "count":
+                    ndocs = 0
+                elif isinstance(result, list):
+                    ndocs = len(result)
+                    nbytes = _get_size(result)
+                else:
+                    ndocs = int(result is not None)
+                    nbytes = _get_size(result) if ndocs else 0
+            self._record(name, duration, ndocs, nbytes)
+        return result
+
+    def _record_iter(self, name: str, iterator: Iterator) -> Iterator:
+        """Wrap an iterator, recording statistics once it is exhausted or closed."""
+        import time
+
+        duration = 0.0
+        ndocs = 0
+        nbytes = 0
+        try:
+            while True:
+                depth = self._depth
+                self._local.depth = depth + 1
+                start_time = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                finally:
+                    duration += time.perf_counter() - start_time
+                    self._local.depth = depth
+
+                if name == "groupby":
+                    ndocs += len(item[1])
+                    nbytes += _get_size(item[1])
+                else:
+                    ndocs += 1
+                    nbytes += _get_size(item)
+                yield item
+        finally:
+            self._record(name, duration, ndocs, nbytes)
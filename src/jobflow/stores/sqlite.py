@@ -0,0 +1,643 @@
+"""A persistent single-file store backed by SQLite."""
+
+from __future__ import annotations
+
+import threading
+import typing
+
+from maggma.core import Sort, Store, StoreError
+
+if typing.TYPE_CHECKING:
+    import sqlite3
+    from pathlib import Path
+    from typing import Any, Iterator
+
+__all__ = ["SQLiteStore"]
+
+_COLUMNS = ("uuid", "index", "name", "job_uuid", "blob_uuid")
+_RANGE_OPERATORS = {"$gt": ">", "$gte": ">=", "$lt": "<", "$lte": "<="}
+
+
+class SQLiteStore(Store):
+    """
+    A persistent single-file store backed by SQLite.
+
+    The store is intended for use as the ``docs_store`` or an additional store of a
+    :obj:`.JobStore` when durability is needed without running a database server.
+    Documents are stored as JSON alongside indexed ``uuid``, ``index`` and ``name``
+    columns for job outputs, indexed ``job_uuid`` and ``blob_uuid`` columns for the
+    data in additional stores, and a separate indexed table of ``hosts``.
+
+    Criteria on these fields (equality and ``$in``, plus range operators) and sorts
+    on the columns are executed in SQL using the indexes; any remaining criteria are
+    applied in Python using the same semantics as MongoDB. For example, the most recent
+    output of a job is found by walking the ``(uuid, index)`` index backwards. All
+    documents in a single call to :obj:`SQLiteStore.update` are written in one
+    transaction.
+
+    Each thread uses its own connection to the database, so the store can be shared
+    between threads (e.g., when outputs are prefetched by :obj:`.run_locally`). A
+    connection can only write if it is not partway through reading an older version
+    of the database, which would not be the case if a query in one thread and a write
+    in another thread shared the same connection.
+
+    Parameters
+    ----------
+    database
+        Path to the database file. The file is created if it does not exist.
+    collection_name
+        Name of the table in which to store documents.
+    timeout
+        How many seconds to wait for a lock held by another connection.
+    **kwargs
+        Additional keyword arguments passed to the maggma ``Store`` constructor.
+    """
+
+    def __init__(
+        self,
+        database: str | Path = "jobflow.db",
+        collection_name: str = "outputs",
+        timeout: float = 30.0,
+        **kwargs,
+    ):
+        self.database = str(database)
+        self.collection_name = collection_name
+        self.timeout = timeout
+        self.kwargs = kwargs
+        self._local: threading.local | None = None
+        self._connections: dict[threading.Thread, sqlite3.Connection] = {}
+        self._lock = threading.Lock()
+        super().__init__(**kwargs)
+
+    @property
+    def name(self) -> str:
+        """Get the name of the store."""
+        return f"sqlite://{self.database}/{self.collection_name}"
+
+    @property
+    def _collection(self) -> sqlite3.Connection:
+        """Get the database connection for the current thread."""
+        local = self._local
+        if local is None:
+            raise StoreError("Must connect SQLiteStore before attempting to use it")
+
+        conn = getattr(local, "conn", None)
+        if conn is None:
+            conn = self._open_connection()
+            with self._lock:
+                # close the connections of threads that have finished, e.g., the
+                # prefetching threads of previous calls to run_locally
+                for thread in [t for t in self._connections if not t.is_alive()]:
+                    self._connections.pop(thread).close()
+                self._connections[threading.current_thread()] = conn
+            local.conn = conn
+        return conn
+
+    @property
+    def _docs_table(self) -> str:
+        return _quote(self.collection_name)
+
+    @property
+    def _hosts_table(self) -> str:
+        return _quote(f"{self.collection_name}_hosts")
+
+    def connect(self, force_reset: bool = False):
+        """
+        Connect to the database and create the tables if necessary.
+
+        Parameters
+        ----------
+        force_reset
+            Whether to reset the connection if it is already open.
+        """
+        if self._local is not None:
+            if not force_reset:
+                return
+            self.close()
+
+        self._local = threading.local()
+        conn = self._collection
+
+        docs, hosts = self._docs_table, self._hosts_table
+        prefix = self.collection_name
+        # the "plain" column is 0 if any of the indexed fields are not simple values
+        # (e.g., lists or booleans); these documents are always checked in Python
+        conn.executescript(
+            f"""
+            CREATE TABLE IF NOT EXISTS {docs} (
+                id INTEGER PRIMARY KEY,
+                uuid,
+                "index",
+                name,
+                job_uuid,
+                blob_uuid,
+                plain INTEGER NOT NULL,
+                doc TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS {_quote(prefix + "_uuid_index")}
+                ON {docs} (uuid, "index");
+            CREATE INDEX IF NOT EXISTS {_quote(prefix + "_name")} ON {docs} (name);
+            CREATE INDEX IF NOT EXISTS {_quote(prefix + "_job_uuid")}
+                ON {docs} (job_uuid);
+            CREATE INDEX IF NOT EXISTS {_quote(prefix + "_blob_uuid")}
+                ON {docs} (blob_uuid);
+            CREATE INDEX IF NOT EXISTS {_quote(prefix + "_complex")}
+                ON {docs} (id) WHERE plain = 0;
+            CREATE TABLE IF NOT EXISTS {hosts} (
+                doc_id INTEGER NOT NULL REFERENCES {docs} (id) ON DELETE CASCADE,
+                host NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS {_quote(prefix + "_hosts_host")}
+                ON {hosts} (host, doc_id);
+            CREATE INDEX IF NOT EXISTS {_quote(prefix + "_hosts_doc")}
+                ON {hosts} (doc_id);
+            """
+        )
+
+    def close(self):
+        """Close the connections to the database from all threads."""
+        with self._lock:
+            connections, self._connections = self._connections, {}
+        self._local = None
+        for conn in connections.values():
+            conn.close()
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a new connection to the database."""
+        import sqlite3
+
+        # connections are closed by the thread that calls close
+        conn = sqlite3.connect(
+            self.database, timeout=self.timeout, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def count(self, criteria: dict | None = None) -> int:
+        """
+        Count the number of documents matching the query criteria.
+
+        Parameters
+        ----------
+        criteria
+            PyMongo filter for documents to count in.
+
+        Returns
+        -------
+        int
+            The number of documents matching the query.
+        """
+        clauses, params, remaining = self._compile_criteria(criteria)
+        if remaining:
+            return sum(1 for _ in self._iter_docs(criteria))
+
+        where = " AND ".join(["plain = 1", *clauses])
+        sql = f"SELECT COUNT(*) FROM {self._docs_table} WHERE {where}"
+        (count,) = self._collection.execute(sql, params).fetchone()
+        return count + sum(1 for _ in self._iter_docs(criteria, plain=False))
+
+    def query(  # type: ignore
+        self,
+        criteria: dict | None = None,
+        properties: dict | list | None = None,
+        sort: dict[str, Sort | int] | None = None,
+        skip: int = 0,
+        limit: int = 0,
+    ) -> Iterator[dict]:
+        """
+        Query the store for a set of documents.
+
+        Parameters
+        ----------
+        criteria
+            PyMongo filter for documents to search in.
+        properties
+            Properties to return in grouped documents.
+        sort
+            Dictionary of sort order for fields. Keys are field names and values are 1
+            for ascending or -1 for descending.
+        skip
+            Number of documents to skip.
+        limit
+            Limit on the total number of documents returned.
+
+        Yields
+        ------
+        dict
+            The documents.
+        """
+        from itertools import islice
+
+        sort_items = _prepare_sort(sort)
+        order = self._compile_sort(sort_items)
+        docs: Iterator[dict] = (
+            doc for _, doc in self._iter_docs(criteria, order=order or "")
+        )
+        if sort_items and order is None:
+            docs = iter(_sort_docs(list(docs), sort_items))
+
+        stop = skip + limit if limit else None
+        for doc in islice(docs, skip, stop):
+            yield _project(doc, properties)
+
+    def update(self, docs: list[dict] | dict, key: list | str | None = None):
+        """
+        Insert or replace documents in the store.
+
+        All documents are written in a single transaction.
+
+        Parameters
+        ----------
+        docs
+            The document or list of documents to update.
+        key
+            Field name(s) to determine uniqueness for a document, can be a list of
+            multiple fields, a single field, or None if the store's key field is to be
+            used.
+        """
+        from bson import json_util
+        from monty.json import jsanitize
+
+        if not isinstance(docs, list):
+            docs = [docs]
+
+        key = key or self.key
+        keys = key if isinstance(key, list) else [key]
+
+        rows = []
+        for d in docs:
+            d = jsanitize(d, allow_bson=True)
+
+            # document-level validation is optional
+            if self.validator and not self.validator.is_valid(d):
+                if self.validator.strict:
+                    raise ValueError(self.validator.validation_errors(d))
+                self.logger.error(self.validator.validation_errors(d))
+                continue
+
+            search_doc = {k: d[k] for k in keys}
+            values = [d.get(c) for c in _COLUMNS]
+            hosts = d.get("hosts", [])
+            plain = all(v is None or _is_simple(v) for v in values) and (
+                isinstance(hosts, list) and all(_is_simple(h) for h in hosts)
+            )
+            if not plain:
+                values = [v if _is_simple(v) else None for v in values]
+                hosts = hosts if isinstance(hosts, list) else []
+                hosts = [h for h in hosts if _is_simple(h)]
+            rows.append((search_doc, values, hosts, plain, json_util.dumps(d)))
+
+        if not rows:
+            return
+
+        conn = self._collection
+        columns = ", ".join(_quote(c) for c in _COLUMNS)
+        placeholders = ", ".join("?" * (len(_COLUMNS) + 2))
+        insert_doc = (
+            f"INSERT INTO {self._docs_table} ({columns}, plain, doc) "
+            f"VALUES ({placeholders})"
+        )
+        insert_host = f"INSERT INTO {self._hosts_table} (doc_id, host) VALUES (?, ?)"
+        with conn:
+            for search_doc, values, hosts, plain, doc in rows:
+                self._delete(search_doc)
+                doc_id = conn.execute(insert_doc, (*values, int(plain), doc)).lastrowid
+                if hosts:
+                    conn.executemany(insert_host, [(doc_id, h) for h in hosts])
+
+    def ensure_index(self, key: str, unique: bool = False) -> bool:
+        """
+        Check whether a field is indexed.
+
+        The ``uuid``, ``index``, ``name``, ``job_uuid``, ``blob_uuid`` and ``hosts``
+        fields are always indexed; indexes on other fields are not supported.
+
+        Parameters
+        ----------
+        key
+            Single key to index.
+        unique
+            Whether the index contains only unique keys. Not supported.
+
+        Returns
+        -------
+        bool
+            Whether the index exists.
+        """
+        return not unique and key in (*_COLUMNS, "hosts")
+
+    def groupby(
+        self,
+        keys: list[str] | str,
+        criteria: dict | None = None,
+        properties: dict | list | None = None,
+        sort: dict[str, Sort | int] | None = None,
+        skip: int = 0,
+        limit: int = 0,
+    ) -> Iterator[tuple[dict, list[dict]]]:
+        """
+        Group documents by keys.
+
+        If all keys are indexed columns, documents are streamed from the database in
+        key order rather than loaded into memory at once.
+
+        Parameters
+        ----------
+        keys
+            Fields to group documents.
+        criteria
+            PyMongo filter for documents to search in.
+        properties
+            Properties to return in grouped documents.
+        sort
+            Not used.
+        skip
+            Not used.
+        limit
+            Not used.
+
+        Yields
+        ------
+        dict, list[dict]
+            The documents as (key, documents) grouped by their keys.
+        """
+        from itertools import groupby
+
+        from pydash import get, has, set_
+
+        keys = keys if isinstance(keys, list) else [keys]
+
+        if properties is None:
+            properties = []
+        if isinstance(properties, dict):
+            properties = list(properties.keys())
+
+        projection = keys + properties if properties else None
+        docs = self.query(
+            criteria=criteria,
+            properties=projection,
+            sort={k: Sort.Ascending for k in keys},
+        )
+        data = (doc for doc in docs if all(has(doc, k) for k in keys))
+
+        def grouping_keys(doc):
+            return tuple(get(doc, k) for k in keys)
+
+        for vals, group in groupby(data, key=grouping_keys):
+            doc: dict[str, Any] = {}
+            for k, v in zip(keys, vals):
+                set_(doc, k, v)
+            yield doc, list(group)
+
+    def remove_docs(self, criteria: dict):
+        """
+        Remove documents matching the query criteria.
+
+        Parameters
+        ----------
+        criteria
+            Criteria for documents to remove.
+        """
+        with self._collection:
+            self._delete(criteria)
+
+    def latest_indexes(self, uuids: list[str] | None = None) -> dict[str, int]:
+        """
+        Get the largest index stored for each uuid.
+
+        Parameters
+        ----------
+        uuids
+            The uuids to find. If None, all uuids in the store are returned.
+
+        Returns
+        -------
+        dict[str, int]
+            A mapping of ``{uuid: index}``.
+        """
+        from bson import json_util
+
+        sql = f'SELECT uuid, MAX("index") FROM {self._docs_table} WHERE plain = 1'
+        params = []
+        if uuids is not None:
+            sql += " AND uuid IN (SELECT value FROM json_each(?))"
+            params.append(json_util.dumps(list(uuids)))
+        sql += ' AND "index" IS NOT NULL GROUP BY uuid'
+
+        latest = {
+            uuid: index
+            for uuid, index in self._collection.execute(sql, params)
+            if uuid is not None
+        }
+
+        criteria = None if uuids is None else {"uuid": {"$in": list(uuids)}}
+        for _, doc in self._iter_docs(criteria, plain=False):
+            uuid, index = doc.get("uuid"), doc.get("index")
+            if _is_simple(uuid) and _is_simple(index):
+                latest[uuid] = max(index, latest.get(uuid, index))
+        return latest
+
+    def __hash__(self):
+        """Hash the store."""
+        return hash((self.database, self.collection_name))
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Check equality for SQLiteStore.
+
+        Parameters
+        ----------
+        other
+            Another store to compare with.
+        """
+        if not isinstance(other, SQLiteStore):
+            return False
+
+        fields = ["database", "collection_name", "last_updated_field"]
+        return all(getattr(self, f) == getattr(other, f) for f in fields)
+
+    def _compile_criteria(
+        self, criteria: dict | None
+    ) -> tuple[list[str], list[Any], dict]:
+        """Split criteria into SQL clauses and the criteria to be checked in Python."""
+        clauses = []
+        params: list[Any] = []
+        remaining = {}
+        for field, value in (criteria or {}).items():
+            clause = None
+            if field in _COLUMNS:
+                clause = _compile_condition(_quote(field), value, params)
+            elif field == "hosts":
+                condition = _compile_condition("host", value, params)
+                if condition is not None:
+                    clause = (
+                        f"id IN (SELECT doc_id FROM {self._hosts_table} "
+                        f"WHERE {condition})"
+                    )
+
+            if clause is None:
+                remaining[field] = value
+            else:
+                clauses.append(clause)
+        return clauses, params, remaining
+
+    def _compile_sort(self, sort_items: list[tuple[str, int]]) -> str | None:
+        """Get an ORDER BY clause, or None if the sort must be done in Python."""
+        if not sort_items:
+            return ""
+
+        if any(k not in _COLUMNS for k, _ in sort_items) or self._has_complex():
+            return None
+
+        terms = [f"{_quote(k)} {'DESC' if d == -1 else 'ASC'}" for k, d in sort_items]
+        return " ORDER BY " + ", ".join(terms)
+
+    def _has_complex(self) -> bool:
+        """Whether any documents have indexed fields that are not simple values."""
+        sql = f"SELECT 1 FROM {self._docs_table} WHERE plain = 0 LIMIT 1"
+        return self._collection.execute(sql).fetchone() is not None
+
+    def _iter_docs(
+        self, criteria: dict | None, order: str = "", plain: bool | None = None
+    ) -> Iterator[tuple[int, dict]]:
+        """Iterate over the row ids and documents matching the criteria."""
+        from bson import json_util
+        from mongomock.filtering import filter_applies
+
+        if plain is None:
+            # querying separately allows the indexes to be used for plain documents
+            yield from self._iter_docs(criteria, order=order, plain=True)
+            yield from self._iter_docs(criteria, order=order, plain=False)
+            return
+
+        if plain:
+            clauses, params, check = self._compile_criteria(criteria)
+            where = " AND ".join(["plain = 1", *clauses])
+        else:
+            # documents that are not plain are always checked in Python
+            where, params, check = "plain = 0", [], criteria or {}
+
+        sql = f"SELECT id, doc FROM {self._docs_table} WHERE {where}{order}"
+        for doc_id, doc in self._collection.execute(sql, params):
+            doc = json_util.loads(doc)
+            if check and not filter_applies(check, doc):
+                continue
+            yield doc_id, doc
+
+    def _delete(self, criteria: dict | None):
+        """Delete documents matching the criteria. Must be run in a transaction."""
+        conn = self._collection
+        clauses, params, remaining = self._compile_criteria(criteria)
+        if remaining:
+            ids = [doc_id for doc_id, _ in self._iter_docs(criteria)]
+        else:
+            where = " AND ".join(["plain = 1", *clauses])
+            conn.execute(f"DELETE FROM {self._docs_table} WHERE {where}", params)
+            ids = [doc_id for doc_id, _ in self._iter_docs(criteria, plain=False)]
+
+        if ids:
+            conn.executemany(
+                f"DELETE FROM {self._docs_table} WHERE id = ?", [(i,) for i in ids]
+            )
+
+
+def _quote(identifier: str) -> str:
+    """Quote an SQL identifier."""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _is_simple(value: Any) -> bool:
+    """Whether a value compares the same in SQLite and MongoDB."""
+    return isinstance(value, (str, int, float)) and not isinstance(value, bool)
+
+
+def _compile_condition(column: str, value: Any, params: list) -> str | None:
+    """Convert a MongoDB condition on a single field to SQL, if possible."""
+    from bson import json_util
+
+    if _is_simple(value):
+        params.append(value)
+        return f"{column} = ?"
+
+    if not isinstance(value, dict) or not value:
+        return None
+
+    terms = []
+    new_params: list[Any] = []
+    for operator, operand in value.items():
+        if operator == "$eq" and _is_simple(operand):
+            terms.append(f"{column} = ?")
+            new_params.append(operand)
+        elif operator == "$in" and isinstance(operand, (list, tuple)):
+            if not all(_is_simple(v) for v in operand):
+                return None
+            terms.append(f"{column} IN (SELECT value FROM json_each(?))")
+            new_params.append(json_util.dumps(list(operand)))
+        elif operator in _RANGE_OPERATORS and _is_simple(operand):
+            # MongoDB only compares values of the same type
+            types = "'text'" if isinstance(operand, str) else "'integer', 'real'"
+            terms.append(
+                f"({column} {_RANGE_OPERATORS[operator]} ? "
+                f"AND typeof({column}) IN ({types}))"
+            )
+            new_params.append(operand)
+        else:
+            return None
+
+    params.extend(new_params)
+    return " AND ".join(terms)
+
+
+def _prepare_sort(sort: dict[str, Sort | int] | None) -> list[tuple[str, int]]:
+    """Standardize the sort directions."""
+    if not sort:
+        return []
+    return [
+        (k, Sort(v).value if isinstance(v, int) else v.value) for k, v in sort.items()
+    ]
+
+
+def _sort_docs(docs: list[dict], sort_items: list[tuple[str, int]]) -> list[dict]:
+    """Sort documents in Python using the MongoDB ordering of types."""
+    from pydash import get
+
+    def sort_key(value):
+        if value is None:
+            return (0, 0)
+        if _is_simple(value):
+            return (1, value) if not isinstance(value, str) else (2, value)
+        if isinstance(value, dict):
+            return (3, str(value))
+        if isinstance(value, list):
+            return (4, str(value))
+        if isinstance(value, bool):
+            return (5, value)
+        return (6, str(value))
+
+    for field, direction in reversed(sort_items):
+        docs.sort(key=lambda d: sort_key(get(d, field)), reverse=direction == -1)
+    return docs
+
+
+def _project(doc: dict, properties: dict | list | None) -> dict:
+    """Restrict a document to a set of properties."""
+    from pydash import get, has, set_, unset
+
+    if not properties:
+        return doc
+
+    if isinstance(properties, dict):
+        included = [k for k, v in properties.items() if v]
+        if not included:
+            for k in properties:
+                unset(doc, k)
+            return doc
+        properties = included
+
+    new_doc: dict[str, Any] = {}
+    for prop in properties:
+        if has(doc, prop):
+            set_(new_doc, prop, get(doc, prop))
+    return new_doc
@@ -4,7 +4,10 @@ from jobflow.utils.find import (
     contains_flow_or_job,
     find_key,
     find_key_value,
+    find_keys,
+    iter_matches,
     update_in_dictionary,
 )
 from jobflow.utils.log import initialize_logger
+from jobflow.utils.serialization import FastSerializer, MontySerializer, Serializer
 from jobflow.utils.uuid import suuid
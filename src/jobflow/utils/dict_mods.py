@@ -2,7 +2,8 @@
 Implementation of the DictMod language for manipulating dictionaries.
 
 This module enables the modification of a dict using another dict. The main method of
-interest is :obj:`apply_mod`.
+interest is :obj:`apply_mod`. Modifications that are applied to many dicts can first be
+compiled using :obj:`compile_mod`.
 
 .. Note::
     This code is based heavily on the Ansible class of `custodian
@@ -18,10 +19,10 @@ import re
 import typing
 
 if typing.TYPE_CHECKING:
-    from typing import Any
+    from typing import Any, Callable, Iterable
 
 
-__all__ = ["DictMods", "apply_mod"]
+__all__ = ["DictMods", "CompiledMod", "apply_mod", "compile_mod"]
 
 
 class DictMods:
@@ -155,7 +156,100 @@ class DictMods:
 _DM = DictMods()
 
 
-def apply_mod(modification: dict[str, Any], obj: dict[str, Any]):
+class CompiledMod:
+    """
+    A dict mod that has been prepared for applying to many dicts.
+
+    The actions are looked up and the nested ``"->"`` keys are split once, when the
+    modification is compiled. Use :obj:`compile_mod` to create a compiled mod.
+
+    Parameters
+    ----------
+    modification
+        The modification, as ``{action_keyword : settings}``.
+    actions
+        The action functions and their prepared settings.
+    """
+
+    def __init__(
+        self,
+        modification: dict[str, Any],
+        actions: list[tuple[Callable[[dict, Any], None], Any]],
+    ):
+        self.modification = modification
+        self.actions = actions
+
+    def apply(self, obj: dict[str, Any]):
+        """
+        Apply the modification to a dict in place.
+
+        Parameters
+        ----------
+        obj
+            A dict to be modified.
+        """
+        for action, settings in self.actions:
+            action(obj, settings)
+
+    def apply_many(self, objs: Iterable[dict[str, Any]]):
+        """
+        Apply the modification to many dicts in place.
+
+        Parameters
+        ----------
+        objs
+            The dicts to be modified.
+        """
+        for obj in objs:
+            for action, settings in self.actions:
+                action(obj, settings)
+
+
+def compile_mod(modification: dict[str, Any] | CompiledMod) -> CompiledMod:
+    """
+    Compile a dict mod so that it can be applied to many dicts.
+
+    Parameters
+    ----------
+    modification
+        Modification must be ``{action_keyword : settings}``, where action_keyword is a
+        supported DictMod. Compiled mods are returned unchanged. As with
+        :obj:`apply_mod`, unsupported actions only raise an error when the mod is
+        applied.
+
+    Returns
+    -------
+    CompiledMod
+        The compiled modification.
+
+    Examples
+    --------
+    >>> mod = compile_mod({"_set": {"a->b": 1}, "_inc": {"c": 2}})
+    >>> dicts = [{"c": 1}, {"a": {"b": 0}}]
+    >>> mod.apply_many(dicts)
+    >>> dicts
+    [{'c': 3, 'a': {'b': 1}}, {'a': {'b': 1}, 'c': 2}]
+    """
+    if isinstance(modification, CompiledMod):
+        return modification
+
+    from functools import partial
+
+    actions: list[tuple[Callable[[dict, Any], None], Any]] = []
+    for action, settings in modification.items():
+        if action not in _DM.supported_actions:
+            actions.append((partial(_unsupported_action, action), settings))
+            continue
+
+        if isinstance(settings, dict):
+            settings = {_parse_key(k): v for k, v in settings.items()}
+        elif isinstance(settings, (list, tuple)):
+            settings = [_parse_key(k) for k in settings]
+        actions.append((_DM.supported_actions[action], settings))
+    return CompiledMod(modification, actions)
+
+
+def apply_mod(modification: dict[str, Any] | CompiledMod, obj: dict[str, Any]):
     """
     Apply a dict mod to an object.
 
@@ -165,10 +259,15 @@ def apply_mod(modification: dict[str, Any], obj: dict[str, Any]):
     ----------
     modification
         Modification must be ``{action_keyword : settings}``, where action_keyword is a
-        supported DictMod.
+        supported DictMod. Alternatively, a modification compiled using
+        :obj:`compile_mod`.
     obj
         A dict to be modified.
     """
+    if isinstance(modification, CompiledMod):
+        modification.apply(obj)
+        return
+
     for action, settings in modification.items():
         if action in _DM.supported_actions:
             _DM.supported_actions[action].__call__(obj, settings)
@@ -176,12 +275,36 @@ def apply_mod(modification: dict[str, Any], obj: dict[str, Any]):
             raise ValueError(f"{action} is not a supported action!")
 
 
+def _unsupported_action(action: str, obj: dict[str, Any], settings: Any):
+    """Raise an error for an action that is not supported by :obj:`DictMods`."""
+    raise ValueError(f"{action} is not a supported action!")
+
+
+class _ParsedKey(str):
+    """A nested dict mod key that has already been split into tokens."""
+
+    toks: list[str]
+
+
+def _parse_key(key: Any) -> Any:
+    """Split a nested key into tokens, keeping the original key."""
+    if type(key) is not str:
+        return key
+
+    parsed = _ParsedKey(key)
+    parsed.toks = [t for t in key.split("->") if t != ""]
+    return parsed
+
+
 def _get_nested_dict(
     input_dict: dict[str, Any], key: str
 ) -> tuple[dict[str, Any], str] | None:
     """Get nested dicts using a key."""
     current = input_dict
-    toks = [t for t in key.split("->") if t != ""]
+    if type(key) is _ParsedKey:
+        toks = key.toks
+    else:
+        toks = [t for t in key.split("->") if t != ""]
     n = len(toks)
     for i, tok in enumerate(toks):
         if tok not in current and i < n - 1:
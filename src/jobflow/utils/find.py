@@ -5,18 +5,116 @@ from __future__ import annotations
 import typing
 
 if typing.TYPE_CHECKING:
-    from typing import Any, Hashable
+    from typing import (
+        Any,
+        Callable,
+        Hashable,
+        Iterable,
+        Iterator,
+        Mapping,
+        MutableMapping,
+        Sequence,
+    )
 
     from monty.json import MSONable
 
 __all__ = [
+    "iter_matches",
     "find_key",
+    "find_keys",
     "find_key_value",
     "update_in_dictionary",
     "contains_flow_or_job",
 ]
 
 
+def iter_matches(
+    obj: Any,
+    predicates: Mapping[Any, Callable[[dict], bool]],
+    nested: bool = True,
+) -> Iterator[tuple[Hashable, list[Any], dict]]:
+    """
+    Find the dictionaries in an object that match one or more predicates.
+
+    All predicates are checked in a single iterative traversal of the object, so
+    deeply nested objects do not hit the recursion limit. This function works on nested
+    dictionaries, lists, and tuples.
+
+    Parameters
+    ----------
+    obj
+        A dict or list of dicts.
+    predicates
+        The predicates to check, as a dictionary of ``{name: predicate}``. Each
+        predicate is called with every dictionary in the object and should return
+        whether it matches.
+    nested
+        Whether to keep checking a predicate inside a dictionary that it matched.
+
+    Yields
+    ------
+    tuple[Hashable, list, dict]
+        The name of the predicate, the route to the matching dictionary and the
+        dictionary itself. Matches are given in document order.
+
+    Examples
+    --------
+    >>> data = {"a": {"@class": "Job"}, "b": [{"x": 1}, {"@class": "Flow"}]}
+    >>> predicates = {
+    ...     "x": lambda d: "x" in d,
+    ...     "flow_or_job": lambda d: d.get("@class") in ("Flow", "Job"),
+    ... }
+    >>> [(name, path) for name, path, _ in iter_matches(data, predicates)]
+    [('flow_or_job', ['a']), ('x', ['b', 0]), ('flow_or_job', ['b', 1])]
+    """
+    containers = (dict, list, tuple)
+    if not isinstance(obj, containers):
+        return
+
+    # the route is a single list that is extended and truncated as the traversal
+    # moves through the object, it is only copied when a match is found
+    path: list[Any] = []
+    active = tuple(predicates.items())
+    stack: list[tuple[tuple, Iterator]] = []
+    node = obj
+    while True:
+        if isinstance(node, dict):
+            remaining = []
+            for name, predicate in active:
+                if predicate(node):
+                    yield name, path.copy(), node
+                    if not nested:
+                        continue
+                remaining.append((name, predicate))
+            if len(remaining) < len(active):
+                active = tuple(remaining)
+            children = iter(node.items())
+        else:
+            children = enumerate(node)
+
+        if active:
+            stack.append((active, children))
+        elif stack:
+            path.pop()
+
+        # find the next container to visit, moving back up the tree as needed
+        while stack:
+            active, children = stack[-1]
+            for k, v in children:
+                if isinstance(v, containers):
+                    path.append(k)
+                    node = v
+                    break
+            else:
+                stack.pop()
+                if stack:
+                    path.pop()
+                continue
+            break
+        else:
+            return
+
+
 def find_key(
     d: dict[Hashable, Any] | list[Any],
     key: Hashable | type[MSONable],
@@ -42,7 +140,7 @@ def find_key(
 
     Returns
     -------
-    A list of routes to where the matches were found.
+    A list of routes to where the matches were found, in document order.
 
     Examples
     --------
@@ -63,46 +161,69 @@ def find_key(
     >>> find_key(data, "x", nested=True)
     [['a'], ['a', 'x'], ['b']]
     """
-    import inspect
+    locations = find_keys(d, {None: key}, include_end=include_end, nested=nested)
+    return locations[None]
 
-    from monty.json import MSONable
 
-    found_items = set()
+def find_keys(
+    d: dict[Hashable, Any] | list[Any],
+    keys: Mapping[Any, Hashable | type[MSONable]],
+    include_end: bool = False,
+    nested: bool = False,
+) -> dict[Hashable, list[list[Any]]]:
+    """
+    Find the routes to several keys in a dictionary in a single pass.
 
-    def _lookup(obj, path=None):
-        found = False
-        if path is None:
-            path = ()
+    See :obj:`find_key` for more details.
 
-        if isinstance(obj, dict):
-            if (
-                inspect.isclass(key)
-                and issubclass(key, MSONable)
-                and "@module" in obj
-                and obj["@module"] == key.__module__
-                and "@class" in obj
-                and obj["@class"] == key.__name__
-            ):
-                found_items.add(path)
-                found = True
+    Parameters
+    ----------
+    d
+        A dict or list of dicts.
+    keys
+        The keys to locate, as a dictionary of ``{name: key}``, where key is a
+        dictionary key or MSONable class.
+    include_end
+        Whether to include the key in the route. This has no effect if the key is an
+        MSONable class.
+    nested:
+        Whether to return nested keys or stop at the first match.
+
+    Returns
+    -------
+    dict[Hashable, list[list[Any]]]
+        The routes to where the matches were found for each name, in document order.
+
+    Examples
+    --------
+    >>> data = {"a": [0, {"b": 1, "x": 3}], "c": {"d": {"x": 3}}}
+    >>> find_keys(data, {"b": "b", "x": "x"})
+    {'b': [['a', 1]], 'x': [['a', 1], ['c', 'd']]}
+    """
+    predicates = {}
+    ends = {}
+    for name, key in keys.items():
+        predicates[name], is_class = _key_predicate(key)
+        ends[name] = [key] if include_end and not is_class else []
 
-            if key in obj:
-                if include_end:
-                    found_items.add((*path, key))
-                else:
-                    found_items.add(path)
-                found = True
+    locations: dict[Hashable, list[list[Any]]] = {name: [] for name in keys}
+    for name, path, _ in iter_matches(d, predicates, nested=nested):
+        locations[name].append(path + ends[name])
+    return locations
 
-            if not found or nested:
-                for k, v in obj.items():
-                    _lookup(v, (*path, k))
 
-        elif isinstance(obj, (list, tuple)):
-            for i, v in enumerate(obj):
-                _lookup(v, (*path, i))
+def _key_predicate(
+    key: Hashable | type[MSONable],
+) -> tuple[Callable[[dict], bool], bool]:
+    """Get a predicate matching dictionaries with a key or serialized MSONable class."""
+    import inspect
 
-    _lookup(d)
-    return [list(path) for path in found_items]
+    from monty.json import MSONable
+
+    if inspect.isclass(key) and issubclass(key, MSONable):
+        module, name = key.__module__, key.__name__
+        return (lambda d: d.get("@class") == name and d.get("@module") == module), True
+    return (lambda d: key in d), False
 
 
 def find_key_value(
@@ -124,7 +245,7 @@ def find_key_value(
 
     Returns
     -------
-    A tuple of routes to where the matches were found.
+    A tuple of routes to where the matches were found, in document order.
 
     Examples
     --------
@@ -135,28 +256,11 @@ def find_key_value(
     ... find_key_value(data, "x", 3)
     (['a', 1], ['c', 'd'])
     """
-    found_items = set()
-
-    def _lookup(obj, path=None):
-        if path is None:
-            path = ()
-
-        if isinstance(obj, dict):
-            if key in obj and obj[key] == value:
-                found_items.add(path)
+    predicates = {None: lambda obj: key in obj and obj[key] == value}
+    return tuple(path for _, path, _ in iter_matches(d, predicates))
 
-            for k, v in obj.items():
-                _lookup(v, (*path, k))
 
-        elif isinstance(obj, (list, tuple)):
-            for i, v in enumerate(obj):
-                _lookup(v, (*path, i))
-
-    _lookup(d)
-    return tuple(list(path) for path in found_items)
-
-
-def update_in_dictionary(obj: dict[Hashable, Any], updates: dict[tuple, Any]):
+def update_in_dictionary(obj: MutableMapping[Any, Any], updates: dict[tuple, Any]):
     """
     Update a dictionary in place at specific locations with a new values.
 
@@ -167,7 +271,9 @@ def update_in_dictionary(obj: dict[Hashable, Any], updates: dict[tuple, Any]):
     obj
         A dictionary to update.
     updates
-        The updates to perform, as a dictionary of ``{location: update}``.
+        The updates to perform, as a dictionary of ``{location: update}``. Updates
+        inside a location that is also updated are applied to the new value. The
+        empty location ``()`` cannot be updated in place and raises an IndexError.
 
     Examples
     --------
@@ -179,17 +285,31 @@ def update_in_dictionary(obj: dict[Hashable, Any], updates: dict[tuple, Any]):
     >>> data
     {'a': [0, {'b': 1, 'x': 100}], 'c': {'d': {'x': 100}}}
     """
-    for loc, update in updates.items():
-        pos = obj
-        for idx in loc[:-1]:
-            pos = pos[idx]
-        pos[loc[-1]] = update
+    # updates sharing a common route are applied in a single walk of that route
+    trie = _make_trie(updates.items())
+    if _END in trie:
+        raise IndexError("Cannot update the empty location () in place.")
+
+    stack = [(obj, trie)]
+    while stack:
+        pos, node = stack.pop()
+        for idx, child in node.items():
+            if idx is _END:
+                continue
+            if _END in child:
+                pos[idx] = child[_END]
+            if len(child) > (_END in child):
+                stack.append((pos[idx], child))
 
 
 def contains_flow_or_job(obj: Any) -> bool:
     """
     Find whether an object contains any :obj:`Flow` or :obj:`Job` objects.
 
+    Dictionaries, lists, tuples and sets are searched, along with the attributes of
+    MSONable objects and dataclasses. The search stops at the first Flow or Job found
+    and the object is never serialized.
+
     Parameters
     ----------
     obj
@@ -200,32 +320,45 @@ def contains_flow_or_job(obj: Any) -> bool:
     bool
         Whether the object contains any Flows or jobs.
     """
-    from monty.json import jsanitize
+    from dataclasses import is_dataclass
+
+    from monty.json import MSONable
 
     from jobflow.core.flow import Flow
     from jobflow.core.job import Job
 
-    if isinstance(obj, (Flow, Job)):
-        # if the argument is an flow or job then stop there
-        return True
-
-    elif isinstance(obj, (float, int, str, bool)):
-        # argument is a primitive, we won't find an flow or job here
-        return False
+    primitives = (str, bytes, int, float, type(None))
+    seen = set()
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, primitives):
+            # primitives won't contain a flow or job
+            continue
 
-    obj = jsanitize(obj, strict=True)
+        if isinstance(item, (Flow, Job)):
+            return True
 
-    # recursively find any reference classes
-    locations = find_key_value(obj, "@class", "Flow")
-    locations += find_key_value(obj, "@class", "Job")
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
 
-    return len(locations) > 0
+        if isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif isinstance(item, MSONable) or (
+            is_dataclass(item) and not isinstance(item, type)
+        ):
+            stack.extend(getattr(item, "__dict__", {}).values())
+    return False
 
 
 def get_root_locations(locations):
     """Filter for the the lowest level locations.
 
-    If a parent location is in the list, the child location is removed
+    If a parent location is in the list, the child location is removed. Duplicate
+    locations are only included once.
 
     Parameters
     ----------
@@ -235,16 +368,57 @@ def get_root_locations(locations):
     Returns
     -------
     list[list]
-        A list of locations with only the lowest level locations.
+        A list of locations with only the lowest level locations, in the order that
+        they first appear in ``locations``.
 
     Example usage:
-        >>> _get_root_locations([["a", "b"], ["a"], ["c", "d"]])
-        [["a"], ["c", "d"]]
+        >>> get_root_locations([["a", "b"], ["a"], ["c", "d"]])
+        [['a'], ['c', 'd']]
     """
-    sorted_locs = sorted(locations, key=lambda x: len(x))
-    root_locations = []
-    for loc in sorted_locs:
-        if any([loc[: len(rloc)] == rloc for rloc in root_locations]):
-            continue
-        root_locations.append(loc)
-    return root_locations
+    trie: dict = {}
+    for loc in locations:
+        node = trie
+        for idx in loc:
+            if _END in node:
+                # a parent location is already included
+                break
+            node = node.setdefault(idx, {})
+        else:
+            if _END not in node:
+                # drop any child locations already included
+                node.clear()
+                node[_END] = loc
+    return list(_iter_trie(trie))
+
+
+_END = object()
+
+
+def _make_trie(items: Iterable[tuple[Sequence, Any]]) -> dict:
+    """
+    Make a trie from a set of locations.
+
+    Each node of the trie is a dictionary mapping the next key in the route to the
+    child node. The value of a location is stored in its node under the ``_END`` key.
+    """
+    trie: dict = {}
+    for loc, value in items:
+        node = trie
+        for idx in loc:
+            node = node.setdefault(idx, {})
+        node[_END] = value
+    return trie
+
+
+def _iter_trie(trie: dict) -> Iterator[Any]:
+    """Iterate through the values stored in a trie, in insertion order."""
+    stack = [iter(trie.items())]
+    while stack:
+        for idx, child in stack[-1]:
+            if idx is _END:
+                yield child
+            else:
+                stack.append(iter(child.items()))
+                break
+        else:
+            stack.pop()
@@ -2,17 +2,10 @@
 
 from __future__ import annotations
 
+import typing
 import warnings
 
 import networkx as nx
-from monty.dev import requires
-
-try:
-    import matplotlib
-except ImportError:
-    matplotlib = None
-
-import typing
 
 if typing.TYPE_CHECKING:
     pass
@@ -56,7 +49,6 @@ def itergraph(graph: nx.DiGraph):
         yield from nx.topological_sort(subgraph)
 
 
-@requires(matplotlib, "matplotlib must be installed to plot flow graphs.")
 def draw_graph(
     graph: nx.DiGraph,
     layout_function: typing.Callable = None,
@@ -80,6 +72,12 @@ def draw_graph(
     matplotlib.pyplot
         The matplotlib pyplot object.
     """
+    # matplotlib is slow to import so only load it when drawing
+    try:
+        import matplotlib  # noqa: F401
+    except ImportError as err:
+        raise RuntimeError("matplotlib must be installed to plot flow graphs.") from err
+
     import matplotlib.pyplot as plt
 
     if layout_function is None:
@@ -0,0 +1,253 @@
+"""
+Serializers for converting job outputs to and from documents.
+
+A serializer converts Python objects into documents that can be written to a
+:obj:`.JobStore` (``sanitize``) and converts documents back into objects (``decode``).
+The store serializer is used to save job outputs, resolve references and load data
+from the additional stores.
+
+Two serializers are available:
+
+- :obj:`MontySerializer`: Uses :obj:`monty.json.jsanitize` and
+  :obj:`monty.json.MontyDecoder` directly.
+- :obj:`FastSerializer`: Produces the same documents, but dispatches on the exact type
+  of each object so that the common types (strings, numbers, lists and dicts) and
+  MSONable objects are handled with a single dictionary lookup. Sequences that only
+  contain numbers or strings are copied without visiting each item. Anything else is
+  passed to monty.
+"""
+
+from __future__ import annotations
+
+import typing
+
+from monty.json import MSONable
+
+if typing.TYPE_CHECKING:
+    from typing import Any
+
+__all__ = ["Serializer", "MontySerializer", "FastSerializer"]
+
+_SCALARS = frozenset((str, int, float, bool, type(None)))
+
+
+class Serializer(MSONable):
+    """
+    Base class for serializers.
+
+    Subclasses must implement :obj:`Serializer.sanitize` and :obj:`Serializer.decode`.
+    The documents produced must be compatible with
+    ``jsanitize(obj, strict=True, allow_bson=True)``.
+    """
+
+    def sanitize(self, obj: Any, enum_values: bool = True) -> Any:
+        """
+        Convert an object into a document that can be stored.
+
+        Parameters
+        ----------
+        obj
+            An object.
+        enum_values
+            Whether to convert enums to their values.
+
+        Returns
+        -------
+        Any
+            The object with all MSONable objects converted to dictionaries.
+        """
+        raise NotImplementedError
+
+    def decode(self, obj: Any) -> Any:
+        """
+        Convert a document back into an object.
+
+        Parameters
+        ----------
+        obj
+            A document.
+
+        Returns
+        -------
+        Any
+            The document with all serialized MSONable objects converted to objects.
+        """
+        raise NotImplementedError
+
+
+class MontySerializer(Serializer):
+    """A serializer that uses monty's jsanitize and MontyDecoder."""
+
+    def sanitize(self, obj: Any, enum_values: bool = True) -> Any:
+        """
+        Convert an object into a document that can be stored.
+
+        Parameters
+        ----------
+        obj
+            An object.
+        enum_values
+            Whether to convert enums to their values.
+
+        Returns
+        -------
+        Any
+            The object with all MSONable objects converted to dictionaries.
+        """
+        from monty.json import jsanitize
+
+        return jsanitize(obj, strict=True, enum_values=enum_values, allow_bson=True)
+
+    def decode(self, obj: Any) -> Any:
+        """
+        Convert a document back into an object.
+
+        Parameters
+        ----------
+        obj
+            A document.
+
+        Returns
+        -------
+        Any
+            The document with all serialized MSONable objects converted to objects.
+        """
+        from monty.json import MontyDecoder
+
+        return MontyDecoder().process_decoded(obj)
+
+
+class FastSerializer(Serializer):
+    """
+    A serializer that dispatches on the type of each object.
+
+    The documents are identical to those produced by :obj:`MontySerializer`. Objects
+    with types that are not handled directly are passed to monty.
+    """
+
+    def __init__(self):
+        from monty.json import MontyDecoder
+
+        self._decoder = MontyDecoder()
+        # the handlers are shared by all instances and filled in as new types are seen
+        self._handlers = _HANDLERS
+
+    def sanitize(self, obj: Any, enum_values: bool = True) -> Any:
+        """
+        Convert an object into a document that can be stored.
+
+        Parameters
+        ----------
+        obj
+            An object.
+        enum_values
+            Whether to convert enums to their values.
+
+        Returns
+        -------
+        Any
+            The object with all MSONable objects converted to dictionaries.
+        """
+        handlers = self._handlers
+
+        def _sanitize(o):
+            cls = type(o)
+            if cls in _SCALARS:
+                return o
+
+            kind = handlers.get(cls)
+            if kind is None:
+                kind = handlers.setdefault(cls, _get_handler_kind(cls))
+
+            if kind == "sequence":
+                if _SCALARS.issuperset(map(type, o)):
+                    return list(o)
+                return [_sanitize(i) for i in o]
+            if kind == "dict":
+                return {
+                    k if type(k) is str else str(k): _sanitize(v) for k, v in o.items()
+                }
+            if kind == "msonable":
+                return _sanitize(o.as_dict())
+            if kind == "ndarray":
+                return _sanitize(o.tolist())
+            return self._fallback(o, enum_values)
+
+        return _sanitize(obj)
+
+    def decode(self, obj: Any) -> Any:
+        """
+        Convert a document back into an object.
+
+        Parameters
+        ----------
+        obj
+            A document.
+
+        Returns
+        -------
+        Any
+            The document with all serialized MSONable objects converted to objects.
+        """
+        process_decoded = self._decoder.process_decoded
+
+        def _decode(o):
+            cls = type(o)
+            if cls in _SCALARS:
+                return o
+            if cls is list:
+                if _SCALARS.issuperset(map(type, o)):
+                    return list(o)
+                return [_decode(i) for i in o]
+            if cls is dict and "@module" not in o:
+                return {k: _decode(v) for k, v in o.items()}
+            return process_decoded(o)
+
+        return _decode(obj)
+
+    def _fallback(self, obj: Any, enum_values: bool) -> Any:
+        from monty.json import jsanitize
+
+        return jsanitize(obj, strict=True, enum_values=enum_values, allow_bson=True)
+
+
+_HANDLERS: dict[type, str] = {
+    list: "sequence",
+    tuple: "sequence",
+    dict: "dict",
+}
+
+
+def _get_handler_kind(cls: type) -> str:
+    """
+    Get how objects of a type should be sanitized.
+
+    The checks mirror the order used by ``jsanitize``, so any type that monty treats
+    specially (enums, bson types, numpy and pandas objects, pydantic models, etc.) is
+    passed to monty unless it can be handled identically.
+    """
+    import sys
+    from datetime import datetime
+    from enum import Enum
+    from pathlib import Path
+
+    np = sys.modules.get("numpy")
+    if np is not None and issubclass(cls, np.ndarray):
+        return "ndarray"
+
+    special: tuple[type, ...] = (Enum, datetime, bytes, list, tuple, dict, int, float)
+    special += (Path, str)
+    for module, name in (
+        ("numpy", "generic"),
+        ("pandas", "Series"),
+        ("pandas", "DataFrame"),
+        ("pydantic", "BaseModel"),
+        ("bson.objectid", "ObjectId"),
+    ):
+        special_cls = getattr(sys.modules.get(module), name, None)
+        if special_cls is not None:
+            special += (special_cls,)
+
+    if issubclass(cls, MSONable) and not issubclass(cls, special):
+        return "msonable"
+    return "fallback"
@@ -0,0 +1,120 @@
+import pytest
+
+
+@pytest.fixture
+def clear_hooks():
+    from jobflow.core.hooks import clear_hooks
+
+    clear_hooks()
+    yield
+    clear_hooks()
+
+
+def test_register_hook(clear_hooks):
+    from jobflow.core.hooks import (
+        _HOOKS,
+        call_hooks,
+        register_hook,
+        unregister_hook,
+    )
+
+    calls = []
+
+    @register_hook("on_job_start")
+    def hook(**kwargs):
+        calls.append(kwargs)
+
+    assert _HOOKS["on_job_start"] == [hook]
+    call_hooks("on_job_start", job=1, store=2)
+    assert calls == [{"job": 1, "store": 2}]
+
+    # failing hooks should not raise
+    def bad_hook(**kwargs):
+        raise ValueError("bad hook")
+
+    register_hook("on_job_start", bad_hook)
+    call_hooks("on_job_start", job=1, store=2)
+    assert len(calls) == 2
+
+    unregister_hook("on_job_start", bad_hook)
+    unregister_hook("on_job_start", hook)
+    assert _HOOKS["on_job_start"] == []
+
+    with pytest.raises(ValueError):
+        register_hook("on_bad_event", hook)
+
+
+def test_job_hooks(clear_hooks, memory_jobstore):
+    from jobflow import Flow, job, run_locally
+    from jobflow.core.hooks import HOOK_EVENTS, register_hook
+
+    @job
+    def add(a, b):
+        return a + b
+
+    @job
+    def fail(a):
+        raise ValueError("failed")
+
+    events = []
+    for event in HOOK_EVENTS:
+        register_hook(event, lambda e=event, **kwargs: events.append((e, kwargs)))
+
+    add_job = add(1, 2)
+    fail_job = fail(add_job.output)
+    run_locally(Flow([add_job, fail_job]), store=memory_jobstore)
+
+    names = [e for e, _ in events]
+    assert names == [
+        "on_run_start",
+        "on_job_start",
+        "on_resolve_done",
+        "on_store_write",
+        "on_job_end",
+        "on_job_start",
+        "on_resolve_done",
+        "on_job_end",
+        "on_run_end",
+    ]
+    assert events[0][1]["manager"] == "local"
+    assert events[2][1]["duration"] >= 0
+    assert events[3][1]["docs"][0]["uuid"] == add_job.uuid
+
+    end_kwargs = events[4][1]
+    assert end_kwargs["job"] is add_job
+    assert end_kwargs["response"].output == 3
+    assert end_kwargs["stats"]["function_time"] >= 0
+    assert end_kwargs["error"] is None
+
+    end_kwargs = events[7][1]
+    assert end_kwargs["job"] is fail_job
+    assert end_kwargs["response"] is None
+    assert isinstance(end_kwargs["error"], ValueError)
+    assert events[8][1]["duration"] >= 0
+
+
+def test_batch_write_error_hooks(clear_hooks, memory_jobstore):
+    from jobflow import job
+    from jobflow.core.hooks import register_hook
+    from jobflow.core.job import run_batch
+
+    @job
+    def add(a, b):
+        return a + b
+
+    ended = []
+    register_hook("on_job_end", lambda **kwargs: ended.append(kwargs))
+
+    def fail_update(*args, **kwargs):
+        raise RuntimeError("write failed")
+
+    memory_jobstore.update = fail_update
+    jobs = [add(1, 2), add(3, 4)]
+    with pytest.raises(RuntimeError, match="write failed"):
+        run_batch(jobs, memory_jobstore)
+
+    # jobs that already ran still get an end event with the write error
+    assert [kwargs["job"] for kwargs in ended] == jobs
+    for kwargs in ended:
+        assert kwargs["response"] is None
+        assert isinstance(kwargs["error"], RuntimeError)
@@ -71,8 +71,27 @@ def test_job_init():
     assert test_job.name == "abcxyz"
 
 
+def test_job_default_config():
+    from jobflow.core.job import Job, JobConfig
+
+    test_job = Job(function=add, function_args=(1, 2))
+    assert test_job._config is None
+    assert test_job.config == JobConfig()
+    assert test_job.config is test_job.config
+
+    # the default config should not be shared between jobs
+    test_job.config.manager_config["a"] = 1
+    assert Job(function=add, function_args=(1, 2)).config.manager_config == {}
+
+    # test serialization of the default config
+    decoded_job = Job.from_dict(Job(add).as_dict())
+    assert decoded_job.config == JobConfig()
+
+
 def test_job_run(capsys, memory_jobstore, memory_data_jobstore):
-    from jobflow.core.job import Job, Response
+    import sys
+
+    from jobflow.core.job import Job, JobConfig, Response
 
     # test basic run
     test_job = Job(print, function_args=("I am a job",))
@@ -116,6 +135,27 @@ def test_job_run(capsys, memory_jobstore, memory_data_jobstore):
     result = memory_data_jobstore.query_one({"uuid": test_job.uuid}, load=True)
     assert result["output"] == 3
 
+    # check timing and resource stats were recorded
+    stats = result["stats"]
+    for key in ("resolve_time", "function_time", "serialize_time", "store_time"):
+        assert stats[key] >= 0
+    assert stats["cpu_time"] >= 0
+    assert "store_bytes" not in stats
+    if sys.platform != "win32":
+        assert stats["peak_rss"] > 0
+
+    # the bytes written to additional stores are only recorded if enabled
+    test_job = Job(
+        add,
+        function_args=(1,),
+        function_kwargs={"b": 2},
+        data=True,
+        config=JobConfig(record_bytes=True),
+    )
+    test_job.run(memory_data_jobstore)
+    result = memory_data_jobstore.query_one({"uuid": test_job.uuid})
+    assert result["stats"]["store_bytes"]["data"] > 0
+
     # test non MSONable output
     test_job = Job(bad_output)
     with pytest.raises(RuntimeError):
@@ -502,6 +542,217 @@ def test_job_decorator():
     assert test_job.uuid == test_job.output.uuid
 
 
+def test_job_map(memory_jobstore):
+    from dataclasses import dataclass
+
+    from jobflow import Flow, JobConfig, Maker, job
+    from jobflow.managers.local import run_locally
+
+    config = JobConfig(manager_config={"a": 1})
+
+    @job(config=config)
+    def add_numbers(a, b=10):
+        return a + b
+
+    # test positional and keyword columns
+    flow = add_numbers.map([1, 2, 3], b=[4, 5, 6])
+    assert isinstance(flow, Flow)
+    assert len(flow.jobs) == 3
+    assert flow.output == [j.output for j in flow.jobs]
+    assert [j.function_args for j in flow.jobs] == [(1,), (2,), (3,)]
+    assert [j.function_kwargs for j in flow.jobs] == [{"b": 4}, {"b": 5}, {"b": 6}]
+    assert len({j.uuid for j in flow.jobs}) == 3
+    assert all(j.uuid == j.output.uuid for j in flow.jobs)
+    assert all(j.name.endswith("add_numbers") for j in flow.jobs)
+    assert flow.name == flow.jobs[0].name
+    assert all(j.config is config for j in flow.jobs)
+    assert all(j.hosts == [flow.uuid] for j in flow.jobs)
+    assert flow.jobs[0].hosts is not flow.jobs[1].hosts
+
+    responses = run_locally(flow, store=memory_jobstore, ensure_success=True)
+    assert [responses[j.uuid][1].output for j in flow.jobs] == [5, 7, 9]
+
+    # test keyword arguments only
+    flow = add_numbers.map(a=[1, 2])
+    assert [j.function_kwargs for j in flow.jobs] == [{"a": 1}, {"a": 2}]
+
+    # test bad inputs
+    with pytest.raises(ValueError, match="At least one"):
+        add_numbers.map()
+
+    with pytest.raises(ValueError, match="same length"):
+        add_numbers.map([1, 2], b=[1])
+
+    with pytest.raises(ValueError, match="must be sequences"):
+        add_numbers.map(1)
+
+    # test makers are copied for each job
+    @dataclass
+    class AddMaker(Maker):
+        name: str = "add"
+        b: int = 2
+
+        @job
+        def make(self, a):
+            return a + self.b
+
+    maker = AddMaker(b=3)
+    flow = maker.make.map([1, 2])
+    assert len(flow.jobs) == 2
+    assert flow.jobs[0].maker == maker
+    assert flow.jobs[0].maker is not flow.jobs[1].maker
+    assert flow.jobs[0].name == "add"
+    assert flow.jobs[0].function_args == (1,)
+
+    flow.jobs[0].name = "renamed"
+    assert flow.jobs[0].name == "renamed"
+    assert flow.jobs[1].name == "add"
+
+    # map can also be called on the class with the maker as the first argument
+    class_flow = AddMaker.make.map(maker, [1, 2])
+    assert [j.function_args for j in class_flow.jobs] == [(1,), (2,)]
+    assert class_flow.jobs[0].maker == maker
+
+    # the flow output is the list of job outputs
+    assert flow.output == [j.output for j in flow.jobs]
+
+    responses = run_locally(flow, store=memory_jobstore, ensure_success=True)
+    assert [responses[j.uuid][1].output for j in flow.jobs] == [4, 5]
+
+
+def test_run_batch(memory_jobstore, memory_data_jobstore):
+    from jobflow.core.job import JobConfig, Response, job, run_batch
+
+    @job
+    def divide(a, b):
+        return a / b
+
+    jobs = [divide(1, 2), divide(1, 0), divide(3, 2)]
+    results = run_batch(jobs, memory_jobstore)
+
+    assert len(results) == 3
+    assert isinstance(results[0], Response)
+    assert results[0].output == 0.5
+    assert isinstance(results[1], ZeroDivisionError)
+    assert results[2].output == 1.5
+
+    # outputs of the successful jobs are stored under their uuids
+    assert memory_jobstore.get_output(jobs[0].uuid) == 0.5
+    assert memory_jobstore.get_output(jobs[2].uuid) == 1.5
+    assert memory_jobstore.query_one({"uuid": jobs[1].uuid}) is None
+
+    # the bytes written to additional stores are only recorded if enabled
+    @job(data=True)
+    def halve(a):
+        return a / 2
+
+    jobs = [halve(1), halve(3), halve(5)]
+    jobs[0].update_config(JobConfig(record_bytes=True))
+    run_batch(jobs, memory_data_jobstore)
+    stats = [memory_data_jobstore.query_one({"uuid": j.uuid})["stats"] for j in jobs]
+    assert stats[0]["store_bytes"]["data"] > 0
+    assert "store_bytes" not in stats[1]
+    assert "store_bytes" not in stats[2]
+
+
+def test_generator_output(memory_jobstore, memory_data_jobstore, monkeypatch):
+    from jobflow.core.job import job
+    from jobflow.core.store import ChunkedOutput
+
+    @job(data=True)
+    def extract(n):
+        for i in range(n):
+            yield [{"record": j} for j in range(i * 2, (i + 1) * 2)]
+
+    @job
+    def count(chunks):
+        return [len(chunk) for chunk in chunks]
+
+    # chunks are written to the data store as they are produced
+    extract_job = extract(3)
+    response = extract_job.run(memory_data_jobstore)
+    assert isinstance(response.output, ChunkedOutput)
+    assert len(response.output) == 3
+    assert memory_data_jobstore.additional_stores["data"].count({"chunk": 2}) == 1
+    assert list(response.output)[1] == [{"record": 2}, {"record": 3}]
+
+    # the chunked output record is kept in the docs store, only the chunks are blobs
+    doc = memory_data_jobstore.query_one({"uuid": extract_job.uuid})
+    assert doc["output"]["@class"] == "ChunkedOutput"
+    assert "blob_uuid" not in doc["output"]
+    data_store = memory_data_jobstore.additional_stores["data"]
+    assert data_store.count({"job_uuid": extract_job.uuid}) == 3
+
+    # chunks are loaded lazily by downstream jobs
+    count_job = count(extract_job.output)
+    response = count_job.run(memory_data_jobstore)
+    assert response.output == [2, 2, 2]
+
+    # all chunks are loaded using a single query
+    output = extract_job.output.resolve(memory_data_jobstore)
+    queries = []
+    query = data_store.query
+
+    def counted_query(*args, **kwargs):
+        queries.append(1)
+        return query(*args, **kwargs)
+
+    monkeypatch.setattr(data_store, "query", counted_query)
+    assert [chunk[0]["record"] for chunk in output] == [0, 2, 4]
+    assert len(queries) == 1
+    monkeypatch.undo()
+
+    # single chunks can be loaded by index, including through references
+    assert output[1] == [{"record": 2}, {"record": 3}]
+    assert output[-1] == [{"record": 4}, {"record": 5}]
+    assert output[1:] == [
+        [{"record": 2}, {"record": 3}],
+        [{"record": 4}, {"record": 5}],
+    ]
+    with pytest.raises(IndexError):
+        output[3]
+    count_job = count(extract_job.output[2])
+    response = count_job.run(memory_data_jobstore)
+    assert response.output == [1, 1]
+
+    # rerunning with fewer chunks removes the extra chunks
+    extract_job.function_args = (2,)
+    response = extract_job.run(memory_data_jobstore)
+    assert len(response.output) == 2
+    assert data_store.count({"job_uuid": extract_job.uuid}) == 2
+
+    # without an additional store, the chunks are collected into a list
+    extract_job = job(extract.original)(2)
+    response = extract_job.run(memory_jobstore)
+    assert response.output == [
+        [{"record": 0}, {"record": 1}],
+        [{"record": 2}, {"record": 3}],
+    ]
+
+
+def test_lazy_blobs(memory_data_jobstore):
+    from jobflow.core.job import JobConfig, job
+    from jobflow.core.store import LazyBlob
+
+    @job(data="values")
+    def make_data():
+        return {"use_values": False, "values": list(range(10))}
+
+    @job(config=JobConfig(lazy_blobs=True))
+    def branch(output):
+        assert isinstance(output["values"], LazyBlob)
+        if output["use_values"]:
+            return sum(output["values"])
+        return output["values"].loaded
+
+    make_job = make_data()
+    make_job.run(memory_data_jobstore)
+
+    # the values are never loaded
+    response = branch(make_job.output).run(memory_data_jobstore)
+    assert response.output is False
+
+
 def test_response():
     # no need to test init as it is just a dataclass, instead test from_job_returns
     # test no job returns
@@ -1258,3 +1509,59 @@ def test_update_config(memory_jobstore):
     response = test_job.run(memory_jobstore)
     assert response.replace.jobs[0].config == new_config
     assert response.replace.jobs[0].config_updates[0]["config"] == new_config
+
+
+def test_check_flow_or_job(monkeypatch):
+    import warnings
+
+    import pytest
+
+    from jobflow import SETTINGS, Flow, Job
+    from jobflow.settings import _read_setting
+
+    with pytest.warns(UserWarning, match="contains an Flow or Job"):
+        Job(str, function_args=(Job(str),))
+
+    monkeypatch.setattr(SETTINGS, "CHECK_FLOW_OR_JOB", False)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        Job(str, function_args=(Job(str),))
+        Flow([], output=Job(str))
+
+    # the setting can be read without creating the full settings
+    monkeypatch.setenv("JOBFLOW_CONFIG_FILE", "/some/not/existing/path")
+    monkeypatch.setenv("JOBFLOW_CHECK_FLOW_OR_JOB", "false")
+    _read_setting.cache_clear()
+    assert _read_setting("CHECK_FLOW_OR_JOB") is False
+    _read_setting.cache_clear()
+
+
+def test_serialize_once():
+    from maggma.stores import MemoryStore
+
+    from jobflow import Job, JobStore
+    from jobflow.utils import FastSerializer
+
+    sanitized = []
+
+    class CountingSerializer(FastSerializer):
+        def sanitize(self, obj, enum_values=True):
+            sanitized.append(obj)
+            return super().sanitize(obj, enum_values=enum_values)
+
+    store = JobStore(
+        MemoryStore(),
+        additional_stores={"data": MemoryStore()},
+        serializer=CountingSerializer(),
+    )
+    store.connect()
+
+    output = {"a": list(range(10)), "b": "x"}
+    job = Job(dict, function_kwargs=output, data="a", metadata={"c": 1})
+    job.run(store)
+
+    # the output document is not serialized again when writing to the store
+    assert not any(isinstance(obj, dict) and "output" in obj for obj in sanitized)
+    assert store.get_output(job.uuid, load=True) == output
+    assert store.query_one({"uuid": job.uuid})["metadata"] == {"c": 1}
+    assert store.additional_stores["data"].count() == 1
@@ -95,6 +95,17 @@ def test_hash():
         OutputReference("123", (("a", "b"), ("i", "2")))
     )
 
+    # deserialized references store the attributes as lists
+    ref = OutputReference("123", (("a", "b"), ("i", 2)))
+    list_ref = OutputReference("123", [["a", "b"], ["i", 2]])
+    assert list_ref.attributes == (("a", "b"), ("i", 2))
+    assert hash(list_ref) == hash(ref)
+    assert len({ref, list_ref, OutputReference.from_dict(ref.as_dict())}) == 1
+
+    # test hash is updated when the uuid changes
+    ref.set_uuid("1234")
+    assert hash(ref) == hash(OutputReference("1234", (("a", "b"), ("i", 2))))
+
 
 def test_eq():
     from jobflow import OutputReference
@@ -211,6 +222,38 @@ def test_schema():
     assert ref.nested.nested_d["a"].n.uuid == "123"
 
 
+def test_schema_cache(monkeypatch):
+    from pydantic import BaseModel
+
+    from jobflow import OutputReference
+
+    class InnerSchema(BaseModel):
+        n: float
+
+    class MySchema(BaseModel):
+        number: int
+        nested: InnerSchema
+
+    # count the number of times the JSON schema is generated
+    calls = []
+    schema = MySchema.schema
+
+    def counted_schema(*args, **kwargs):
+        calls.append(1)
+        return schema(*args, **kwargs)
+
+    monkeypatch.setattr(MySchema, "schema", counted_schema)
+
+    ref = OutputReference("123", output_schema=MySchema)
+    for _ in range(5):
+        assert ref.nested.n.uuid == "123"
+        assert ref["number"].output_schema is None
+        assert ref.nested.output_schema is InnerSchema
+        with pytest.raises(AttributeError):
+            _ = ref.nested.m
+    assert len(calls) == 1
+
+
 def test_resolve(memory_jobstore):
     from jobflow import OnMissing, OutputReference
 
@@ -313,6 +313,79 @@ def test_groupby(memory_jobstore):
     data = list(memory_jobstore.groupby(["e", "d"], properties=["uuid"]))
     assert len(data) == 3
 
+    # properties are not modified and only the requested fields are returned
+    properties = ["f"]
+    data = list(memory_jobstore.groupby("d", properties=properties))
+    assert properties == ["f"]
+    assert all(set(doc) - {"_id"} == {"d", "f"} for _, docs in data for doc in docs)
+
+    properties = {"f": 1}
+    data = list(memory_jobstore.groupby("d", properties=properties, limit=3))
+    assert properties == {"f": 1}
+    assert all(set(doc) - {"_id"} == {"d", "f"} for _, docs in data for doc in docs)
+
+    # documents missing a key are not grouped
+    memory_jobstore.update({"e": 7, "uuid": 5, "index": 1}, key="uuid")
+    data = list(memory_jobstore.groupby(["e", "d"]))
+    assert len(data) == 3
+
+    # sort, skip and limit are applied before grouping
+    data = list(memory_jobstore.groupby("d", sort={"f": -1}, limit=2))
+    assert sorted((g["d"], [d["f"] for d in docs]) for g, docs in data) == [
+        (9, [11]),
+        (10, [12]),
+    ]
+
+
+def test_groupby_load(memory_data_jobstore):
+    from maggma.stores import MemoryStore
+
+    docs = [
+        {"uuid": i, "index": 1, "group": i % 2, "data": list(range(i))}
+        for i in range(1, 5)
+    ]
+    memory_data_jobstore.update(docs, save={"data": "data"})
+
+    # documents and blobs are loaded with one query for a batch of groups
+    queries: dict[str, list] = {"docs": [], "data": []}
+
+    def count_queries(name, store):
+        query = store.query
+
+        def counting_query(*args, **kwargs):
+            if "$in" in str(kwargs.get("criteria")):
+                queries[name].append(kwargs)
+            return query(*args, **kwargs)
+
+        store.query = counting_query
+
+    count_queries("docs", memory_data_jobstore.docs_store)
+    count_queries("data", memory_data_jobstore.additional_stores["data"])
+    groups = memory_data_jobstore.groupby("group", load=True)
+    assert len(queries["docs"]) == 0
+
+    group, group_docs = next(groups)
+    assert len(queries["docs"]) == 1
+    assert len(queries["data"]) == 1
+    for doc in group_docs:
+        assert doc["group"] == group["group"]
+        assert doc["data"] == list(range(doc["uuid"]))
+
+    assert len(list(groups)) == 1
+    assert len(queries["docs"]) == 1
+    assert len(queries["data"]) == 1
+    del memory_data_jobstore.docs_store.query
+
+    # test fallback for stores that do not support grouping
+    class NoGroupStore(MemoryStore):
+        def groupby(self, *args, **kwargs):
+            raise NotImplementedError
+
+    memory_data_jobstore.docs_store.__class__ = NoGroupStore
+    data = list(memory_data_jobstore.groupby("group", load=True))
+    assert [g["group"] for g, _ in data] == [0, 1]
+    assert data[0][1][0]["data"] == [0, 1]
+
 
 def test_remove_docs(memory_jobstore, memory_data_jobstore):
     d1 = {"a": 1, "b": 2, "c": 3, "index": 1, "uuid": 1}
@@ -337,6 +410,37 @@ def test_remove_docs(memory_jobstore, memory_data_jobstore):
     assert len(list(data_store.query({"job_uuid": 2}))) == 1
 
 
+def test_remove_docs_bulk(memory_data_jobstore):
+    docs = [
+        {"uuid": str(i), "index": 1, "hosts": ["inner", "root1"], "c": i}
+        for i in range(5)
+    ]
+    docs += [{"uuid": "5", "index": 2, "hosts": ["root2"], "c": 5}]
+    memory_data_jobstore.update(docs, save={"data": "c"})
+
+    data_store = memory_data_jobstore.additional_stores["data"]
+    remove_docs = data_store.remove_docs
+    calls = []
+
+    def counting_remove_docs(criteria):
+        calls.append(criteria)
+        return remove_docs(criteria)
+
+    data_store.remove_docs = counting_remove_docs
+
+    # removing many documents only needs one delete per index
+    memory_data_jobstore.remove_docs({"uuid": {"$in": ["3", "4", "5"]}})
+    assert len(calls) == 2
+    assert memory_data_jobstore.count() == 3
+    assert data_store.count() == 3
+
+    # remove the whole root flow of a job
+    memory_data_jobstore.remove_docs({"uuid": "0"}, cascade_hosts=True)
+    assert len(calls) == 3
+    assert memory_data_jobstore.count() == 0
+    assert data_store.count() == 0
+
+
 def test_get_output(memory_jobstore):
     from jobflow import OnMissing
 
@@ -407,6 +511,58 @@ def test_get_output(memory_jobstore):
         memory_jobstore.get_output("5", which="all")
 
 
+def test_get_output_lazy_blobs(memory_data_jobstore):
+    from jobflow import JobConfig, OutputReference
+    from jobflow.core.store import LazyBlob
+
+    doc = {"uuid": "1", "index": 1, "output": {"flag": True, "data": [1, 2, 3]}}
+    memory_data_jobstore.update(doc, save={"data": "data"})
+
+    output = memory_data_jobstore.get_output("1", load=True, lazy_blobs=True)
+    assert output["flag"] is True
+    assert isinstance(output["data"], LazyBlob)
+    assert not output["data"].loaded
+
+    # data is loaded on first access
+    assert len(output["data"]) == 3
+    assert output["data"].loaded
+    assert output["data"] == [1, 2, 3]
+    assert list(output["data"]) == [1, 2, 3]
+    assert output["data"].value == [1, 2, 3]
+
+    # the whole output can also be a lazy blob
+    doc = {"uuid": "2", "index": 1, "output": {"a": 1}}
+    memory_data_jobstore.update(doc, save={"data": "output"})
+    output = memory_data_jobstore.get_output("2", load=True, lazy_blobs=True)
+    assert isinstance(output, LazyBlob)
+    assert output["a"] == 1
+
+    # only blobs selected by load are proxied
+    output = memory_data_jobstore.get_output("1", lazy_blobs=True)
+    assert set(output["data"]) == {"@class", "@module", "blob_uuid", "store"}
+
+    # blobs saved by class are not decoded when references are resolved
+    memory_data_jobstore.update(
+        {
+            "uuid": "3",
+            "index": 1,
+            "output": {"config": JobConfig(), "ref": OutputReference("2")},
+        },
+        save={"data": JobConfig},
+    )
+    output = memory_data_jobstore.get_output("3", load=True, lazy_blobs=True)
+    assert isinstance(output["config"], LazyBlob)
+    assert not output["config"].loaded
+    assert output["ref"] == {"a": 1}
+    assert output["config"].value == JobConfig()
+
+    output = memory_data_jobstore.get_output(
+        "3", load={"data": JobConfig}, lazy_blobs=True
+    )
+    assert isinstance(output["config"], LazyBlob)
+    assert not output["config"].loaded
+
+
 def test_from_db_file(test_data):
     from jobflow import JobStore
 
@@ -437,3 +593,102 @@ def test_from_db_file(test_data):
 def test_ensure_index(memory_jobstore):
     assert memory_jobstore.ensure_index("test_key")
     # TODO: How to check for exception?
+
+
+def test_ensure_indexes(tmp_path):
+    from maggma.stores import MemoryStore
+
+    from jobflow import JobStore
+    from jobflow.stores import SQLiteStore
+
+    def get_indexes(store):
+        info = store._collection.index_information().values()
+        return {tuple(k for k, _ in index["key"]) for index in info}
+
+    doc = {"uuid": "a", "index": 1, "output": 1}
+
+    store = JobStore(MemoryStore(), additional_stores={"data": MemoryStore("data")})
+    with store as s:
+        # indexes are only created when first writing
+        assert ("uuid", "index") not in get_indexes(s.docs_store)
+
+        s.update(doc)
+        assert ("uuid", "index") in get_indexes(s.docs_store)
+        data_indexes = get_indexes(s.additional_stores["data"])
+        assert ("blob_uuid",) in data_indexes
+        assert ("job_uuid", "job_index") in data_indexes
+
+        # resetting the connection should recreate the indexes without duplicates
+        s.connect(force_reset=True)
+        s.update(doc)
+        s.update(doc)
+        assert len(get_indexes(s.docs_store)) == 2
+
+    # test opt out
+    store = JobStore(MemoryStore(), ensure_indexes=False)
+    with store as s:
+        s.update(doc)
+        assert ("uuid", "index") not in get_indexes(s.docs_store)
+
+    # stores without mongo-like collections use ensure_index
+    store = JobStore(SQLiteStore(tmp_path / "jobflow.db"))
+    with store as s:
+        s.update(doc)
+        assert s.count() == 1
+
+
+def test_update_multiple_additional_stores():
+    from maggma.stores import MemoryStore
+
+    from jobflow import JobStore
+
+    store = JobStore(
+        MemoryStore(), additional_stores={"data": MemoryStore(), "other": MemoryStore()}
+    )
+    store.connect()
+
+    d = {"index": 1, "uuid": 1, "data": {"x": [1, 2]}, "y": 3}
+    store.update(d, save={"data": "data", "other": ["x", "y"]})
+
+    assert store.additional_stores["data"].count() == 1
+    assert store.additional_stores["other"].count() == 1
+    blob = store.additional_stores["other"].query_one()
+    assert blob["data"] == 3
+
+    doc = store.query_one({"uuid": 1}, load=True)
+    assert doc["data"] == {"x": [1, 2]}
+    assert doc["y"] == 3
+
+
+def test_update_stats(memory_data_jobstore):
+    d = {"index": 1, "uuid": 1, "data": [1, 2, 3]}
+    memory_data_jobstore.update(d, save={"data": "data"}, stats_key="stats")
+    stats = memory_data_jobstore.query_one({"uuid": 1})["stats"]
+    assert stats["store_time"] >= 0
+    assert "store_bytes" not in stats
+
+    d = {"index": 1, "uuid": 2, "data": [1, 2, 3]}
+    memory_data_jobstore.update(
+        d, save={"data": "data"}, stats_key="stats", record_bytes=True
+    )
+    stats = memory_data_jobstore.query_one({"uuid": 2})["stats"]
+    assert stats["store_bytes"]["data"] > 0
+
+
+def test_serializer():
+    from maggma.stores import MemoryStore
+
+    from jobflow import Job, JobStore
+    from jobflow.utils import FastSerializer, MontySerializer
+
+    store = JobStore(MemoryStore())
+    assert isinstance(store.serializer, FastSerializer)
+
+    store = JobStore(MemoryStore(), serializer=MontySerializer())
+    store = JobStore.from_dict(store.as_dict())
+    assert isinstance(store.serializer, MontySerializer)
+
+    store.connect()
+    job = Job(dict, function_kwargs={"a": 1})
+    job.run(store)
+    assert store.get_output(job.uuid) == {"a": 1}
@@ -1,5 +1,21 @@
 import pytest
 
+from jobflow import Flow, Response, job
+
+
+@job
+def add(a, b):
+    return a + b
+
+
+@job
+def dynamic():
+    return Response(
+        replace=Flow([add(1, 2)]),
+        detour=add(3, 4),
+        addition=[add(i, 1) for i in range(5)],
+    )
+
 
 def test_flow_to_workflow(
     memory_jobstore, simple_job, simple_flow, connected_flow, nested_flow
@@ -96,6 +112,87 @@ def test_job_to_firework(
         job_to_firework(job2, memory_jobstore, parents=[job.uuid])
 
 
+def test_flow_to_workflow_store_in_metadata(memory_jobstore, connected_flow):
+    import mongomock
+
+    from jobflow import JobStore
+    from jobflow.managers.fireworks import (
+        STORE_METADATA_KEY,
+        clear_store_cache,
+        flow_to_workflow,
+        get_cached_store,
+    )
+
+    flow = connected_flow()
+    wf = flow_to_workflow(flow, memory_jobstore, store_in_metadata=True)
+
+    assert wf.metadata[STORE_METADATA_KEY] == memory_jobstore.as_dict()
+    assert all(fw.tasks[0]["store"] is None for fw in wf.fws)
+    assert all(fw.tasks[0]["store_in_metadata"] for fw in wf.fws)
+    parent, child = wf.fws
+    assert wf.links == {parent.fw_id: [child.fw_id], child.fw_id: []}
+
+    # run the first firework using a fake launchpad
+    class LaunchPad:
+        workflows = mongomock.MongoClient().db.workflows
+
+    LaunchPad.workflows.insert_one(
+        {"nodes": list(wf.links.nodes), "metadata": wf.metadata}
+    )
+    task = parent.tasks[0]
+    task.launchpad = LaunchPad()
+    task.fw_id = parent.fw_id
+    clear_store_cache()
+    task.run_task({})
+    store = get_cached_store(JobStore.from_dict(wf.metadata[STORE_METADATA_KEY]))
+    assert store.get_output(flow.jobs[0].uuid) == "12345_end"
+    clear_store_cache()
+
+    # no store means the settings store is used
+    wf = flow_to_workflow(connected_flow(), store_in_metadata=True)
+    assert STORE_METADATA_KEY not in wf.metadata
+
+
+def test_combined_dynamic_workflows(memory_jobstore):
+    from jobflow.managers.fireworks import clear_store_cache, flow_to_workflow
+
+    wf = flow_to_workflow(dynamic(), memory_jobstore)
+    clear_store_cache()
+    action = wf.fws[0].tasks[0].run_task({})
+    clear_store_cache()
+
+    # the replace and detour are converted into a single workflow
+    assert len(action.detours) == 1
+    assert len(action.detours[0].fws) == 2
+    assert len(action.additions) == 1
+    assert len(action.additions[0].fws) == 5
+
+
+def test_get_cached_store():
+    from maggma.stores import MemoryStore
+
+    from jobflow import JobStore
+    from jobflow.managers.fireworks import clear_store_cache, get_cached_store
+
+    clear_store_cache()
+    store = JobStore(MemoryStore("cached"), additional_stores={"data": MemoryStore()})
+    cached_store = get_cached_store(store)
+    assert cached_store is store
+    assert store.docs_store._coll is not None
+
+    # a deserialized copy of the same store should reuse the connected store
+    copy = JobStore.from_dict(store.as_dict())
+    assert get_cached_store(copy) is store
+
+    # a different store should be connected separately
+    other = JobStore(MemoryStore("other"))
+    assert get_cached_store(other) is other
+
+    clear_store_cache()
+    assert get_cached_store(copy) is copy
+    clear_store_cache()
+
+
 def test_simple_flow(lpad, mongo_jobstore, fw_dir, simple_flow, capsys):
     from fireworks.core.rocket_launcher import rapidfire
 
@@ -1,5 +1,12 @@
 import pytest
 
+from jobflow import job
+
+
+@job
+def join(a, b):
+    return a + b
+
 
 def test_simple_job(memory_jobstore, clean_dir, simple_job):
     from jobflow import run_locally
@@ -361,3 +368,138 @@ def test_detour_stop_flow(memory_jobstore, clean_dir, detour_stop_flow):
     assert result1["output"] == 11
     assert result2["output"] == "1234"
     assert result3 is None
+
+
+def test_batched_flow(memory_jobstore, clean_dir, simple_job, monkeypatch):
+    from jobflow import Flow, run_locally
+
+    fan_out = simple_job.map(["1", "2", "3", "4", "5"])
+    final = simple_job(fan_out.jobs[0].output)
+    flow = Flow([fan_out, final])
+
+    # count the number of writes to the docs store
+    update = memory_jobstore.docs_store.update
+    writes = []
+
+    def counted_update(docs, *args, **kwargs):
+        writes.append(len(docs))
+        return update(docs, *args, **kwargs)
+
+    monkeypatch.setattr(memory_jobstore.docs_store, "update", counted_update)
+
+    responses = run_locally(
+        flow, store=memory_jobstore, batch_size=3, ensure_success=True
+    )
+
+    # check responses and outputs have been stored under the original uuids
+    assert len(responses) == 6
+    for j, message in zip(fan_out.jobs, ["1", "2", "3", "4", "5"]):
+        assert responses[j.uuid][1].output == message + "_end"
+        result = memory_jobstore.query_one({"uuid": j.uuid})
+        assert result["output"] == message + "_end"
+    assert responses[final.uuid][1].output == "1_end_end"
+
+    # 5 jobs in batches of 3 and 2, then the dependent job
+    assert sorted(writes) == [1, 2, 3]
+
+
+def test_batched_connected_flow(memory_jobstore, clean_dir, connected_flow):
+    from jobflow import run_locally
+
+    flow = connected_flow()
+    uuid1 = flow.jobs[0].uuid
+    uuid2 = flow.jobs[1].uuid
+
+    # dependent jobs cannot be run in the same batch
+    responses = run_locally(flow, store=memory_jobstore, batch_size=5)
+    assert responses[uuid1][1].output == "12345_end"
+    assert responses[uuid2][1].output == "12345_end_end"
+
+
+def test_batched_error_flow(memory_jobstore, clean_dir, error_flow, capsys):
+    from jobflow import run_locally
+
+    flow = error_flow()
+
+    responses = run_locally(flow, store=memory_jobstore, batch_size=5)
+    assert len(responses) == 0
+
+    captured = capsys.readouterr()
+    assert "error_func failed with exception" in captured.out
+
+    with pytest.raises(RuntimeError):
+        run_locally(flow, store=memory_jobstore, batch_size=5, ensure_success=True)
+
+
+def test_prefetch_flow(memory_jobstore, clean_dir, simple_job, monkeypatch):
+    from jobflow import Flow, JobStore, run_locally
+    from jobflow.stores import InstrumentedJobStore, SQLiteStore
+
+    first = simple_job("1")
+    second = simple_job("2")
+    combined = join(first.output, second.output)
+    flow = Flow([first, second, combined])
+
+    # count the outputs fetched in the main thread
+    get_output = JobStore.get_output
+    fetched = []
+
+    def counted_get_output(self, uuid, *args, **kwargs):
+        import threading
+
+        if threading.current_thread() is threading.main_thread():
+            fetched.append(uuid)
+        return get_output(self, uuid, *args, **kwargs)
+
+    monkeypatch.setattr(JobStore, "get_output", counted_get_output)
+
+    store = InstrumentedJobStore(SQLiteStore("jobflow.db"))
+    responses = run_locally(flow, store=store, prefetch=2, ensure_success=True)
+    assert responses[combined.uuid][1].output == "1_end2_end"
+
+    # the output of the job that ran first is prefetched while the other job runs
+    assert len(fetched) == 1
+
+    # prefetch queries are recorded against the job they were made for
+    job_stats = store.get_stats()["jobs"]
+    assert job_stats[second.uuid]["operations"].get("get_output") is None
+    assert job_stats[combined.uuid]["operations"]["get_output"]["calls"] == 2
+
+    # stores that are not thread-safe are not prefetched from
+    fetched.clear()
+    flow = Flow([simple_job("1"), simple_job("2")])
+    flow.add_jobs(join(flow.jobs[0].output, flow.jobs[1].output))
+    with pytest.warns(UserWarning, match="Prefetching is disabled"):
+        run_locally(flow, store=memory_jobstore, prefetch=2, ensure_success=True)
+    assert len(fetched) == 2
+
+    # without prefetching, both outputs are fetched when resolving the references
+    fetched.clear()
+    flow = Flow([simple_job("1"), simple_job("2")])
+    flow.add_jobs(join(flow.jobs[0].output, flow.jobs[1].output))
+    run_locally(flow, store=memory_jobstore, ensure_success=True)
+    assert len(fetched) == 2
+
+
+def test_batched_stop_jobflow(memory_jobstore, clean_dir):
+    from jobflow import Flow, Response, job, run_locally
+    from jobflow.core.job import run_batch
+
+    @job
+    def stop(a):
+        return Response(output=a, stop_jobflow=a == 2)
+
+    jobs = [stop(1), stop(2), stop(3)]
+
+    # the jobs after the one that stops the flow are not run
+    results = run_batch(jobs, memory_jobstore)
+    assert [r.output for r in results] == [1, 2]
+    assert memory_jobstore.get_output(jobs[1].uuid) == 2
+    assert memory_jobstore.query_one({"uuid": jobs[2].uuid}) is None
+
+    jobs = [stop(1), stop(2), stop(3)]
+    responses = run_locally(Flow(jobs), store=memory_jobstore, batch_size=3)
+    assert jobs[0].uuid in responses
+    assert jobs[1].uuid in responses
+    assert jobs[2].uuid not in responses
+    assert memory_jobstore.query_one({"uuid": jobs[2].uuid}) is None
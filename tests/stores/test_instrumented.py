@@ -0,0 +1,68 @@
+def test_instrumented_store():
+    from maggma.stores import MemoryStore
+
+    from jobflow import Flow, job, run_locally
+    from jobflow.stores import InstrumentedJobStore
+
+    @job(data=True)
+    def make_list(n):
+        return list(range(n))
+
+    @job
+    def total(values):
+        return sum(values)
+
+    store = InstrumentedJobStore(
+        MemoryStore(), additional_stores={"data": MemoryStore()}
+    )
+    list_job = make_list(5)
+    total_job = total(list_job.output)
+    run_locally(Flow([list_job, total_job]), store=store)
+
+    stats = store.get_stats()
+    total_stats = stats["total"]
+    assert total_stats["operations"]["update"]["calls"] == 2
+    assert total_stats["operations"]["update"]["docs"] == 2
+    assert total_stats["bytes_written"] > 0
+
+    # resolving the reference queries the latest index (once when filling the cache
+    # and once when resolving from it) then gets the output, which loads the data
+    # from the additional store
+    job_stats = stats["jobs"][total_job.uuid]
+    assert job_stats["operations"]["query_one"]["calls"] == 2
+    assert job_stats["operations"]["get_output"]["calls"] == 1
+    assert job_stats["queries"] == 3
+    assert job_stats["blob_fetches"] == 1
+    assert job_stats["blobs_read"] == 1
+    assert job_stats["bytes_read"] > 0
+    assert sum(job_stats["operations"]["get_output"]["histogram"]) == 1
+
+    # the first job does not read from the store
+    assert stats["jobs"][list_job.uuid]["queries"] == 0
+
+    # test queries made outside of jobs
+    with store as s:
+        docs = list(s.query({"uuid": list_job.uuid}, load=True))
+        assert docs[0]["output"] == [0, 1, 2, 3, 4]
+        assert s.count() == 2
+    assert store.stats.operations["query"].calls == 1
+    assert store.stats.operations["query"].docs == 1
+    assert store.stats.operations["count"].calls == 1
+
+    store.reset_stats()
+    assert store.get_stats() == {"total": store.stats.as_dict(), "jobs": {}}
+    assert store.stats.queries == 0
+
+
+def test_serialization():
+    from maggma.stores import MemoryStore
+    from monty.json import MontyDecoder, MontyEncoder
+
+    from jobflow.stores import InstrumentedJobStore
+
+    store = InstrumentedJobStore(MemoryStore(), ensure_indexes=False)
+    encoded = MontyEncoder().encode(store)
+    decoded = MontyDecoder().decode(encoded)
+    assert isinstance(decoded, InstrumentedJobStore)
+    assert decoded.ensure_indexes is False
+    assert decoded.stats.queries == 0
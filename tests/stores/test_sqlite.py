@@ -0,0 +1,209 @@
+import pytest
+
+
+@pytest.fixture
+def sqlite_store(tmp_path):
+    from jobflow.stores import SQLiteStore
+
+    store = SQLiteStore(tmp_path / "jobflow.db")
+    store.connect()
+    yield store
+    store.close()
+
+
+def test_basic(sqlite_store, tmp_path):
+    from maggma.core import StoreError
+
+    from jobflow.stores import SQLiteStore
+
+    assert sqlite_store.name == f"sqlite://{tmp_path / 'jobflow.db'}/outputs"
+    assert sqlite_store == SQLiteStore(tmp_path / "jobflow.db")
+    assert sqlite_store != SQLiteStore(tmp_path / "jobflow.db", "other")
+    assert sqlite_store.count() == 0
+    assert sqlite_store.ensure_index("uuid")
+    assert not sqlite_store.ensure_index("data")
+
+    sqlite_store.close()
+    with pytest.raises(StoreError):
+        sqlite_store.count()
+
+    # test serialization
+    store = SQLiteStore.from_dict(sqlite_store.as_dict())
+    assert store == sqlite_store
+
+
+def test_update_query(sqlite_store):
+    docs = [
+        {"uuid": "a", "index": 1, "name": "add", "hosts": ["f1"], "output": 1},
+        {"uuid": "a", "index": 2, "name": "add", "hosts": ["f1"], "output": 2},
+        {"uuid": "b", "index": 1, "name": "mul", "hosts": ["f1", "f2"], "output": 3},
+    ]
+    sqlite_store.update(docs, key=["uuid", "index"])
+    assert sqlite_store.count() == 3
+
+    # replace existing document
+    sqlite_store.update(
+        {"uuid": "a", "index": 2, "name": "add", "hosts": ["f1"], "output": 5},
+        key=["uuid", "index"],
+    )
+    assert sqlite_store.count() == 3
+    assert sqlite_store.query_one({"uuid": "a", "index": 2})["output"] == 5
+
+    # indexed fields
+    assert sqlite_store.count({"uuid": "a"}) == 2
+    assert sqlite_store.count({"name": "mul"}) == 1
+    assert sqlite_store.count({"hosts": "f1"}) == 3
+    assert sqlite_store.count({"hosts": {"$in": ["f2", "f3"]}}) == 1
+    assert sqlite_store.count({"uuid": {"$in": ["a", "b"]}, "index": {"$gt": 1}}) == 1
+
+    # criteria evaluated in python
+    assert sqlite_store.count({"output": {"$gte": 3}}) == 2
+    assert sqlite_store.count({"uuid": "a", "output": 1}) == 1
+
+    # latest index
+    result = sqlite_store.query_one({"uuid": "a"}, sort={"index": -1})
+    assert result["index"] == 2
+    assert sqlite_store.latest_indexes() == {"a": 2, "b": 1}
+    assert sqlite_store.latest_indexes(["b"]) == {"b": 1}
+
+    # sort, skip, limit, and projection
+    results = list(sqlite_store.query(sort={"output": -1}, properties=["output"]))
+    assert results == [{"output": 5}, {"output": 3}, {"output": 1}]
+    results = list(sqlite_store.query(sort={"uuid": 1, "index": -1}, skip=1, limit=1))
+    assert (results[0]["uuid"], results[0]["index"]) == ("a", 1)
+
+    # groupby and distinct
+    groups = list(sqlite_store.groupby("uuid", properties=["index"]))
+    assert [(g["uuid"], len(d)) for g, d in groups] == [("a", 2), ("b", 1)]
+    assert sqlite_store.distinct("name") == ["add", "mul"]
+
+    # remove
+    sqlite_store.remove_docs({"hosts": "f2"})
+    assert sqlite_store.count() == 2
+    sqlite_store.remove_docs({"output": 1})
+    assert sqlite_store.count() == 1
+
+
+def test_blobs(sqlite_store):
+    # documents written to additional stores are indexed by job and blob uuid
+    docs = [
+        {"job_uuid": "a", "job_index": 1, "blob_uuid": str(i), "data": i}
+        for i in range(3)
+    ]
+    sqlite_store.update(docs, key="blob_uuid")
+    sqlite_store.update({"job_uuid": "b", "blob_uuid": "1", "data": 5}, key="blob_uuid")
+    assert sqlite_store.count() == 3
+    assert sqlite_store.count({"job_uuid": "a"}) == 2
+    assert sqlite_store.query_one({"blob_uuid": "1"})["data"] == 5
+
+    results = sqlite_store.query({"blob_uuid": {"$in": ["0", "2"]}}, sort={"data": 1})
+    assert [r["data"] for r in results] == [0, 2]
+
+    # the indexed criteria are executed in SQL
+    assert sqlite_store._compile_criteria({"blob_uuid": {"$in": ["0"]}})[2] == {}
+
+
+def test_complex_fields(sqlite_store):
+    # fields that cannot be indexed still follow mongo semantics
+    sqlite_store.update(
+        [
+            {"uuid": ["a", "b"], "index": 1, "hosts": "f1"},
+            {"uuid": "a", "index": 2, "name": ["add"]},
+            {"uuid": "c", "index": 3},
+        ],
+        key=["uuid", "index"],
+    )
+    assert sqlite_store.count({"uuid": "a"}) == 2
+    assert sqlite_store.count({"hosts": "f1"}) == 1
+    assert sqlite_store.count({"name": "add"}) == 1
+    results = list(sqlite_store.query(sort={"index": -1}))
+    assert [r["uuid"] for r in results] == ["c", "a", ["a", "b"]]
+    assert sqlite_store.latest_indexes() == {"a": 2, "c": 3}
+
+    sqlite_store.remove_docs({"uuid": "a"})
+    assert sqlite_store.count() == 1
+
+
+def test_persistence(tmp_path):
+    from jobflow.stores import SQLiteStore
+
+    store = SQLiteStore(tmp_path / "jobflow.db")
+    store.connect()
+    store.update({"uuid": "a", "index": 1, "output": 1}, key=["uuid", "index"])
+    store.close()
+
+    store = SQLiteStore(tmp_path / "jobflow.db")
+    store.connect()
+    assert store.query_one({"uuid": "a"})["output"] == 1
+    store.close()
+
+
+def test_threads(tmp_path):
+    import threading
+
+    from jobflow.stores import SQLiteStore
+
+    docs_store = SQLiteStore(tmp_path / "jobflow.db")
+    data_store = SQLiteStore(tmp_path / "jobflow.db", collection_name="data")
+    docs_store.connect()
+    data_store.connect()
+    for i in range(3):
+        docs_store.update({"uuid": str(i), "index": 1}, key=["uuid", "index"])
+
+    # leave a query unfinished in another thread, as happens when outputs are being
+    # prefetched while a job is writing to the store
+    queries = []
+
+    def start_query():
+        queries.append(docs_store.query())
+        next(queries[0])
+
+    thread = threading.Thread(target=start_query)
+    thread.start()
+    thread.join()
+
+    # writing to the store in this thread is not blocked by the query
+    data_store.update({"uuid": "a", "index": 1}, key=["uuid", "index"])
+    docs_store.update({"uuid": "b", "index": 1}, key=["uuid", "index"])
+    assert docs_store.count() == 4
+
+    docs_store.close()
+    data_store.close()
+
+
+def test_jobstore(tmp_path):
+    from jobflow import Flow, JobStore, job, run_locally
+
+    @job
+    def add(a, b):
+        return a + b
+
+    database = tmp_path / "out.db"
+    spec = {
+        "docs_store": {"type": "SQLiteStore", "database": database},
+        "additional_stores": {
+            "data": {
+                "type": "SQLiteStore",
+                "database": database,
+                "collection_name": "data",
+                "key": "blob_uuid",
+            }
+        },
+    }
+    store = JobStore.from_dict_spec(spec)
+
+    add_first = add(1, 2)
+    add_second = add(add_first.output, 3)
+    responses = run_locally(Flow([add_first, add_second]), store=store)
+
+    assert responses[add_second.uuid][1].output == 6
+    with store:
+        assert store.get_output(add_second.uuid) == 6
+        assert store.count({"hosts": add_first.hosts[0]}) == 2
+
+    # outputs saved in the additional store
+    add_data = job(add.original, data=True)(1, 2)
+    run_locally(add_data, store=store)
+    with store:
+        assert store.additional_stores["data"].count({"job_uuid": add_data.uuid}) == 1
+        assert store.get_output(add_data.uuid, load=True) == 3
@@ -98,3 +98,44 @@ def test_settings_object(clean_dir, test_data):
     # assert passing a jobflow object works
     settings = JobflowSettings(JOB_STORE=JobStore.from_dict(monty_spec))
     assert settings.JOB_STORE.docs_store.collection_name == "memory_db_123"
+
+
+def test_settings_lazy():
+    import os
+    import subprocess
+    import sys
+    import textwrap
+
+    import pytest
+
+    import jobflow
+
+    # run in a new interpreter, as jobflow has already been imported by other tests
+    code = textwrap.dedent(
+        """
+        import sys
+
+        import jobflow
+
+        # importing jobflow does not load the settings or the store backends
+        assert "SETTINGS" not in vars(jobflow)
+        assert "maggma.stores" not in sys.modules
+        assert "matplotlib" not in sys.modules
+
+        # creating jobs and flows only reads the settings they need
+        jobflow.Flow([], output=jobflow.Job(str, function_args=(jobflow.Job(str),)))
+        assert "SETTINGS" not in vars(jobflow)
+
+        settings = jobflow.SETTINGS
+        assert vars(jobflow)["SETTINGS"] is settings
+        assert "maggma.stores" in sys.modules
+        assert jobflow.SETTINGS is settings
+        """
+    )
+    env = dict(os.environ, JOBFLOW_CONFIG_FILE="/some/not/existing/path")
+    subprocess.run([sys.executable, "-W", "ignore", "-c", code], env=env, check=True)
+
+    assert jobflow.SETTINGS is jobflow.SETTINGS
+
+    with pytest.raises(AttributeError):
+        _ = jobflow.NOT_A_SETTING
@@ -154,3 +154,61 @@ def test_apply_mod():
     mod = {"_set": {"": ""}}
     with pytest.raises(TypeError):
         apply_mod(mod, d)
+
+
+def test_compile_mod():
+    from jobflow import job
+    from jobflow.utils.dict_mods import CompiledMod, apply_mod, compile_mod
+
+    mods = [
+        {"_set": {"a->b->c": 100, "x": 1}},
+        {"_unset": ["x"]},
+        {"_push": {"a->e->f": 300}},
+        {"_push_all": {"a->e->f": [100, 200]}},
+        {"_inc": {"a->b->c": 2}},
+        {"_add_to_set": {"a->e->f": 400}},
+        {"_pull": {"a->e->f": 300}},
+        {"_pull_all": {"a->e->f": [100]}},
+        {"_pop": {"a->e->f": -1}},
+        {"_rename": {"a": "g"}},
+        {"_pop": {"g->b->c": 1}},
+        {"_set": {"": ""}},
+        {"_set": {"x": 1}, "_abcd": {"a": "b"}},
+    ]
+
+    # compiled mods give the same result as the uncompiled mods
+    expected, result = {}, {}
+    for mod in mods:
+        try:
+            apply_mod(mod, expected)
+        except Exception as err:
+            with pytest.raises(type(err)):
+                apply_mod(compile_mod(mod), result)
+        else:
+            apply_mod(compile_mod(mod), result)
+        assert result == expected
+
+    mod = compile_mod({"_set": {"a->b": 1}, "_inc": {"c": 2}})
+    assert isinstance(mod, CompiledMod)
+    assert compile_mod(mod) is mod
+
+    dicts = [{"c": 1}, {"a": {"b": 0}}]
+    mod.apply_many(dicts)
+    assert dicts == [{"c": 3, "a": {"b": 1}}, {"a": {"b": 1}, "c": 2}]
+
+    # keys in the modified dicts are plain strings
+    assert all(type(k) is str for k in dicts[0]["a"])
+
+    # compiled mods can be passed to the update methods of jobs
+    add_job = job(lambda a, b: a + b)(1, b=2)
+    add_job.update_kwargs(compile_mod({"_inc": {"b": 3}}))
+    assert add_job.function_kwargs == {"b": 5}
+
+    # unsupported actions only raise an error if a job is updated
+    add_job.update_kwargs({"_abcd": {"b": 1}}, name_filter="other", dict_mod=True)
+    with pytest.raises(ValueError):
+        add_job.update_kwargs({"_abcd": {"b": 1}}, dict_mod=True)
+
+    mod = compile_mod({"_abcd": {"a": "b"}})
+    with pytest.raises(ValueError):
+        mod.apply({})
@@ -35,6 +35,51 @@ def test_find_key():
     assert find_key(data, MyObj) == [["c", "d", "x"]]
 
 
+def test_find_keys():
+    from jobflow.utils import find_keys
+
+    data = {"a": [0, {"b": 1, "x": 3}], "c": {"d": {"x": 3, "b": {"x": 2}}}}
+    result = find_keys(data, {"b": "b", "x": "x"})
+    assert result == {"b": [["a", 1], ["c", "d"]], "x": [["a", 1], ["c", "d"]]}
+
+    result = find_keys(data, {"b": "b", "x": "x"}, include_end=True, nested=True)
+    assert result["b"] == [["a", 1, "b"], ["c", "d", "b"]]
+    assert result["x"] == [["a", 1, "x"], ["c", "d", "x"], ["c", "d", "b", "x"]]
+
+
+def test_iter_matches():
+    import sys
+
+    from jobflow.utils import find_key, iter_matches
+
+    data = {"a": {"@class": "Job"}, "b": [{"x": 1}, ({"@class": "Flow", "x": 2},)]}
+    predicates = {
+        "x": lambda d: "x" in d,
+        "flow_or_job": lambda d: d.get("@class") in ("Flow", "Job"),
+    }
+    result = [(name, path) for name, path, _ in iter_matches(data, predicates)]
+    assert result == [
+        ("flow_or_job", ["a"]),
+        ("x", ["b", 0]),
+        ("x", ["b", 1, 0]),
+        ("flow_or_job", ["b", 1, 0]),
+    ]
+
+    # matched objects are returned as is
+    matches = list(iter_matches(data, {"x": predicates["x"]}))
+    assert matches[0][2] is data["b"][0]
+
+    # nothing to traverse
+    assert list(iter_matches(1, predicates)) == []
+
+    # deeper than the recursion limit
+    depth = sys.getrecursionlimit() + 100
+    data = {"x": 0}
+    for _ in range(depth):
+        data = {"a": [data]}
+    assert find_key(data, "x") == [["a", 0] * depth]
+
+
 def test_find_key_value():
     from jobflow.utils import find_key_value
 
@@ -46,12 +91,30 @@ def test_find_key_value():
 
 
 def test_update_in_dictionary():
+    import pytest
+
     from jobflow.utils import update_in_dictionary
 
     data = {"a": [0, {"b": 1, "x": 3}], "c": {"d": {"x": 3}}}
     update_in_dictionary(data, {("a", 1, "x"): 100, ("c", "d", "x"): 100})
     assert data == {"a": [0, {"b": 1, "x": 100}], "c": {"d": {"x": 100}}}
 
+    # updates sharing a route and updates inside updated locations
+    data = {"a": {"b": {"c": 1, "d": 2}}, "e": [0, 1]}
+    updates = {
+        ("a", "b", "c"): 3,
+        ("a", "b", "d"): 4,
+        ("e",): [5, 6],
+        ("e", 0): 7,
+    }
+    update_in_dictionary(data, updates)
+    assert data == {"a": {"b": {"c": 3, "d": 4}}, "e": [7, 6]}
+
+    # the whole dictionary cannot be replaced
+    with pytest.raises(IndexError):
+        update_in_dictionary(data, {(): 1, ("e",): 2})
+    assert data == {"a": {"b": {"c": 3, "d": 4}}, "e": [7, 6]}
+
 
 def test_contains_job_or_flow():
     from jobflow import Flow, Job
@@ -74,3 +137,36 @@ def test_contains_job_or_flow():
     assert contains_flow_or_job([[job]]) is True
     assert contains_flow_or_job({"a": job}) is True
     assert contains_flow_or_job({"a": [job]}) is True
+
+    # objects are searched without being serialized
+    from dataclasses import dataclass
+
+    from monty.json import MSONable
+
+    class MyObj(MSONable):
+        def __init__(self, a):
+            self.a = a
+
+    @dataclass
+    class MyData:
+        a: object
+
+    assert contains_flow_or_job(MyObj([job])) is True
+    assert contains_flow_or_job(MyData({"b": flow})) is True
+    assert contains_flow_or_job(MyObj(MyData(1))) is False
+    assert contains_flow_or_job({job.output, 1}) is False
+    assert contains_flow_or_job(MyData) is False
+
+    # self-referencing objects
+    data = {"a": [1, 2]}
+    data["b"] = data
+    assert contains_flow_or_job(data) is False
+
+
+def test_get_root_locations():
+    from jobflow.utils.find import get_root_locations
+
+    locations = [["a", "b"], ["a"], ["c", "d"], ["c", "d", 0], ["a"], ["c", "e"]]
+    assert get_root_locations(locations) == [["a"], ["c", "d"], ["c", "e"]]
+    assert get_root_locations([[], *locations]) == [[]]
+    assert get_root_locations([]) == []
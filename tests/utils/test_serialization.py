@@ -0,0 +1,67 @@
+def test_fast_serializer():
+    from datetime import datetime
+    from enum import Enum
+    from pathlib import Path
+
+    from monty.json import MSONable, jsanitize
+
+    from jobflow import Flow, Job, OutputReference
+    from jobflow.utils import FastSerializer, MontySerializer, ValueEnum
+
+    class MyEnum(ValueEnum):
+        A = "a"
+
+    class OtherEnum(Enum):
+        B = 1
+
+    class MyObj(MSONable):
+        def __init__(self, a, b):
+            self.a = a
+            self.b = b
+
+    job = Job(str, function_args=(1,))
+    obj = {
+        "a": [1, 2.0, "x", None, True, (1, 2)],
+        1: {"b": job.output["x"], "c": Path("/x"), "d": datetime(2020, 1, 1)},
+        "e": MyEnum.A,
+        "f": [OtherEnum.B, MyObj(MyObj(1, [2]), {"c": MyEnum.A})],
+        "g": Flow([job]),
+        "h": b"xx",
+        "n": float("inf"),
+    }
+
+    fast, monty = FastSerializer(), MontySerializer()
+    expected = jsanitize(obj, strict=True, enum_values=True, allow_bson=True)
+    assert fast.sanitize(obj) == monty.sanitize(obj) == expected
+
+    obj.pop("f")
+    expected = jsanitize(obj, strict=True, allow_bson=True)
+    assert fast.sanitize(obj, enum_values=False) == expected
+
+    # sequences of scalars are copied
+    data = [1, 2, 3]
+    assert fast.sanitize(data) is not data
+
+    decoded = fast.decode(expected)
+    assert decoded.keys() == monty.decode(expected).keys()
+    assert isinstance(decoded["1"]["b"], OutputReference)
+    assert decoded["1"]["b"] == job.output["x"]
+    assert isinstance(decoded["g"], Flow)
+    assert decoded["a"] == [1, 2.0, "x", None, True, [1, 2]]
+    assert decoded["a"] is not expected["a"]
+
+    # serializers can be serialized
+    assert isinstance(FastSerializer.from_dict(fast.as_dict()), FastSerializer)
+
+
+def test_fast_serializer_numpy():
+    import pytest
+    from monty.json import jsanitize
+
+    np = pytest.importorskip("numpy")
+
+    from jobflow.utils import FastSerializer
+
+    obj = {"a": np.arange(4).reshape(2, 2), "b": np.float64(1.5), "c": [np.int64(2)]}
+    expected = jsanitize(obj, strict=True, enum_values=True, allow_bson=True)
+    assert FastSerializer().sanitize(obj) == expected